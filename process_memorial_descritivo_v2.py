@@ -15,6 +15,7 @@ import sys
 import json
 import shutil
 import math
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List
 
@@ -22,6 +23,7 @@ from typing import Optional, Dict, List
 try:
     import google.generativeai as genai
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, Alignment, Border, Side
     from docx import Document
     from docx.shared import Pt, Cm
@@ -34,6 +36,14 @@ except ImportError as e:
     print("pip install google-generativeai openpyxl python-docx pillow pdf2image --break-system-packages")
     sys.exit(1)
 
+# Parser JSON opcional mais rápido (orjson); sem ele, usa o json da biblioteca
+# padrão. Os erros do orjson herdam de json.JSONDecodeError
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 # ============================================================================
 # CONFIGURAÇÕES GLOBAIS
@@ -54,6 +64,10 @@ INCRA_CONFIG = {
     'colunas_segmento': ['Código', 'Azimute', 'Dist.', 'Confrontações']
 }
 
+# Configuração de geração das extrações: a resposta do Gemini vem como JSON
+# puro (sem texto ou blocos markdown em volta)
+GEMINI_CONFIG_JSON = {'response_mime_type': 'application/json'}
+
 
 # ============================================================================
 # FUNÇÕES AUXILIARES
@@ -362,8 +376,7 @@ def extrair_memorial_incra(pdf_path: Path, api_key: str) -> Dict:
     print(f"\n📊 Extraindo Memorial Descritivo do INCRA...")
     
     # Configura API
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemini-2.5-flash-lite')
+    model = obter_modelo_gemini(api_key)
     
     # Carrega PDF
     with open(pdf_path, 'rb') as f:
@@ -420,7 +433,7 @@ IMPORTANTE:
     response = model.generate_content([
         prompt,
         {"mime_type": "application/pdf", "data": pdf_data}
-    ])
+    ], generation_config=GEMINI_CONFIG_JSON)
     
     print("✅ Resposta recebida")
     
@@ -445,7 +458,7 @@ IMPORTANTE:
     
     # Parse JSON
     try:
-        table_data = json.loads(response_text)
+        table_data = json_loads(response_text)
         num_linhas = len(table_data.get('data', []))
         print(f"✅ Tabela extraída: {num_linhas} linhas de dados")
         return table_data
@@ -464,12 +477,30 @@ def configure_gemini_api(api_key):
     genai.configure(api_key=api_key)
 
 
+@lru_cache(maxsize=1)
+def obter_modelo_gemini(api_key):
+    """
+    Retorna o modelo do Gemini configurado para a API key informada
+    
+    O modelo é criado uma única vez e reaproveitado pelas extrações
+    seguintes (inclusive as que rodam em paralelo), mantendo o cliente HTTP.
+    Uma API key diferente configura a API de novo e cria outro modelo.
+    
+    Args:
+        api_key: Chave da API do Gemini
+    
+    Returns:
+        Instância de genai.GenerativeModel
+    """
+    configure_gemini_api(api_key)
+    return genai.GenerativeModel('gemini-2.5-flash-lite')
+
+
 def extract_table_from_pdf(pdf_path, api_key):
     """Extrai dados da tabela do PDF usando Google Gemini API (modo normal)"""
     print(f"📄 Processando PDF: {pdf_path}")
     
-    configure_gemini_api(api_key)
-    model = genai.GenerativeModel('gemini-2.5-flash-lite')
+    model = obter_modelo_gemini(api_key)
     
     with open(pdf_path, 'rb') as f:
         pdf_data = f.read()
@@ -499,7 +530,8 @@ IMPORTANTE:
 """
     
     print("🤖 Enviando para Gemini API...")
-    response = model.generate_content([prompt, {"mime_type": "application/pdf", "data": pdf_data}])
+    response = model.generate_content([prompt, {"mime_type": "application/pdf", "data": pdf_data}],
+                                      generation_config=GEMINI_CONFIG_JSON)
     
     print("✅ Resposta recebida da API")
     
@@ -515,7 +547,7 @@ IMPORTANTE:
     response_text = response_text.strip()
     
     try:
-        table_data = json.loads(response_text)
+        table_data = json_loads(response_text)
         print(f"📊 Tabela extraída: {len(table_data.get('data', []))} linhas de dados")
         return table_data
     except json.JSONDecodeError as e:
@@ -528,9 +560,10 @@ def create_excel_file(table_data, output_path):
     """Cria arquivo Excel com a tabela formatada"""
     print(f"\n📊 Criando arquivo Excel: {output_path}")
     
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Memorial Descritivo"
+    # Modo write-only: as linhas vão direto para o arquivo, sem montar a
+    # planilha inteira em memória (larguras devem ser definidas antes das linhas)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Memorial Descritivo")
     
     header_font = Font(bold=True, size=11)
     center_alignment = Alignment(horizontal='center', vertical='center')
@@ -541,39 +574,15 @@ def create_excel_file(table_data, output_path):
         bottom=Side(style='thin')
     )
     
-    # Linha 1: Cabeçalhos mesclados
-    ws.merge_cells('A1:D1')
-    cell_a1 = ws['A1']
-    cell_a1.value = "VÉRTICE"
-    cell_a1.font = header_font
-    cell_a1.alignment = center_alignment
-    cell_a1.border = border_style
-    
-    ws.merge_cells('E1:H1')
-    cell_e1 = ws['E1']
-    cell_e1.value = "SEGMENTO VANTE"
-    cell_e1.font = header_font
-    cell_e1.alignment = center_alignment
-    cell_e1.border = border_style
-    
-    # Linha 2: Sub-cabeçalhos
-    header_row2 = table_data.get('header_row2', [])
-    for col_idx, header in enumerate(header_row2, start=1):
-        cell = ws.cell(row=2, column=col_idx)
-        cell.value = header
-        cell.font = header_font
-        cell.alignment = center_alignment
-        cell.border = border_style
-    
-    # Linhas 3+: Dados
-    data_rows = table_data.get('data', [])
-    for row_idx, row_data in enumerate(data_rows, start=3):
-        for col_idx, value in enumerate(row_data, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx)
-            cell.value = value
-            cell.border = border_style
-            if col_idx in [1, 5]:
-                cell.alignment = Alignment(horizontal='center', vertical='center')
+    def celula(value, font=None, alignment=None, border=None):
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        return cell
     
     # Ajusta larguras
     column_widths = {
@@ -584,6 +593,30 @@ def create_excel_file(table_data, output_path):
     for col_letter, width in column_widths.items():
         ws.column_dimensions[col_letter].width = width
     
+    # Linha 1: Cabeçalhos mesclados
+    ws.append([
+        celula("VÉRTICE", header_font, center_alignment, border_style), None, None, None,
+        celula("SEGMENTO VANTE", header_font, center_alignment, border_style), None, None, None
+    ])
+    ws.merged_cells.add('A1:D1')
+    ws.merged_cells.add('E1:H1')
+    
+    # Linha 2: Sub-cabeçalhos
+    header_row2 = table_data.get('header_row2', [])
+    ws.append([
+        celula(header, header_font, center_alignment, border_style)
+        for header in header_row2
+    ])
+    
+    # Linhas 3+: Dados
+    data_rows = table_data.get('data', [])
+    for row_data in data_rows:
+        ws.append([
+            celula(value, alignment=center_alignment if col_idx in (1, 5) else None,
+                   border=border_style)
+            for col_idx, value in enumerate(row_data, start=1)
+        ])
+    
     wb.save(output_path)
     print(f"✅ Excel criado com sucesso!")
     return output_path
@@ -7,6 +7,7 @@ Autor: Sistema Automatizado
 Versão: 1.0
 """
 
+import io
 import os
 import sys
 import tkinter as tk
@@ -14,7 +15,10 @@ from tkinter import filedialog, messagebox, scrolledtext
 from tkinter import ttk
 from pathlib import Path
 import threading
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 try:
     from pdf2image import convert_from_path
@@ -28,6 +32,1196 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Threads do Poppler por conversão de PDF: metade dos núcleos, já que INCRA
+# e Projeto são convertidos ao mesmo tempo na análise com o Gemini
+POPPLER_THREADS = max(1, (os.cpu_count() or 2) // 2)
+
+# Níveis de zoom da comparação manual: escala geométrica de 10% em 10%
+# (de ~22% a ~505%). Os controles andam por índices desta tupla, então o
+# mesmo nível sempre gera exatamente o mesmo valor de zoom.
+ESCALA_ZOOM = tuple(1.1 ** i for i in range(-16, 18))
+PASSO_ZOOM_100 = ESCALA_ZOOM.index(1.0)
+
+# Rotação no sentido horário (graus) -> transposição equivalente do PIL.
+# Para múltiplos de 90° a transposição só reordena pixels, sem reamostrar.
+TRANSPOSICAO_ROTACAO = {
+    90: Image.Transpose.ROTATE_270,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_90,
+}
+
+
+# Instruções de extração enviadas antes das imagens do INCRA
+PROMPT_INSTRUCOES_INCRA = "".join((
+    "Você é um assistente ESPECIALISTA em análise de documentos de georreferenciamento de imóveis rurais para cartórios no Brasil.",
+    "\n═══════════════════════════════════════════════════════════",
+    "\n=== INSTRUÇÕES CRÍTICAS DE EXTRAÇÃO ===",
+    "\n═══════════════════════════════════════════════════════════",
+    "\n",
+    "\n⚠️⚠️⚠️ ATENÇÃO MÁXIMA - ERROS COMUNS A EVITAR ⚠️⚠️⚠️",
+    "\n",
+    "\n❌ NÃO CONFUNDA:",
+    "\n1. CPF (formato XXX.XXX.XXX-XX) ≠ Código INCRA (formato XXX.XXX.XXX.XXX-X)",
+    "\n   • CPF: 765.656.618-04 (pessoa física)",
+    "\n   • Código INCRA: 951.742.953-1 (imóvel rural)",
+    "\n   • São COMPLETAMENTE diferentes!",
+    "\n",
+    "\n2. Nomes de proprietários DIFERENTES = STATUS ❌ (não ⚠️!)",
+    "\n   • 'PAULO EDUARDO HOTZ' ≠ 'Paulo Gemma Henge'",
+    "\n   • São PESSOAS DIFERENTES! Marque como ❌ ERRO GRAVE!",
+    "\n   • Não diga 'pequena divergência' - é ERRO TOTAL!",
+    "\n",
+    "\n3. Memorial em texto corrido TEM perímetro - PROCURE NO TEXTO!",
+    "\n   • Busque por: 'perímetro de X metros' ou 'perímetro de X m'",
+    "\n   • Exemplo: 'Perímetro (m): 3.873,67 m' ou 'perímetro de 3.873,67 metros'",
+    "\n   • Se encontrar, extraia! Não diga 'Não encontrado'!",
+    "\n",
+    "\n4. Projeto/Planta tem TABELAS - LEIA A TABELA COMPLETA!",
+    "\n   • Projetos em PDF digital têm tabelas de coordenadas",
+    "\n   • Procure por colunas: Código, Longitude, Latitude, Altitude",
+    "\n   • Ou: Código, E (Este), N (Norte)",
+    "\n   • EXTRAIA TODOS OS VÉRTICES DA TABELA!",
+    "\n   • Não invente coordenadas - copie da tabela!",
+    "\n",
+    "\n**FORMATO DOS DOCUMENTOS:**",
+    "\n1. 📋 INCRA: Dados em TABELAS - extraia TODAS as células com precisão",
+    "\n2. 🗺️ PROJETO/PLANTA: ",
+    "\n   • Se for PDF DIGITAL (texto selecionável): TEM TABELAS! Leia-as!",
+    "\n   • Se for ESCANEADO (imagem): Extraia visualmente",
+    "\n   • Procure por 'Tabela de Coordenadas' ou grade com vértices",
+    "\n   • NO PROJETO que você está analisando agora: HÁ UMA TABELA NO CANTO!",
+    "\n",
+    "\n**⚠️ ATENÇÃO MÁXIMA AO LER PROJETO/PLANTA:**",
+    "\n",
+    "\n🎯 O PROJETO TEM UMA TABELA! Exemplo:",
+    "\n```",
+    "\nCódigo      | Longitude        | Latitude         | Altitude",
+    "\nAKE-V-0166  | 48°34'14,782\" W | 20°50'45,291\" S | 532,78",
+    "\nAKE-M-1028  | 48°34'13,821\" W | 20°50'46,394\" S | 533,92",
+    "\n```",
+    "\n",
+    "\nOU formato UTM:",
+    "\n```",
+    "\nCódigo      | E (Este)  | N (Norte)",
+    "\nAKE-V-0166  | 741319    | 7696237",
+    "\n```",
+    "\n",
+    "\nVocê DEVE:",
+    "\n✅ Procurar pela tabela (geralmente no canto ou no topo)",
+    "\n✅ Ler TODAS as linhas da tabela",
+    "\n✅ Extrair TODOS os vértices listados",
+    "\n✅ Copiar coordenadas EXATAMENTE como na tabela",
+    "\n✅ Se houver 26 vértices na tabela, liste os 26!",
+    "\n✅ NÃO invente coordenadas - só o que está na tabela",
+    "\n",
+    "\n**EQUIVALÊNCIAS SEMÂNTICAS (MUITO IMPORTANTE!):**",
+    "\n- '19,0211 ha' = 'Área: 19.0211 hectares' = 'ÁREA TOTAL (ha): 19,0211'",
+    "\n- 'José da Silva' = 'Sr. José da Silva' = 'JOSÉ DA SILVA' = 'Jose da Silva'",
+    "\n- Vírgula e ponto decimal são equivalentes: 19,02 = 19.02",
+    "\n- Espaços e formatação diferentes não importam",
+    "\n",
+    "\n**⚠️ MAS ATENÇÃO - QUANDO NÃO É EQUIVALENTE:**",
+    "\n- 'PAULO EDUARDO HOTZ' ≠ 'Paulo Gemma Henge' → São PESSOAS DIFERENTES! Status = ❌",
+    "\n- '951.742.953-1' ≠ '765.656.618-04' → Um é Código INCRA, outro é CPF! Status = ❌",
+    "\n- '3.873,67 m' ≠ 'Não encontrado' → Um tem valor, outro não! Status = ❌",
+    "\n- 'Latitude/Longitude' ≠ 'UTM' → Sistemas DIFERENTES! Status = ⚠️",
+    "\n",
+    "\n**⚠️ ATENÇÃO ESPECIAL - INFORMAÇÕES PARCIAIS:**",
+    "\n- Se um documento tem TEXTO PARCIAL de outro, isso NÃO é igual!",
+    "\n- Quando encontrar casos assim, marque como <span class='status-alerta'>⚠️</span>",
+    "\n- E adicione observação: 'VERIFICAR: Um documento tem informação mais completa'",
+    "\n- O usuário DEVE verificar manualmente se a informação adicional é relevante",
+    "\n",
+    "\n**DADOS QUE VOCÊ DEVE EXTRAIR DE CADA DOCUMENTO:**",
+    "\n",
+    "\n✅ **DADOS BÁSICOS:**",
+    "\n   • Proprietário(s) - nome completo EXATO",
+    "\n   • Nome do Imóvel/Propriedade",
+    "\n   • Matrícula(s) do cartório",
+    "\n   • Município e Estado (UF)",
+    "\n   • Código INCRA (código de certificação) - NÃO CONFUNDA COM CPF!",
+    "\n   • CCIR (se houver)",
+    "\n   • Cartório/CNS",
+    "\n",
+    "\n✅ **DADOS TÉCNICOS:**",
+    "\n   • Área Total em hectares (todas as casas decimais)",
+    "\n   • Perímetro em metros",
+    "\n   • Sistema de coordenadas (UTM/Geográfico/SIRGAS)",
+    "\n   • Datum (SIRGAS2000, SAD69, etc)",
+    "\n",
+    "\n✅ **VÉRTICES E COORDENADAS - ⚠️ MÁXIMA ATENÇÃO:**",
+    "\n   • TODOS os vértices (V1, V2, V3, V4, V5, V6...)",
+    "\n   • Códigos COMPLETOS dos vértices (ex: NCXC-P-1032, YGGA-M-0046, AKE-V-0166)",
+    "\n   • ⚠️ COPIE O CÓDIGO EXATAMENTE LETRA POR LETRA!",
+    "\n   • Coordenadas COMPLETAS de cada vértice:",
+    "\n     - Longitude (ex: -48°40'19,003\") OU E=741319 (UTM)",
+    "\n     - Latitude (ex: -21°00'03,754\") OU N=7696237 (UTM)",
+    "\n     - Altitude se houver (ex: 509,05 m)",
+    "\n   • CRÍTICO: Não omita vértices! Liste TODOS que encontrar!",
+    "\n   • No Projeto, os vértices estão em TABELAS:",
+    "\n     Procure por tabela com colunas: Código | Longitude | Latitude | Altitude",
+    "\n     Ou: Código | E | N",
+    "\n",
+    "\n✅ **CONFRONTANTES/LIMITES:**",
+    "\n   • Norte: [quem/o quê]",
+    "\n   • Sul: [quem/o quê]",
+    "\n   • Leste: [quem/o quê]",
+    "\n   • Oeste: [quem/o quê]",
+    "\n",
+    "\n--- INÍCIO DOCUMENTO INCRA ---",
+    "\n",
+    "\n🚨🚨🚨 ALERTA CRÍTICO - CÓDIGOS DOS VÉRTICES 🚨🚨🚨",
+    "\n",
+    "\n⚠️⚠️⚠️ PROBLEMA COMUM DE OCR:",
+    "\nO OCR frequentemente CONFUNDE a letra 'K' com 'M'!",
+    "\n",
+    "\n❌ ERRO GRAVÍSSIMO:",
+    "\n   AME-V-0166  ← ERRADO! (K virou M)",
+    "\n   AME-M-1028  ← ERRADO! (K virou M)",
+    "\n   AME-P-3567  ← ERRADO! (K virou M)",
+    "\n",
+    "\n✅ CÓDIGOS CORRETOS:",
+    "\n   AKE-V-0166  ← CORRETO! (com K)",
+    "\n   AKE-M-1028  ← CORRETO! (com K)",
+    "\n   AKE-P-3567  ← CORRETO! (com K)",
+    "\n",
+    "\n🔍 COMO IDENTIFICAR:",
+    "\nOlhe com ATENÇÃO EXTREMA para as primeiras 3 letras do código:",
+    "\n• Se parece 'AME' → É ERRO! Deve ser 'AKE'",
+    "\n• Se parece 'AXE' → É ERRO! Deve ser 'AKE'",
+    "\n• Se parece 'AKF' → É ERRO! Deve ser 'AKE'",
+    "\n",
+    "\n💡 DICA:",
+    "\nNeste documento, o código de credenciamento é 'AKE'.",
+    "\nPORTANTO, TODOS os vértices começam com 'AKE-'!",
+    "\n",
+    "\n⚠️ NUNCA NUNCA NUNCA escreva 'AME'!",
+    "\n⚠️ SEMPRE escreva 'AKE' com a letra K!",
+    "\n",
+    "\n🎯 EXTRAÇÃO ESPECÍFICA DO INCRA - INSTRUÇÕES CIRÚRGICAS",
+    "\n",
+    "\n════════════════════════════════════════════════════════════",
+    "\n                PARTE 1: DADOS CADASTRAIS                   ",
+    "\n════════════════════════════════════════════════════════════",
+    "\n",
+    "\nExtraia APENAS as seguintes informações, NESTA ORDEM:",
+    "\n",
+    "\n1️⃣ **Denominação:**",
+    "\n   • PROCURE: Linha que começa com 'Denominação:'",
+    "\n   • EXTRAIA: SOMENTE o nome do imóvel",
+    "\n   • REMOVA: Qualquer menção a 'Área X', 'Matrícula', números",
+    "\n   • EXEMPLO:",
+    "\n     ❌ Errado: 'Fazenda Monte Rosa - Área 2 – Matrícula n° 27.935'",
+    "\n     ✅ Correto: 'Fazenda Monte Rosa'",
+    "\n",
+    "\n2️⃣ **Proprietário(a):**",
+    "\n   • PROCURE: Linha que começa com 'Proprietário(a):'",
+    "\n   • EXTRAIA: Nome completo do proprietário",
+    "\n   • EXEMPLO: 'RENÊ EDUARDO HOTZ'",
+    "\n",
+    "\n3️⃣ **Matrícula do imóvel:**",
+    "\n   • PROCURE: Linha 'Matrícula do imóvel:'",
+    "\n   • ATENÇÃO: Pode ter continuação na página 3!",
+    "\n   • EXTRAIA: TODOS os números de matrícula",
+    "\n   • EXEMPLO: '28625, 28626, 27935, 27936, 11798'",
+    "\n   • LEMBRE: Procurar também: 'continuação da página 1: ...'",
+    "\n",
+    "\n4️⃣ **Município/UF:**",
+    "\n   • PROCURE: 'Município/UF:'",
+    "\n   • EXTRAIA: Nome do município e UF",
+    "\n   • EXEMPLO: 'Bebedouro-SP'",
+    "\n",
+    "\n5️⃣ **Código de credenciamento:**",
+    "\n   • PROCURE: 'Código de credenciamento:'",
+    "\n   • EXTRAIA: O código (geralmente 3 letras)",
+    "\n   • EXEMPLO: 'AKE'",
+    "\n",
+    "\n6️⃣ **Código INCRA/SNCR:**",
+    "\n   • PROCURE: 'Código INCRA/SNCR:'",
+    "\n   • EXTRAIA: Código completo",
+    "\n   • EXEMPLO: '6120730013504'",
+    "\n   • ⚠️ NÃO confunda com CPF!",
+    "\n",
+    "\n7️⃣ **Área (Sistema Geodésico Local):**",
+    "\n   • PROCURE: 'Área (Sistema Geodésico Local):'",
+    "\n   • EXTRAIA: Valor e unidade",
+    "\n   • EXEMPLO: '68,7187 ha'",
+    "\n",
+    "\n8️⃣ **Perímetro (m):**",
+    "\n   • PROCURE: 'Perímetro (m):'",
+    "\n   • EXTRAIA: Valor em metros",
+    "\n   • EXEMPLO: '3.873,67 m'",
+    "\n",
+    "\n════════════════════════════════════════════════════════════",
+    "\n              PARTE 2: TABELA DE COORDENADAS                ",
+    "\n════════════════════════════════════════════════════════════",
+    "\n",
+    "\n📊 LOCALIZAÇÃO DA TABELA:",
+    "\n   • Título: 'DESCRIÇÃO DA PARCELA'",
+    "\n   • Tem 2 seções lado a lado:",
+    "\n     - VÉRTICE (esquerda): Código, Longitude, Latitude, Altitude",
+    "\n     - SEGMENTO VANTE (direita): Código, Azimute, Dist.(m), Confrontações",
+    "\n",
+    "\n⚠️ INSTRUÇÕES CRÍTICAS PARA LER A TABELA:",
+    "\n",
+    "\n🚨🚨🚨 REGRA ABSOLUTA - EXTRAÇÃO COMPLETA 🚨🚨🚨",
+    "\n",
+    "\n⛔ ZERO TOLERÂNCIA PARA LINHAS FALTANDO:",
+    "\n• Você DEVE extrair 100% das linhas da tabela",
+    "\n• NÃO pule NENHUMA linha",
+    "\n• NÃO omita NENHUM vértice ou segmento",
+    "\n• MANTENHA a ordem EXATA do documento original",
+    "\n• LEIA linha por linha, da primeira até a ÚLTIMA",
+    "\n• Se a tabela tem 26 linhas, seu relatório DEVE ter 26 linhas",
+    "\n• Se a tabela tem 30 linhas, seu relatório DEVE ter 30 linhas",
+    "\n",
+    "\n📊 MÉTODO DE EXTRAÇÃO LINHA POR LINHA:",
+    "\n1. Comece na primeira linha de dados (após o cabeçalho)",
+    "\n2. Leia e extraia: linha 1, linha 2, linha 3, linha 4...",
+    "\n3. Continue SEM PULAR até a última linha",
+    "\n4. CONTE quantas linhas você extraiu",
+    "\n5. VERIFIQUE: O número de linhas extraídas = número de linhas na tabela?",
+    "\n6. Se NÃO, VOLTE e extraia as linhas que faltam!",
+    "\n",
+    "\n✅ VERIFICAÇÃO OBRIGATÓRIA:",
+    "\nApós a extração, PERGUNTE A SI MESMO:",
+    "\n• Quantas linhas de vértices tem na tabela? _____",
+    "\n• Quantas linhas de vértices eu extraí? _____",
+    "\n• Os números são IGUAIS? Se NÃO, falta algo!",
+    "\n",
+    "\n════════════════════════════════════════════════════════════",
+    "\n      🎯 ESTRATÉGIA DE EXTRAÇÃO EM DUAS ETAPAS 🎯",
+    "\n════════════════════════════════════════════════════════════",
+    "\n",
+    "\n🚨🚨🚨 IMPORTANTE: O INCRA É A FONTE DE VERDADE! 🚨🚨🚨",
+    "\n",
+    "\n📋 ETAPA 1 - EXTRAIR CÓDIGOS DO INCRA PRIMEIRO:",
+    "\n",
+    "\n1️⃣ ANTES de fazer qualquer comparação, LEIA APENAS a coluna 'Código' do INCRA",
+    "\n2️⃣ Extraia TODOS os códigos da tabela do INCRA em uma lista",
+    "\n3️⃣ Esta lista será sua FONTE DE VERDADE",
+    "\n",
+    "\n💡 POR QUÊ?",
+    "\n• O documento INCRA tem os códigos mais legíveis",
+    "\n• Os códigos do PROJETO são os MESMOS do INCRA",
+    "\n• Os códigos do SEGMENTO VANTE também são os MESMOS",
+    "\n",
+    "\n✅ EXEMPLO DE LISTA DE CÓDIGOS:",
+    "\nVÉRTICES:",
+    "\n  AKE-V-0166  ← Primeiro vértice",
+    "\n  AKE-M-1028",
+    "\n  AKE-M-1029",
+    "\n  AKE-M-1087  ← ⚠️ É 1087, NÃO 1098 ou 1069!",
+    "\n  AKE-M-1088  ← ⚠️ É 1088, NÃO 1099 ou 1089!",
+    "\n  AKE-P-3567",
+    "\n  AKE-P-3568",
+    "\n  AKE-P-3569",
+    "\n  ...",
+    "\n  AKE-P-3584",
+    "\n  AKE-P-3585",
+    "\n  AKE-P-3586  ← Último vértice (número mais alto)",
+    "\n",
+    "\n🚨🚨🚨 REGRA IMPORTANTE - SEQUÊNCIA DE CÓDIGOS 🚨🚨🚨",
+    "\n",
+    "\n⚠️ CÓDIGOS SEGUEM ORDEM CRESCENTE:",
+    "\n• Se começa com 1028, continua: 1029, 1030, 1087, 1088...",
+    "\n• Se está em 3567, continua: 3568, 3569, 3570... 3584, 3585, 3586",
+    "\n• Números SEMPRE CRESCEM, NUNCA VOLTAM!",
+    "\n• Se chegou em AKE-P-3586, o próximo NÃO pode ser AKE-V-0166",
+    "\n",
+    "\n⚠️ O PRIMEIRO VÉRTICE NÃO É O ÚLTIMO:",
+    "\n• Primeiro vértice: AKE-V-0166 (número baixo: 0166)",
+    "\n• Último vértice: AKE-P-3586 (número alto: 3586)",
+    "\n• ❌ ERRADO: ...AKE-P-3585, AKE-P-3586, AKE-V-0166 (0166 < 3586!)",
+    "\n• ✅ CORRETO: ...AKE-P-3585, AKE-P-3586 (para aqui!)",
+    "\n",
+    "\n💡 NOTA SOBRE FECHAMENTO DE POLÍGONO:",
+    "\n• Algumas tabelas mostram o primeiro vértice novamente no FINAL",
+    "\n• Isso é apenas para indicar que o polígono fecha",
+    "\n• Mas na LISTA DE CÓDIGOS, NÃO repita o primeiro!",
+    "\n• Exemplo: Se tem 26 vértices, liste 26 códigos únicos",
+    "\n",
+    "\nSEGMENTO VANTE:",
+    "\n  (mesmos códigos, na segunda parte da tabela INCRA)",
+    "\n",
+    "\n📋 ETAPA 2 - USAR CÓDIGOS DE REFERÊNCIA NO PROJETO:",
+    "\n",
+    "\n1️⃣ Quando for ler a tabela do PROJETO",
+    "\n2️⃣ Use a LISTA DE CÓDIGOS do INCRA como referência",
+    "\n3️⃣ Procure no PROJETO as coordenadas correspondentes a cada código",
+    "\n4️⃣ Os códigos são IDÊNTICOS nos dois documentos",
+    "\n",
+    "\n🔴 NÃO FAÇA OCR dos códigos do Projeto se não tiver certeza!",
+    "\n🟢 USE os códigos do INCRA como referência!",
+    "\n",
+    "\n════════════════════════════════════════════════════════════",
+    "\n",
+    "\n1. LOCALIZE a tabela 'DESCRIÇÃO DA PARCELA'",
+    "\n",
+    "\n2. A tabela tem este formato:",
+    "\n┌─────────────┬────────────────┬────────────────┬─────────────┐",
+    "\n│ VÉRTICE                                                      │",
+    "\n├─────────────┼────────────────┼────────────────┼─────────────┤",
+    "\n│ Código      │ Longitude      │ Latitude       │ Altitude(m) │",
+    "\n├─────────────┼────────────────┼────────────────┼─────────────┤",
+    "\n│ AKE-V-0166  │ -48°34'14,782\" │ -20°50'45,291\" │ 532,78      │",
+    "\n└─────────────┴────────────────┴────────────────┴─────────────┘",
+    "\n",
+    "\n┌─────────────┬─────────┬──────────┬─────────────────────────┐",
+    "\n│ SEGMENTO VANTE                                              │",
+    "\n├─────────────┼─────────┼──────────┼─────────────────────────┤",
+    "\n│ Código      │ Azimute │ Dist.(m) │ Confrontações           │",
+    "\n├─────────────┼─────────┼──────────┼─────────────────────────┤",
+    "\n│ AKE-M-1028  │ 140°40' │ 43,85    │ CNS: 12.102-0 | Mat...  │",
+    "\n└─────────────┴─────────┴──────────┴─────────────────────────┘",
+    "\n",
+    "\n3. COPIE os códigos dos vértices EXATAMENTE - CARACTERE POR CARACTERE:",
+    "\n   🚨🚨🚨 EXTREMAMENTE IMPORTANTE: NÃO INVENTE CÓDIGOS! 🚨🚨🚨",
+    "\n   • Copie o que ESTÁ ESCRITO, não o que você ACHA que deveria estar!",
+    "\n   • Exemplo: AKE-V-0166, AKE-M-1028, AKE-P-3567",
+    "\n   • ⚠️ NÃO troque letras: AKE ≠ AME ≠ AXE ≠ AKF",
+    "\n   • ⚠️ NÃO troque números: 1028 ≠ 1008 ≠ 1128 ≠ 1030",
+    "\n   • ⚠️ Se está 1087, copie 1087 (NÃO mude para 1030!)",
+    "\n   • ⚠️ Se está 1088, copie 1088 (NÃO omita!)",
+    "\n   • ⚠️ Mantenha hífens: AKE-P-3567 (não AKE P 3567)",
+    "\n   • ⚠️⚠️⚠️ UNDERSCORES são DIFERENTES de HÍFENS:",
+    "\n       - Se está AKE_P-3568 (com underscore _), copie AKE_P-3568",
+    "\n       - Se está AKE-P-3568 (com hífen -), copie AKE-P-3568",
+    "\n       - AKE_P ≠ AKE-P (são DIFERENTES!)",
+    "\n   • OLHE COM ATENÇÃO: é hífen (-) ou underscore (_)?",
+    "\n",
+    "\n4. COPIE as coordenadas COM PRECISÃO EXTREMA:",
+    "\n   ",
+    "\n   🎯 MÉTODO DE EXTRAÇÃO - LEIA DEVAGAR, CARACTERE POR CARACTERE:",
+    "\n   ",
+    "\n   📍 LONGITUDE (coluna 2):",
+    "\n   • Formato: -48°34'14,782\"",
+    "\n   • Leia: sinal (-), graus (48), símbolo (°), minutos (34), apóstrofo ('), segundos (14,782), aspas (\")",
+    "\n   • ⚠️ CUIDADO: Os segundos têm VÍRGULA e 3 casas decimais: 14,782",
+    "\n   • ⚠️ NÃO confunda: 14,782 ≠ 14,78 ≠ 14,7",
+    "\n   • ⚠️ NÃO confunda: 34 ≠ 35 ≠ 33",
+    "\n   ",
+    "\n   📍 LATITUDE (coluna 3):",
+    "\n   • Formato: -20°50'45,291\"",
+    "\n   • Leia: sinal (-), graus (20), símbolo (°), minutos (50), apóstrofo ('), segundos (45,291), aspas (\")",
+    "\n   • ⚠️ CUIDADO: Os segundos têm VÍRGULA e 3 casas decimais: 45,291",
+    "\n   • ⚠️ NÃO confunda: 45,291 ≠ 45,29 ≠ 45,2",
+    "\n   • ⚠️ NÃO confunda: 50 ≠ 51 ≠ 49",
+    "\n   ",
+    "\n   📍 ALTITUDE (coluna 4):",
+    "\n   • Formato: 532,78",
+    "\n   • Número com vírgula e 2 casas decimais",
+    "\n   • ⚠️ CUIDADO: 532,78 ≠ 532,77 ≠ 533,78",
+    "\n   ",
+    "\n   🚨🚨🚨 ATENÇÃO MÁXIMA:",
+    "\n   • Coordenadas são EXTREMAMENTE PRECISAS",
+    "\n   • Um erro de 1 segundo = ~30 metros de diferença no terreno!",
+    "\n   • LEIA DEVAGAR, confira DUAS VEZES cada número",
+    "\n   • Use ZOOM na imagem se necessário",
+    "\n   ",
+    "\n   📍 IMPORTANTE PARA COMPARAÇÃO:",
+    "\n   🚨 O INCRA tem sinal negativo (-) antes das coordenadas",
+    "\n   🚨 O PROJETO NÃO tem sinal negativo, usa W/S no final",
+    "\n   🚨 Na comparação, IGNORE o sinal negativo!",
+    "\n   ",
+    "\n   ✅ EXEMPLOS EQUIVALENTES (são a MESMA coordenada):",
+    "\n   • INCRA: -48°34'14,782\"  ≡  PROJETO: 48°34'14,782\" W",
+    "\n   • INCRA: -20°50'45,291\"  ≡  PROJETO: 20°50'45,291\" S",
+    "\n   ",
+    "\n   💡 Ao comparar:",
+    "\n   1. Ignore o sinal negativo (-) do INCRA",
+    "\n   2. Ignore a letra W/S do PROJETO",
+    "\n   3. Compare apenas os números: 48°34'14,782\" = 48°34'14,782\"",
+    "\n   4. Verifique TODAS as casas decimais: 14,782 deve ser exatamente 14,782",
+    "\n",
+    "\n5. REPRODUZA A TABELA COMPLETA - CONTAGEM OBRIGATÓRIA:",
+    "\n   ",
+    "\n   🚨 CRÍTICO: A tabela continua em MÚLTIPLAS PÁGINAS!",
+    "\n   • Página 1 do INCRA: Primeiros ~16-18 vértices",
+    "\n   • Página 2 do INCRA: Vértices restantes (~8-10)",
+    "\n   • TOTAL: ~26 vértices (ou mais)",
+    "\n   ",
+    "\n   📊 MÉTODO DE CONTAGEM:",
+    "\n   1. Leia a primeira linha após o cabeçalho",
+    "\n   2. CONTE: linha 1, linha 2, linha 3, linha 4...",
+    "\n   3. Continue até NÃO haver mais linhas",
+    "\n   4. Anote o total: \"Encontrei __ linhas\"",
+    "\n   5. Verifique: O último código tem número MAIOR que o primeiro?",
+    "\n   ",
+    "\n   ⚠️⚠️⚠️ ATENÇÃO COM O FECHAMENTO:",
+    "\n   • Algumas tabelas repetem o PRIMEIRO vértice no final",
+    "\n   • Isso serve para \"fechar o polígono\" visualmente",
+    "\n   • MAS você NÃO deve contar essa linha repetida!",
+    "\n   ",
+    "\n   ✅ EXEMPLO CORRETO:",
+    "\n   Linha 1: AKE-V-0166 (primeiro - número 0166)",
+    "\n   Linha 2: AKE-M-1028",
+    "\n   ...",
+    "\n   Linha 25: AKE-P-3585",
+    "\n   Linha 26: AKE-P-3586 (último - número 3586)",
+    "\n   [Linha extra: AKE-V-0166] ← NÃO CONTE ESTA! É repetição!",
+    "\n   Total de vértices únicos: 26",
+    "\n   ",
+    "\n   ❌ EXEMPLO ERRADO:",
+    "\n   Linha 25: AKE-P-3585",
+    "\n   Linha 26: AKE-P-3586",
+    "\n   Linha 27: AKE-V-0166 ← ERRO! 0166 < 3586 (voltou!)",
+    "\n   ",
+    "\n   💡 REGRA SIMPLES:",
+    "\n   • Se o código tem número MENOR que o anterior = É REPETIÇÃO",
+    "\n   • Pare de contar quando o número voltar ao início",
+    "\n   ",
+    "\n   ⚠️ NUNCA pare de ler na página 1!",
+    "\n   ⚠️ SEMPRE verifique se há mais páginas!",
+    "\n   ⚠️ Se você extraiu 25 vértices, PROCURE O 26º!",
+    "\n   ",
+    "\n   🚨🚨🚨 ATENÇÃO ESPECIAL - O ÚLTIMO CÓDIGO:",
+    "\n   ⚠️⚠️⚠️ O ÚLTIMO CÓDIGO É O MAIS IMPORTANTE! ⚠️⚠️⚠️",
+    "\n   ",
+    "\n   • Você DEVE encontrar e extrair o ÚLTIMO código da tabela",
+    "\n   • Procure na SEGUNDA PÁGINA do INCRA!",
+    "\n   • O último código tem o NÚMERO MAIS ALTO",
+    "\n   • Exemplo: Se tem AKE-P-3586, esse é o ÚLTIMO (3586 é o maior)",
+    "\n   • NÃO PODE FALTAR! Isso é CRÍTICO!",
+    "\n   ",
+    "\n   ✅ VERIFICAÇÃO DO ÚLTIMO CÓDIGO:",
+    "\n   1. Qual é o último código que extraí? _______",
+    "\n   2. Esse código tem o número mais alto da tabela? SIM/NÃO",
+    "\n   3. Verifiquei a segunda página do INCRA? SIM/NÃO",
+    "\n   4. Há alguma linha depois desse código? SIM/NÃO",
+    "\n   ",
+    "\n   🔴 Se alguma resposta não estiver certa, PROCURE NOVAMENTE!",
+    "\n",
+    "\n5.5 🚨🚨🚨 MÉTODO RIGOROSO DE OCR - LINHA POR LINHA, CÉLULA POR CÉLULA 🚨🚨🚨",
+    "\n   ",
+    "\n   ⚠️⚠️⚠️ CRÍTICO: A maioria dos erros está nos NÚMEROS! ⚠️⚠️⚠️",
+    "\n   ",
+    "\n   📋 PROCESSO OBRIGATÓRIO - SIGA EXATAMENTE:",
+    "\n   ",
+    "\n   PARA CADA LINHA DA TABELA:",
+    "\n   ",
+    "\n   PASSO 1 - EXTRAIR CÓDIGO (coluna 1):",
+    "\n   └─ Leia o código completo: AKE-X-XXXX",
+    "\n   └─ Anote mentalmente: \"Código = _______\"",
+    "\n   ",
+    "\n   PASSO 2 - EXTRAIR LONGITUDE (coluna 2):",
+    "\n   🎯 FOQUE EXCLUSIVAMENTE nesta célula!",
+    "\n   ",
+    "\n   A. Isole visualmente APENAS a célula de Longitude",
+    "\n   B. Ignore todas as outras colunas temporariamente",
+    "\n   C. Leia DEVAGAR, parte por parte:",
+    "\n      ",
+    "\n      Formato: -48°34'14,782\"",
+    "\n      └─ Sinal: - (tem ou não tem?)",
+    "\n      └─ Graus: __ (2 dígitos)",
+    "\n      └─ Símbolo: °",
+    "\n      └─ Minutos: __ (2 dígitos)",
+    "\n      └─ Apóstrofo: '",
+    "\n      └─ Segundos INTEIROS: __ (2 dígitos)",
+    "\n      └─ Vírgula: ,",
+    "\n      └─ Segundos DECIMAIS: ___ (EXATAMENTE 3 dígitos!)",
+    "\n      └─ Aspas: \"",
+    "\n   ",
+    "\n   D. Leia OS SEGUNDOS 2 VEZES para confirmar:",
+    "\n      └─ Primeira leitura: __.___",
+    "\n      └─ Segunda leitura: __.___",
+    "\n      └─ São IGUAIS? Se NÃO, leia uma TERCEIRA vez!",
+    "\n   ",
+    "\n   E. Verifique:",
+    "\n      ✓ Tem EXATAMENTE 3 dígitos após a vírgula?",
+    "\n      ✓ Exemplo: 14,782 (não 14,78!)",
+    "\n   ",
+    "\n   PASSO 3 - EXTRAIR LATITUDE (coluna 3):",
+    "\n   🎯 FOQUE EXCLUSIVAMENTE nesta célula!",
+    "\n   ",
+    "\n   A. Isole visualmente APENAS a célula de Latitude",
+    "\n   B. Ignore todas as outras colunas temporariamente",
+    "\n   C. Leia DEVAGAR, parte por parte:",
+    "\n      ",
+    "\n      Formato: -20°50'45,291\"",
+    "\n      └─ Sinal: - (tem ou não tem?)",
+    "\n      └─ Graus: __ (2 dígitos)",
+    "\n      └─ Símbolo: °",
+    "\n      └─ Minutos: __ (2 dígitos)",
+    "\n      └─ Apóstrofo: '",
+    "\n      └─ Segundos INTEIROS: __ (2 dígitos)",
+    "\n      └─ Vírgula: ,",
+    "\n      └─ Segundos DECIMAIS: ___ (EXATAMENTE 3 dígitos!)",
+    "\n      └─ Aspas: \"",
+    "\n   ",
+    "\n   D. Leia OS SEGUNDOS 2 VEZES para confirmar:",
+    "\n      └─ Primeira leitura: __.___",
+    "\n      └─ Segunda leitura: __.___",
+    "\n      └─ São IGUAIS? Se NÃO, leia uma TERCEIRA vez!",
+    "\n   ",
+    "\n   E. Verifique:",
+    "\n      ✓ Tem EXATAMENTE 3 dígitos após a vírgula?",
+    "\n      ✓ Exemplo: 45,291 (não 45,29!)",
+    "\n   ",
+    "\n   PASSO 4 - EXTRAIR ALTITUDE (coluna 4):",
+    "\n   🚨🚨🚨 ESTA É A MAIS DIFÍCIL! ATENÇÃO MÁXIMA! 🚨🚨🚨",
+    "\n   ",
+    "\n   A. Isole visualmente APENAS a célula de Altitude",
+    "\n   B. Ignore COMPLETAMENTE as outras colunas",
+    "\n   C. Leia dígito por dígito:",
+    "\n      ",
+    "\n      Formato: XXX,XX",
+    "\n      └─ Centenas: _ (é 5 ou 6? é 3 ou 8?)",
+    "\n      └─ Dezenas: _ (é 3 ou 8? é 2 ou 7?)",
+    "\n      └─ Unidades: _ (é 2 ou 7? é 4 ou 9?)",
+    "\n      └─ Vírgula: ,",
+    "\n      └─ Decimal 1: _ (é 7 ou 1?)",
+    "\n      └─ Decimal 2: _ (SEMPRE tem! não omita!)",
+    "\n   ",
+    "\n   D. Leia O NÚMERO COMPLETO 3 VEZES:",
+    "\n      └─ 1ª leitura: ___,__",
+    "\n      └─ 2ª leitura: ___,__",
+    "\n      └─ 3ª leitura: ___,__",
+    "\n      └─ As 3 são IGUAIS? Se NÃO, leia MAIS vezes!",
+    "\n   ",
+    "\n   E. Pares confusos - MUITO CUIDADO:",
+    "\n      • 5 ou 6? → Olhe o formato da curva",
+    "\n      • 3 ou 8? → 8 tem dois círculos, 3 tem um",
+    "\n      • 2 ou 7? → 7 tem traço horizontal em cima",
+    "\n      • 1 ou 7? → 1 é reto, 7 tem ângulo",
+    "\n   ",
+    "\n   F. Verificação cruzada:",
+    "\n      • Compare com altitude da linha anterior",
+    "\n      • Altitudes variam pouco: 530-540 geralmente",
+    "\n      • Se anterior era 532 e você leu 597 → ERRO!",
+    "\n   ",
+    "\n   PASSO 5 - ANOTAR A LINHA COMPLETA:",
+    "\n   └─ Código: _______",
+    "\n   └─ Longitude: -__°__'__,___\"",
+    "\n   └─ Latitude: -__°__'__,___\"",
+    "\n   └─ Altitude: ___,__",
+    "\n   ",
+    "\n   PASSO 6 - REPETIR PARA A PRÓXIMA LINHA",
+    "\n   ",
+    "\n   🔴 NÃO TENTE LER TUDO DE UMA VEZ!",
+    "\n   🟢 PROCESSE LINHA POR LINHA, CÉLULA POR CÉLULA!",
+    "\n",
+    "\n6. MANTENHA A FORMATAÇÃO:",
+    "\n   • Use espaços/tabs para alinhar colunas",
+    "\n   • Separe seções (VÉRTICE e SEGMENTO VANTE)",
+    "\n   • Mantenha símbolos especiais (°, ', \")",
+    "\n",
+    "\n7. SEGMENTO VANTE - EXTRAÇÃO SEPARADA:",
+    "\n   🚨 IMPORTANTE: O SEGMENTO VANTE deve ser comparado SEPARADAMENTE!",
+    "\n   • No INCRA: É a segunda parte da tabela",
+    "\n   • Colunas: Código, Azimute, Dist.(m), Confrontações",
+    "\n   • O Código do Segmento Vante geralmente é diferente do Código do Vértice",
+    "\n   • Exemplo de linha do Segmento Vante:",
+    "\n     - Código: AKE-M-1028",
+    "\n     - Azimute: 140°40'",
+    "\n     - Distância: 43,85 m",
+    "\n     - Confrontações: CNS: 12.102-0 | Mat. 28309",
+    "\n   • EXTRAIA TODOS os segmentos, não apenas alguns!",
+    "\n",
+    "\n8. CONFRONTANTES DO INCRA:",
+    "\n   • Os confrontantes estão na coluna 'Confrontações' da tabela",
+    "\n   • Exemplo: 'CNS: 12.102-0 | Mat. 28309'",
+    "\n   • Exemplo: 'Estrada Municipal - BBD 315'",
+    "\n   • Exemplo: 'CNS: 12.102-0 | Mat. 34685 | Córrego Lambari'",
+    "\n   • ⚠️ NÃO extraia nomes de pessoas!",
+    "\n   • ✅ Extraia: Matrícula, nome da estrada, córrego, etc.",
+    "\n",
+    "\n════════════════════════════════════════════════════════════",
+    "\n                    FORMATO DE SAÍDA                         ",
+    "\n════════════════════════════════════════════════════════════",
+    "\n",
+    "\nApresente no seguinte formato:",
+    "\n",
+    "\n**DADOS CADASTRAIS:**",
+    "\nDenominação: [valor]",
+    "\nProprietário(a): [valor]",
+    "\nMatrícula do imóvel: [valor]",
+    "\nMunicípio/UF: [valor]",
+    "\nCódigo de credenciamento: [valor]",
+    "\nCódigo INCRA/SNCR: [valor]",
+    "\nÁrea (Sistema Geodésico Local): [valor]",
+    "\nPerímetro (m): [valor]",
+    "\n",
+    "\n**TABELA DE COORDENADAS:**",
+    "\n[Reproduza a tabela completa aqui, mantendo formatação]",
+    "\n",
+    "\nExtraia CADA dado de CADA célula com MÁXIMA PRECISÃO!",
+))
+
+
+# Instruções de extração enviadas antes das imagens do Projeto/Planta
+PROMPT_INSTRUCOES_PROJETO = "".join((
+    "\n--- INÍCIO PROJETO/PLANTA ---",
+    "\n🎯 ATENÇÃO ESPECIAL PARA ESTE PROJETO:",
+    "\nEste é um PDF DIGITAL (não escaneado) - ele contém TABELAS DE DADOS!",
+    "\n",
+    "\n📊 ONDE ESTÁ A TABELA:",
+    "\nProcure por uma tabela com o título:",
+    "\n'Tabela de Coordenadas - Altitudes - Azimutes - Distâncias'",
+    "\n",
+    "\nA tabela tem DUAS partes:",
+    "\n",
+    "\n📍 PARTE 1 - VÉRTICE:",
+    "\n┌──────────┬────────────────┬────────────────┬────────────┐",
+    "\n│ Código   │ Longitude      │ Latitude       │ Altitude   │",
+    "\n├──────────┼────────────────┼────────────────┼────────────┤",
+    "\n│ AKE-V... │ 48°34'14,782\" W│ 20°50'45,291\" S│ 532,78     │",
+    "\n└──────────┴────────────────┴────────────────┴────────────┘",
+    "\n",
+    "\n📐 PARTE 2 - SEGMENTO VANTE (após coluna Altitude):",
+    "\n┌──────────┬──────────┬────────────┐",
+    "\n│ Azimute  │ Dist.(m) │ Outros     │",
+    "\n├──────────┼──────────┼────────────┤",
+    "\n│ 140°40'  │ 43,85    │ ...        │",
+    "\n└──────────┴──────────┴────────────┘",
+    "\n",
+    "\n🚨 IMPORTANTE: No Projeto, o SEGMENTO VANTE vem LOGO APÓS a coluna Altitude!",
+    "\n   • Procure por colunas: Azimute, Distância (ou Dist.)",
+    "\n   • Essas colunas vêm DEPOIS de: Código, Longitude, Latitude, Altitude",
+    "\n   • EXTRAIA também essas informações para comparação!",
+    "\n",
+    "\n🚨🚨🚨 REGRA ABSOLUTA - EXTRAÇÃO COMPLETA (PROJETO) 🚨🚨🚨",
+    "\n",
+    "\n⛔ ZERO TOLERÂNCIA PARA LINHAS FALTANDO:",
+    "\n• Você DEVE extrair 100% das linhas da tabela do PROJETO",
+    "\n• NÃO pule NENHUMA linha",
+    "\n• NÃO omita NENHUM vértice",
+    "\n• MANTENHA a ordem EXATA do documento original",
+    "\n• LEIA linha por linha sequencialmente",
+    "\n• Conte: Se tem 26 vértices, extraia os 26!",
+    "\n",
+    "\n📊 MÉTODO DE EXTRAÇÃO SEQUENCIAL:",
+    "\n1. Localize a tabela 'Tabela de Coordenadas...'",
+    "\n2. Identifique a primeira linha de dados",
+    "\n3. Extraia: Linha 1 → Linha 2 → Linha 3 → ... → Última linha",
+    "\n4. NÃO pule linhas intermediárias",
+    "\n5. CONTE o total de linhas extraídas",
+    "\n6. COMPARE com o total na tabela original",
+    "\n",
+    "\n✅ CHECKLIST DE VERIFICAÇÃO:",
+    "\n□ Li TODAS as linhas da tabela?",
+    "\n□ A primeira linha está incluída?",
+    "\n□ A última linha está incluída?",
+    "\n□ Não pulei nenhuma linha do meio?",
+    "\n□ A ordem está correta?",
+    "\n",
+    "\n════════════════════════════════════════════════════════════",
+    "\n",
+    "\n⚠️ INSTRUÇÕES CRÍTICAS DE EXTRAÇÃO:",
+    "\n",
+    "\n1. 🔍 LOCALIZE a tabela completa",
+    "\n   • Geralmente está no CANTO ESQUERDO da página",
+    "\n   • Ou na parte SUPERIOR",
+    "\n   • Título: 'Tabela de Coordenadas...'",
+    "\n",
+    "\n2. 📖 LEIA LINHA POR LINHA",
+    "\n   • Primeira linha: Cabeçalhos (Código, Longitude, Latitude, Altitude)",
+    "\n   • Depois: TODAS as linhas de dados",
+    "\n   • Pode ter 20, 26, 30 ou mais vértices!",
+    "\n",
+    "\n3. 🎯 USE OS CÓDIGOS DO INCRA COMO REFERÊNCIA!",
+    "\n   ",
+    "\n   🚨🚨🚨 ESTRATÉGIA IMPORTANTE 🚨🚨🚨",
+    "\n   ",
+    "\n   ✅ Você JÁ extraiu a lista de códigos do INCRA na ETAPA 1",
+    "\n   ✅ AGORA use essa lista para encontrar as coordenadas no PROJETO",
+    "\n   ✅ Os códigos são IDÊNTICOS nos dois documentos!",
+    "\n   ",
+    "\n   📋 MÉTODO:",
+    "\n   1. Pegue o primeiro código da sua lista do INCRA (ex: AKE-V-0166)",
+    "\n   2. PROCURE esse código na tabela do PROJETO",
+    "\n   3. Extraia as coordenadas (Long, Lat, Alt, Azimute, Dist)",
+    "\n   4. Repita para o próximo código da lista",
+    "\n   5. Continue até o último código",
+    "\n   ",
+    "\n   🔴 NÃO TENTE ler os códigos do Projeto se não conseguir!",
+    "\n   🟢 USE a lista de códigos do INCRA que você já tem!",
+    "\n   ",
+    "\n   ⚠️ LEMBRE-SE:",
+    "\n   • Se o INCRA tem AKE-M-1087, o PROJETO também tem AKE-M-1087",
+    "\n   • Se o INCRA tem AKE-M-1088, o PROJETO também tem AKE-M-1088",
+    "\n   • Os códigos são EXATAMENTE IGUAIS nos dois documentos!",
+    "\n   ",
+    "\n   COORDENADAS NO PROJETO:",
+    "\n   • Longitude: 48°34'14,782\" W (SEM sinal negativo, COM letra W)",
+    "\n   • Latitude: 20°50'45,291\" S (SEM sinal negativo, COM letra S)",
+    "\n   • Altitude: 532,78 (número simples)",
+    "\n   ",
+    "\n   🚨 DIFERENÇA INCRA vs PROJETO:",
+    "\n   • INCRA: -48°34'14,782\" (TEM sinal negativo -)",
+    "\n   • PROJETO: 48°34'14,782\" W (NÃO tem sinal -, tem letra W)",
+    "\n   • São EQUIVALENTES! Na comparação, ignore o sinal -",
+    "\n",
+    "\n4. ⚠️ NÃO CONFUNDA:",
+    "\n   • ❌ NÃO pegue números do DESENHO (ex: E=741319 N=7696237)",
+    "\n   • ❌ NÃO pegue números das LEGENDAS",
+    "\n   • ❌ NÃO pegue números dos CARIMBOS",
+    "\n   • ✅ SÓ pegue da TABELA DE COORDENADAS!",
+    "\n",
+    "\n5. 📝 LISTE TODOS OS VÉRTICES",
+    "\n   🚨 CRÍTICO: Extraia TODOS os vértices da tabela!",
+    "\n   • Se a tabela tem 26 vértices, liste os 26!",
+    "\n   • Se a tabela tem 30 vértices, liste os 30!",
+    "\n   • NÃO omita nenhum vértice",
+    "\n   • NÃO pare em 3-4 vértices",
+    "\n   • Leia até o FIM da tabela!",
+    "\n   ",
+    "\n   🚨🚨🚨 ATENÇÃO ESPECIAL - O ÚLTIMO CÓDIGO DO PROJETO:",
+    "\n   ⚠️⚠️⚠️ O ÚLTIMO CÓDIGO É O MAIS IMPORTANTE! ⚠️⚠️⚠️",
+    "\n   ",
+    "\n   • Você tem a lista de códigos do INCRA",
+    "\n   • O ÚLTIMO código dessa lista é o que você DEVE encontrar no PROJETO",
+    "\n   • Exemplo: Se o último do INCRA é AKE-P-3586, PROCURE no PROJETO",
+    "\n   • NÃO PODE FALTAR! Isso é CRÍTICO!",
+    "\n   • Se não encontrou, PROCURE NOVAMENTE na tabela do PROJETO",
+    "\n",
+    "\n5.5 🚨🚨🚨 MÉTODO RIGOROSO DE OCR - PROJETO (LINHA POR LINHA) 🚨🚨🚨",
+    "\n   ",
+    "\n   ⚠️⚠️⚠️ CRÍTICO: Use o MESMO método rigoroso do INCRA! ⚠️⚠️⚠️",
+    "\n   ",
+    "\n   📋 PROCESSO - Para cada código da sua lista do INCRA:",
+    "\n   ",
+    "\n   1. Pegue o código (ex: AKE-V-0166)",
+    "\n   2. PROCURE esse código na tabela do PROJETO",
+    "\n   3. Quando encontrar a linha, extraia CÉLULA POR CÉLULA:",
+    "\n   ",
+    "\n   CÉLULA 2 - LONGITUDE:",
+    "\n   🎯 Isole visualmente APENAS esta célula",
+    "\n   ",
+    "\n   Formato: 48°34'14,782\" W (SEM sinal -, TEM letra W)",
+    "\n   ",
+    "\n   A. Leia parte por parte:",
+    "\n      └─ Graus: __ (2 dígitos)",
+    "\n      └─ Símbolo: °",
+    "\n      └─ Minutos: __ (2 dígitos)",
+    "\n      └─ Apóstrofo: '",
+    "\n      └─ Segundos INTEIROS: __ (2 dígitos)",
+    "\n      └─ Vírgula: ,",
+    "\n      └─ Segundos DECIMAIS: ___ (3 dígitos!)",
+    "\n      └─ Aspas: \"",
+    "\n      └─ Direção: W",
+    "\n   ",
+    "\n   B. Leia os segundos 2-3 VEZES para confirmar",
+    "\n   C. Verifique: Tem 3 dígitos após vírgula?",
+    "\n   ",
+    "\n   D. 🔍 VALIDAÇÃO CRUZADA:",
+    "\n      • Compare com INCRA (mesmo código)",
+    "\n      • INCRA tinha: -48°34'14,782\"",
+    "\n      • PROJETO deve ter: 48°34'14,782\" W",
+    "\n      • Os NÚMEROS devem ser IDÊNTICOS!",
+    "\n      • Se diferente → VOCÊ ERROU! Leia novamente!",
+    "\n   ",
+    "\n   CÉLULA 3 - LATITUDE:",
+    "\n   🎯 Isole visualmente APENAS esta célula",
+    "\n   ",
+    "\n   Formato: 20°50'45,291\" S (SEM sinal -, TEM letra S)",
+    "\n   ",
+    "\n   A. Leia parte por parte:",
+    "\n      └─ Graus: __ (2 dígitos)",
+    "\n      └─ Símbolo: °",
+    "\n      └─ Minutos: __ (2 dígitos)",
+    "\n      └─ Apóstrofo: '",
+    "\n      └─ Segundos INTEIROS: __ (2 dígitos)",
+    "\n      └─ Vírgula: ,",
+    "\n      └─ Segundos DECIMAIS: ___ (3 dígitos!)",
+    "\n      └─ Aspas: \"",
+    "\n      └─ Direção: S",
+    "\n   ",
+    "\n   B. Leia os segundos 2-3 VEZES para confirmar",
+    "\n   C. Verifique: Tem 3 dígitos após vírgula?",
+    "\n   ",
+    "\n   D. 🔍 VALIDAÇÃO CRUZADA:",
+    "\n      • Compare com INCRA (mesmo código)",
+    "\n      • INCRA tinha: -20°50'45,291\"",
+    "\n      • PROJETO deve ter: 20°50'45,291\" S",
+    "\n      • Os NÚMEROS devem ser IDÊNTICOS!",
+    "\n      • Se diferente → VOCÊ ERROU! Leia novamente!",
+    "\n   ",
+    "\n   CÉLULA 4 - ALTITUDE:",
+    "\n   🚨🚨🚨 ESTA É A MAIS DIFÍCIL! ATENÇÃO MÁXIMA! 🚨🚨🚨",
+    "\n   🎯 Isole visualmente APENAS esta célula",
+    "\n   ",
+    "\n   Formato: XXX,XX",
+    "\n   ",
+    "\n   A. Leia dígito por dígito:",
+    "\n      └─ Centenas: _ (5 ou 6? 3 ou 8?)",
+    "\n      └─ Dezenas: _ (3 ou 8? 2 ou 7?)",
+    "\n      └─ Unidades: _ (2 ou 7? 4 ou 9?)",
+    "\n      └─ Vírgula: ,",
+    "\n      └─ Decimal 1: _",
+    "\n      └─ Decimal 2: _ (não omita!)",
+    "\n   ",
+    "\n   B. Leia 3 VEZES:",
+    "\n      └─ 1ª: ___,__",
+    "\n      └─ 2ª: ___,__",
+    "\n      └─ 3ª: ___,__",
+    "\n      └─ Iguais? Se não, leia mais!",
+    "\n   ",
+    "\n   C. Pares confusos:",
+    "\n      • 5 ou 6? → forma da curva",
+    "\n      • 3 ou 8? → 8=dois círculos, 3=um",
+    "\n      • 2 ou 7? → 7=traço em cima",
+    "\n   ",
+    "\n   D. 🔍🔍🔍 VALIDAÇÃO CRUZADA (CRÍTICA):",
+    "\n      • Compare com INCRA (mesmo código)",
+    "\n      • INCRA e PROJETO devem ter altitude IGUAL ou MUITO próxima",
+    "\n      • Diferença máxima: ±5 metros",
+    "\n      • Exemplo:",
+    "\n        - INCRA: 532,78 → PROJETO deve ser ~532,78",
+    "\n        - Se você leu 597,78 → ERRO! (diferença de 65m!)",
+    "\n        - Se você leu 537,78 → Provavelmente ERRO!",
+    "\n        - Releia com mais cuidado!",
+    "\n   ",
+    "\n   4. Repita para o próximo código da lista",
+    "\n   ",
+    "\n   🟢 DICA FINAL: Use INCRA para VALIDAR PROJETO!",
+    "\n   • Mesmos códigos = mesmas coordenadas",
+    "\n   • Se diferença grande → você errou no OCR",
+    "\n",
+    "\n💡 EXEMPLO CORRETO DE EXTRAÇÃO:",
+    "\nVértice AKE-V-0166:",
+    "\n  • Longitude: 48°34'14,782\" W",
+    "\n  • Latitude: 20°50'45,291\" S",
+    "\n  • Altitude: 532,78 m",
+    "\n",
+    "\nVértice AKE-M-1028:",
+    "\n  • Longitude: 48°34'13,821\" W",
+    "\n  • Latitude: 20°50'46,394\" S",
+    "\n  • Altitude: 533,92 m",
+    "\n",
+    "\n... (continua para TODOS os vértices da tabela)",
+    "\n",
+    "\n❌ EXEMPLO ERRADO (NÃO FAÇA ISSO):",
+    "\n'E=741319 N=7696237' ← Isso é do DESENHO, não da tabela!",
+    "\n",
+))
+
+
+# Instruções finais críticas antes do HTML
+PROMPT_LEMBRETE_FINAL = "".join((
+    "\n",
+    "\n════════════════════════════════════════════════════════════",
+    "\n           🚨 LEMBRETE FINAL - ANTES DE GERAR O HTML 🚨",
+    "\n════════════════════════════════════════════════════════════",
+    "\n",
+    "\n⚠️ ANTES de gerar o relatório HTML, VERIFIQUE:",
+    "\n",
+    "\n1. ✅ Extraí TODAS as linhas da tabela INCRA?",
+    "\n   • Contei quantas linhas tem na tabela original?",
+    "\n   • Contei quantas linhas extraí?",
+    "\n   • Os números são IGUAIS?",
+    "\n",
+    "\n2. ✅ Extraí TODAS as linhas da tabela PROJETO?",
+    "\n   • Contei quantas linhas tem na tabela original?",
+    "\n   • Contei quantas linhas extraí?",
+    "\n   • Os números são IGUAIS?",
+    "\n",
+    "\n3. ✅ Mantive a ORDEM EXATA dos documentos originais?",
+    "\n   • Primeira linha → vem primeiro no relatório",
+    "\n   • Segunda linha → vem em segundo no relatório",
+    "\n   • Última linha → vem por último no relatório",
+    "\n",
+    "\n4. ✅ NÃO pulei nenhuma linha do meio?",
+    "\n   • Se tem vértices V-01, V-02, V-03... V-26",
+    "\n   • Meu relatório tem TODOS eles, em sequência?",
+    "\n",
+    "\n4.5 ✅ NÃO repeti o primeiro vértice como último?",
+    "\n   🚨 VERIFICAÇÃO CRÍTICA DOS CÓDIGOS:",
+    "\n   • Primeiro código: número baixo (ex: AKE-V-0166 = 0166)",
+    "\n   • Último código: número alto (ex: AKE-P-3586 = 3586)",
+    "\n   • ⚠️ Se vejo AKE-V-0166 no final, é REPETIÇÃO (não conte!)",
+    "\n   • ⚠️ Se o último número é MENOR que o primeiro = ERRO!",
+    "\n   • ✅ Números devem ser CRESCENTES: 0166 < 1028 < 3586",
+    "\n   • ❌ ERRADO: ...AKE-P-3586, AKE-V-0166 (voltou para 0166!)",
+    "\n   • ✅ CORRETO: ...AKE-P-3585, AKE-P-3586 (terminou em 3586)",
+    "\n",
+    "\n5. ✅ Extraí TODOS os SEGMENTOS VANTE?",
+    "\n   🚨🚨🚨 OBRIGATÓRIO: A seção SEGMENTO VANTE deve estar preenchida!",
+    "\n   • Tanto do INCRA quanto do PROJETO",
+    "\n   • NO INCRA: Está na segunda parte da tabela (Código, Azimute, Dist., Confrontações)",
+    "\n   • NO PROJETO: Está após as colunas de coordenadas (colunas Azimute e Distância)",
+    "\n   • Se não encontrei dados de SEGMENTO VANTE, PROCURE NOVAMENTE!",
+    "\n   • O relatório HTML DEVE ter a SEÇÃO 4: SEGMENTO VANTE preenchida!",
+    "\n",
+    "\n6. ✅ Copiei os CÓDIGOS EXATAMENTE como aparecem?",
+    "\n   🚨 CRÍTICO: Códigos devem ser copiados CARACTERE POR CARACTERE!",
+    "\n   • Se está escrito AKE-M-1087, copie AKE-M-1087 (NÃO invente 1030!)",
+    "\n   • Se está escrito AKE_P-3568 (com underscore), copie AKE_P-3568",
+    "\n   • Se está escrito AKE-P-3568 (com hífen), copie AKE-P-3568",
+    "\n   • UNDERSCORES (_) são DIFERENTES de HÍFENS (-)",
+    "\n   • Números devem ser EXATOS: 1087 ≠ 1030 ≠ 1088",
+    "\n   • NÃO normalize, NÃO corrija, COPIE EXATAMENTE!",
+    "\n",
+    "\n🔴 SE ALGUMA RESPOSTA FOR \"NÃO\": VOLTE E EXTRAIA NOVAMENTE!",
+    "\n🟢 SE TODAS AS RESPOSTAS FOREM \"SIM\": Prossiga com o HTML!",
+    "\n",
+    "\n════════════════════════════════════════════════════════════",
+    "\n",
+    "\n🚨🚨🚨 REGRA ABSOLUTA DE RESPOSTA 🚨🚨🚨",
+    "\n",
+    "\n⛔ SUA RESPOSTA DEVE COMEÇAR DIRETAMENTE COM: <!DOCTYPE html>",
+    "\n",
+    "\n❌ NÃO ESCREVA:",
+    "\n   • \"OK. Entendido! Vou analisar...\"",
+    "\n   • \"ANÁLISE DOS DOCUMENTOS:\"",
+    "\n   • \"DADOS CADASTRAIS:\"",
+    "\n   • \"TABELA DE COORDENADAS:\"",
+    "\n   • Qualquer texto explicativo ou rascunho",
+    "\n",
+    "\n✅ ESCREVA APENAS:",
+    "\n   • Primeira linha: <!DOCTYPE html>",
+    "\n   • Depois: <html>",
+    "\n   • Depois: todo o HTML do relatório",
+    "\n   • Última linha: </html>",
+    "\n",
+    "\n🔴 NADA ANTES DO <!DOCTYPE html>",
+    "\n🔴 NADA DEPOIS DO </html>",
+    "\n🔴 SEM RASCUNHOS, SEM ANÁLISES PRÉVIAS",
+    "\n🟢 SOMENTE O CÓDIGO HTML PURO!",
+    "\n",
+    "\n════════════════════════════════════════════════════════════",
+    "\n",
+))
+
+
+# Instruções de formato de saída - HTML profissional com cores
+PROMPT_FORMATO_SAIDA = (
+    "\n\n"
+    "\n════════════════════════════════════════════════════════════════════"
+    "\n                    FORMATO DO RELATÓRIO HTML                       "
+    "\n════════════════════════════════════════════════════════════════════"
+    "\n"
+    "\n🎯 DOCUMENTOS SENDO COMPARADOS: INCRA + PROJETO"
+    "\n"
+    "\n⚠️⚠️⚠️ REGRA CRÍTICA DE FORMATAÇÃO:"
+    "\n"
+    "\n1️⃣ Você está comparando: INCRA + PROJETO"
+    "\n   • Tabela deve ter 3 colunas: DADO | INCRA | PROJETO | STATUS"
+    "\n"
+    "\n2️⃣ Estrutura da tabela:"
+    "\n   <thead><tr>"
+    "\n       <th>DADO</th>"
+    "\n       <th>INCRA</th>"
+    "\n       <th>PROJETO</th>"
+    "\n       <th>STATUS</th>"
+    "\n   </tr></thead>"
+    "\n"
+    "\n⚠️ IMPORTANTE: Gere um relatório em HTML completo e profissional."
+    "\nUse CSS inline para cores, estilos e organização visual perfeita."
+    "\nCada seção deve ter cores diferentes para fácil identificação."
+    "\n"
+    "\nGere EXATAMENTE este formato HTML (adapte os dados):"
+    "\n"
+    "\n```html"
+    "\n<!DOCTYPE html>"
+    "\n<html lang='pt-BR'>"
+    "\n<head>"
+    "\n    <meta charset='UTF-8'>"
+    "\n    <meta name='viewport' content='width=device-width, initial-scale=1.0'>"
+    "\n    <title>Relatório de Consistência - Georreferenciamento</title>"
+    "\n    <style>"
+    "\n        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }"
+    "\n        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }"
+    "\n        h1 { color: #2c3e50; border-bottom: 4px solid #3498db; padding-bottom: 10px; }"
+    "\n        h2 { color: #34495e; margin-top: 30px; padding: 10px; border-left: 5px solid #3498db; background: #ecf0f1; }"
+    "\n        .resumo { background: #e8f5e9; padding: 20px; border-left: 5px solid #4caf50; margin: 20px 0; font-size: 16px; }"
+    "\n        .resumo.alerta { background: #fff3e0; border-left-color: #ff9800; }"
+    "\n        .resumo.erro { background: #ffebee; border-left-color: #f44336; }"
+    "\n        table { width: 100%; border-collapse: collapse; margin: 20px 0; font-size: 14px; }"
+    "\n        th { background: #3498db; color: white; padding: 12px; text-align: left; font-weight: bold; }"
+    "\n        td { padding: 10px; border: 1px solid #ddd; }"
+    "\n        tr:nth-child(even) { background: #f9f9f9; }"
+    "\n        tr:hover { background: #f0f0f0; }"
+    "\n        .status-ok { color: #4caf50; font-weight: bold; font-size: 18px; }"
+    "\n        .status-alerta { color: #ff9800; font-weight: bold; font-size: 18px; }"
+    "\n        .status-erro { color: #f44336; font-weight: bold; font-size: 18px; }"
+    "\n        .secao-cadastro th { background: #2196f3; }"
+    "\n        .secao-tecnico th { background: #009688; }"
+    "\n        .secao-vertices th { background: #673ab7; }"
+    "\n        .secao-confrontantes th { background: #ff5722; }"
+    "\n        .secao-erros { background: #ffebee; padding: 15px; border-left: 5px solid #f44336; margin: 20px 0; }"
+    "\n        .secao-alertas { background: #fff3e0; padding: 15px; border-left: 5px solid #ff9800; margin: 20px 0; }"
+    "\n        .secao-ok { background: #e8f5e9; padding: 15px; border-left: 5px solid #4caf50; margin: 20px 0; }"
+    "\n        .parecer { padding: 20px; margin: 20px 0; border: 3px solid; font-size: 16px; font-weight: bold; }"
+    "\n        .parecer-aprovado { background: #e8f5e9; border-color: #4caf50; color: #2e7d32; }"
+    "\n        .parecer-ressalvas { background: #fff3e0; border-color: #ff9800; color: #e65100; }"
+    "\n        .parecer-reprovado { background: #ffebee; border-color: #f44336; color: #c62828; }"
+    "\n        .legenda { background: #ecf0f1; padding: 15px; margin: 20px 0; border-radius: 5px; }"
+    "\n        .analise { font-style: italic; color: #555; margin: 10px 0; padding: 10px; background: #f9f9f9; }"
+    "\n    </style>"
+    "\n</head>"
+    "\n<body>"
+    "\n<div class='container'>"
+    "\n"
+    "\n<!-- SEÇÃO 1: DADOS CADASTRAIS -->"
+    "\n<h2>📋 1. DADOS CADASTRAIS</h2>"
+    "\n<table class='secao-cadastro'>"
+    "\n<thead>"
+    "\n    <tr>"
+    "\n        <th>DADO</th>"
+    "\n        [COLUNAS DOS DOCUMENTOS FORNECIDOS]"
+    "\n        <th style='text-align:center;'>STATUS</th>"
+    "\n    </tr>"
+    "\n</thead>"
+    "\n<tbody>"
+    "\n    <tr>"
+    "\n        <td><strong>Proprietário(s)</strong></td>"
+    "\n        [DADOS DE CADA DOCUMENTO]"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n    <!-- Repetir para: Nome do Imóvel, Matrícula(s), Município, UF, Código INCRA, etc -->"
+    "\n    <tr>"
+    "\n        <td><strong>UF</strong></td>"
+    "\n        <td>[extrair]</td>"
+    "\n        <td>[extrair]</td>"
+    "\n        <td>[extrair/N/A]</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n    <tr>"
+    "\n        <td><strong>Código INCRA</strong></td>"
+    "\n        <td>[extrair]</td>"
+    "\n        <td>[extrair]</td>"
+    "\n        <td>[extrair/N/A]</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n    <tr>"
+    "\n        <td><strong>CCIR</strong></td>"
+    "\n        <td>[extrair]</td>"
+    "\n        <td>[extrair]</td>"
+    "\n        <td>[extrair/N/A]</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n</tbody>"
+    "\n</table>"
+    "\n<p class='analise'><strong>Análise:</strong> [Breve comentário sobre consistência destes dados]</p>"
+    "\n"
+    "\n<!-- SEÇÃO 2: DADOS TÉCNICOS -->"
+    "\n<h2>📐 2. DADOS TÉCNICOS/MENSURAÇÕES</h2>"
+    "\n<table class='secao-tecnico'>"
+    "\n<thead>"
+    "\n    <tr>"
+    "\n        <th>DADO</th>"
+    "\n        <th>INCRA</th>"
+    "\n        <th>MEMORIAL</th>"
+    "\n        <th>PROJETO</th>"
+    "\n        <th style='text-align:center;'>STATUS</th>"
+    "\n    </tr>"
+    "\n</thead>"
+    "\n<tbody>"
+    "\n    <tr>"
+    "\n        <td><strong>Área Total (ha)</strong></td>"
+    "\n        <td>[X,XXXX]</td>"
+    "\n        <td>[X,XXXX]</td>"
+    "\n        <td>[X,XXXX/N/A]</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n    <tr>"
+    "\n        <td><strong>Perímetro (m)</strong></td>"
+    "\n        <td>[X.XXX,XX]</td>"
+    "\n        <td>[X.XXX,XX]</td>"
+    "\n        <td>[X.XXX,XX/N/A]</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n    <tr>"
+    "\n        <td><strong>Sistema Coordenadas</strong></td>"
+    "\n        <td>[UTM/GEO]</td>"
+    "\n        <td>[UTM/GEO]</td>"
+    "\n        <td>[UTM/GEO/N/A]</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n    <tr>"
+    "\n        <td><strong>Datum</strong></td>"
+    "\n        <td>[SIRGAS]</td>"
+    "\n        <td>[SIRGAS]</td>"
+    "\n        <td>[SIRGAS/N/A]</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n    <tr>"
+    "\n        <td><strong>Fuso</strong></td>"
+    "\n        <td>[22/23]</td>"
+    "\n        <td>[22/23]</td>"
+    "\n        <td>[22/23/N/A]</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n</tbody>"
+    "\n</table>"
+    "\n<p class='analise'><strong>Análise:</strong> [Breve comentário sobre consistência destes dados]</p>"
+    "\n"
+    "\n<!-- SEÇÃO 3: VÉRTICES -->"
+    "\n<h2>🗺️ 3. COORDENADAS DOS VÉRTICES</h2>"
+    "\n<table class='secao-vertices'>"
+    "\n<thead>"
+    "\n    <tr>"
+    "\n        <th>VÉRTICE</th>"
+    "\n        <th>INCRA (Coordenadas)</th>"
+    "\n        <th>MEMORIAL (Coordenadas)</th>"
+    "\n        <th>PROJETO (Coordenadas)</th>"
+    "\n        <th style='text-align:center;'>STATUS</th>"
+    "\n    </tr>"
+    "\n</thead>"
+    "\n<tbody>"
+    "\n    <tr>"
+    "\n        <td><strong>V1 (AKE-V-XXXX)</strong></td>"
+    "\n        <td>Long: -XX°XX'XX,XXX\"<br>Lat: -XX°XX'XX,XXX\"<br>Alt: XXX,XX</td>"
+    "\n        <td>Long: XX°XX'XX,XXX\" W<br>Lat: XX°XX'XX,XXX\" S<br>Alt: XXX,XX</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n    <!-- ADICIONE UMA LINHA PARA CADA VÉRTICE (V2, V3, V4... até o último!) -->"
+    "\n    <!-- NÃO OMITA NENHUM VÉRTICE! -->"
+    "\n</tbody>"
+    "\n</table>"
+    "\n<p class='analise'><strong>Análise:</strong> [Comentário sobre consistência das coordenadas]</p>"
+    "\n"
+    "\n<!-- SEÇÃO 4: SEGMENTO VANTE -->"
+    "\n<h2>📐 4. SEGMENTO VANTE</h2>"
+    "\n<table class='secao-vertices'>"
+    "\n<thead>"
+    "\n    <tr>"
+    "\n        <th>SEGMENTO</th>"
+    "\n        <th>INCRA (Azimute/Dist./Confrontações)</th>"
+    "\n        <th>PROJETO (Azimute/Dist.)</th>"
+    "\n        <th style='text-align:center;'>STATUS</th>"
+    "\n    </tr>"
+    "\n</thead>"
+    "\n<tbody>"
+    "\n    <tr>"
+    "\n        <td><strong>S1</strong></td>"
+    "\n        <td>[Az=XXX° Dist=YY.YYm Conf=...]</td>"
+    "\n        <td>[Az=XXX° Dist=YY.YYm]</td>"
+    "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
+    "\n    </tr>"
+    "\n    <!-- ADICIONE UMA LINHA PARA CADA SEGMENTO VANTE (S2, S3, S4... até o último!) -->"
+    "\n    <!-- NÃO OMITA NENHUM SEGMENTO! -->"
+    "\n</tbody>"
+    "\n</table>"
+    "\n<p class='analise'><strong>Análise:</strong> [Comentário sobre consistência dos segmentos vante]</p>"
+    "\n"
+    "\n<!-- LEGENDA -->"
+    "\n<div class='legenda'>"
+    "\n    <h3>LEGENDA DE STATUS</h3>"
+    "\n    <p><span class='status-ok'>✅</span> = Dados idênticos e corretos</p>"
+    "\n    <p><span class='status-alerta'>⚠️</span> = Pequena diferença (revisar, mas não bloqueia)</p>"
+    "\n    <p><span class='status-erro'>❌</span> = Erro grave (correção obrigatória)</p>"
+    "\n</div>"
+    "\n"
+    "\n<hr>"
+    "\n<p style='text-align:center; color:#888; margin-top:30px;'><em>Relatório gerado por IA - Verificação humana sempre recomendada</em></p>"
+    "\n"
+    "\n</div>"
+    "\n</body>"
+    "\n</html>"
+    "\n```"
+    "\n"
+    "\n⚠️ LEMBRE-SE:"
+    "\n- Use <span class='status-ok'>✅</span> para dados corretos"
+    "\n- Use <span class='status-alerta'>⚠️</span> para pequenas diferenças"
+    "\n- Use <span class='status-erro'>❌</span> para erros graves"
+    "\n- Liste TODOS os vértices encontrados na tabela de coordenadas"
+    "\n- Liste TODOS os segmentos vante encontrados"
+    "\n- Compare INCRA x PROJETO em todas as seções"
+)
+
+
 class VerificadorGeorreferenciamento:
     """Classe principal da aplicação de verificação de documentos."""
     
@@ -47,6 +1241,10 @@ class VerificadorGeorreferenciamento:
         # Variáveis para armazenar imagens processadas
         self.incra_images: List[Image.Image] = []
         self.projeto_images: List[Image.Image] = []
+
+        # Modelo do Gemini reutilizado entre análises (recriado se a API Key mudar)
+        self._gemini_model = None
+        self._gemini_api_key_configurada: Optional[str] = None
         
         self._criar_interface()
         
@@ -271,26 +1469,33 @@ class VerificadorGeorreferenciamento:
         self.btn_comparar.config(state='normal')
         self.btn_comparacao_manual.config(state='normal')
         
-    def _carregar_pdf_como_imagens(self, pdf_path: str, rotacionar_90: bool = False) -> List[Image.Image]:
+    def _carregar_pdf_como_imagens(self, pdf_path: str, rotacionar_90: bool = False,
+                                   dpi: int = 100) -> List[Image.Image]:
         """
         Converte um PDF em lista de imagens PIL.
         
         Args:
             pdf_path: Caminho do arquivo PDF
             rotacionar_90: Se True, rotaciona as imagens 90 graus (para INCRA)
+            dpi: Resolução da conversão. 100 DPI basta para o Gemini, que reduz
+                as imagens internamente; a comparação manual usa 150 DPI.
             
         Returns:
             Lista de objetos PIL.Image
         """
+        # Executado em paralelo pelas threads de _executar_analise_gemini:
+        # não atualiza a barra de status (quem chama informa o progresso)
         try:
-            self._atualizar_status(f"Convertendo PDF: {Path(pdf_path).name}...")
-            
             # Converter PDF para imagens
-            images = convert_from_path(pdf_path, dpi=200)
+            images = convert_from_path(
+                pdf_path,
+                dpi=dpi,
+                thread_count=POPPLER_THREADS,
+                use_pdftocairo=True
+            )
             
             # Rotacionar se necessário (INCRA em paisagem)
             if rotacionar_90:
-                self._atualizar_status(f"Rotacionando imagens do INCRA...")
                 images = [img.rotate(-90, expand=True) for img in images]
                 
             return images
@@ -305,1180 +1510,20 @@ class VerificadorGeorreferenciamento:
         Returns:
             Lista contendo strings de texto e objetos PIL.Image para comparação INCRA vs Projeto
         """
-        prompt = [
-            "Você é um assistente ESPECIALISTA em análise de documentos de georreferenciamento de imóveis rurais para cartórios no Brasil.",
-            "\n═══════════════════════════════════════════════════════════",
-            "\n=== INSTRUÇÕES CRÍTICAS DE EXTRAÇÃO ===",
-            "\n═══════════════════════════════════════════════════════════",
-            "\n",
-            "\n⚠️⚠️⚠️ ATENÇÃO MÁXIMA - ERROS COMUNS A EVITAR ⚠️⚠️⚠️",
-            "\n",
-            "\n❌ NÃO CONFUNDA:",
-            "\n1. CPF (formato XXX.XXX.XXX-XX) ≠ Código INCRA (formato XXX.XXX.XXX.XXX-X)",
-            "\n   • CPF: 765.656.618-04 (pessoa física)",
-            "\n   • Código INCRA: 951.742.953-1 (imóvel rural)",
-            "\n   • São COMPLETAMENTE diferentes!",
-            "\n",
-            "\n2. Nomes de proprietários DIFERENTES = STATUS ❌ (não ⚠️!)",
-            "\n   • 'PAULO EDUARDO HOTZ' ≠ 'Paulo Gemma Henge'",
-            "\n   • São PESSOAS DIFERENTES! Marque como ❌ ERRO GRAVE!",
-            "\n   • Não diga 'pequena divergência' - é ERRO TOTAL!",
-            "\n",
-            "\n3. Memorial em texto corrido TEM perímetro - PROCURE NO TEXTO!",
-            "\n   • Busque por: 'perímetro de X metros' ou 'perímetro de X m'",
-            "\n   • Exemplo: 'Perímetro (m): 3.873,67 m' ou 'perímetro de 3.873,67 metros'",
-            "\n   • Se encontrar, extraia! Não diga 'Não encontrado'!",
-            "\n",
-            "\n4. Projeto/Planta tem TABELAS - LEIA A TABELA COMPLETA!",
-            "\n   • Projetos em PDF digital têm tabelas de coordenadas",
-            "\n   • Procure por colunas: Código, Longitude, Latitude, Altitude",
-            "\n   • Ou: Código, E (Este), N (Norte)",
-            "\n   • EXTRAIA TODOS OS VÉRTICES DA TABELA!",
-            "\n   • Não invente coordenadas - copie da tabela!",
-            "\n",
-            "\n**FORMATO DOS DOCUMENTOS:**",
-            "\n1. 📋 INCRA: Dados em TABELAS - extraia TODAS as células com precisão",
-            "\n2. 🗺️ PROJETO/PLANTA: ",
-            "\n   • Se for PDF DIGITAL (texto selecionável): TEM TABELAS! Leia-as!",
-            "\n   • Se for ESCANEADO (imagem): Extraia visualmente",
-            "\n   • Procure por 'Tabela de Coordenadas' ou grade com vértices",
-            "\n   • NO PROJETO que você está analisando agora: HÁ UMA TABELA NO CANTO!",
-            "\n",
-            "\n**⚠️ ATENÇÃO MÁXIMA AO LER PROJETO/PLANTA:**",
-            "\n",
-            "\n🎯 O PROJETO TEM UMA TABELA! Exemplo:",
-            "\n```",
-            "\nCódigo      | Longitude        | Latitude         | Altitude",
-            "\nAKE-V-0166  | 48°34'14,782\" W | 20°50'45,291\" S | 532,78",
-            "\nAKE-M-1028  | 48°34'13,821\" W | 20°50'46,394\" S | 533,92",
-            "\n```",
-            "\n",
-            "\nOU formato UTM:",
-            "\n```",
-            "\nCódigo      | E (Este)  | N (Norte)",
-            "\nAKE-V-0166  | 741319    | 7696237",
-            "\n```",
-            "\n",
-            "\nVocê DEVE:",
-            "\n✅ Procurar pela tabela (geralmente no canto ou no topo)",
-            "\n✅ Ler TODAS as linhas da tabela",
-            "\n✅ Extrair TODOS os vértices listados",
-            "\n✅ Copiar coordenadas EXATAMENTE como na tabela",
-            "\n✅ Se houver 26 vértices na tabela, liste os 26!",
-            "\n✅ NÃO invente coordenadas - só o que está na tabela",
-            "\n",
-            "\n**EQUIVALÊNCIAS SEMÂNTICAS (MUITO IMPORTANTE!):**",
-            "\n- '19,0211 ha' = 'Área: 19.0211 hectares' = 'ÁREA TOTAL (ha): 19,0211'",
-            "\n- 'José da Silva' = 'Sr. José da Silva' = 'JOSÉ DA SILVA' = 'Jose da Silva'",
-            "\n- Vírgula e ponto decimal são equivalentes: 19,02 = 19.02",
-            "\n- Espaços e formatação diferentes não importam",
-            "\n",
-            "\n**⚠️ MAS ATENÇÃO - QUANDO NÃO É EQUIVALENTE:**",
-            "\n- 'PAULO EDUARDO HOTZ' ≠ 'Paulo Gemma Henge' → São PESSOAS DIFERENTES! Status = ❌",
-            "\n- '951.742.953-1' ≠ '765.656.618-04' → Um é Código INCRA, outro é CPF! Status = ❌",
-            "\n- '3.873,67 m' ≠ 'Não encontrado' → Um tem valor, outro não! Status = ❌",
-            "\n- 'Latitude/Longitude' ≠ 'UTM' → Sistemas DIFERENTES! Status = ⚠️",
-            "\n",
-            "\n**⚠️ ATENÇÃO ESPECIAL - INFORMAÇÕES PARCIAIS:**",
-            "\n- Se um documento tem TEXTO PARCIAL de outro, isso NÃO é igual!",
-            "\n- Quando encontrar casos assim, marque como <span class='status-alerta'>⚠️</span>",
-            "\n- E adicione observação: 'VERIFICAR: Um documento tem informação mais completa'",
-            "\n- O usuário DEVE verificar manualmente se a informação adicional é relevante",
-            "\n",
-            "\n**DADOS QUE VOCÊ DEVE EXTRAIR DE CADA DOCUMENTO:**",
-            "\n",
-            "\n✅ **DADOS BÁSICOS:**",
-            "\n   • Proprietário(s) - nome completo EXATO",
-            "\n   • Nome do Imóvel/Propriedade",
-            "\n   • Matrícula(s) do cartório",
-            "\n   • Município e Estado (UF)",
-            "\n   • Código INCRA (código de certificação) - NÃO CONFUNDA COM CPF!",
-            "\n   • CCIR (se houver)",
-            "\n   • Cartório/CNS",
-            "\n",
-            "\n✅ **DADOS TÉCNICOS:**",
-            "\n   • Área Total em hectares (todas as casas decimais)",
-            "\n   • Perímetro em metros",
-            "\n   • Sistema de coordenadas (UTM/Geográfico/SIRGAS)",
-            "\n   • Datum (SIRGAS2000, SAD69, etc)",
-            "\n",
-            "\n✅ **VÉRTICES E COORDENADAS - ⚠️ MÁXIMA ATENÇÃO:**",
-            "\n   • TODOS os vértices (V1, V2, V3, V4, V5, V6...)",
-            "\n   • Códigos COMPLETOS dos vértices (ex: NCXC-P-1032, YGGA-M-0046, AKE-V-0166)",
-            "\n   • ⚠️ COPIE O CÓDIGO EXATAMENTE LETRA POR LETRA!",
-            "\n   • Coordenadas COMPLETAS de cada vértice:",
-            "\n     - Longitude (ex: -48°40'19,003\") OU E=741319 (UTM)",
-            "\n     - Latitude (ex: -21°00'03,754\") OU N=7696237 (UTM)",
-            "\n     - Altitude se houver (ex: 509,05 m)",
-            "\n   • CRÍTICO: Não omita vértices! Liste TODOS que encontrar!",
-            "\n   • No Projeto, os vértices estão em TABELAS:",
-            "\n     Procure por tabela com colunas: Código | Longitude | Latitude | Altitude",
-            "\n     Ou: Código | E | N",
-            "\n",
-            "\n✅ **CONFRONTANTES/LIMITES:**",
-            "\n   • Norte: [quem/o quê]",
-            "\n   • Sul: [quem/o quê]",
-            "\n   • Leste: [quem/o quê]",
-            "\n   • Oeste: [quem/o quê]",
-            "\n",
-            "\n--- INÍCIO DOCUMENTO INCRA ---",
-            "\n",
-            "\n🚨🚨🚨 ALERTA CRÍTICO - CÓDIGOS DOS VÉRTICES 🚨🚨🚨",
-            "\n",
-            "\n⚠️⚠️⚠️ PROBLEMA COMUM DE OCR:",
-            "\nO OCR frequentemente CONFUNDE a letra 'K' com 'M'!",
-            "\n",
-            "\n❌ ERRO GRAVÍSSIMO:",
-            "\n   AME-V-0166  ← ERRADO! (K virou M)",
-            "\n   AME-M-1028  ← ERRADO! (K virou M)",
-            "\n   AME-P-3567  ← ERRADO! (K virou M)",
-            "\n",
-            "\n✅ CÓDIGOS CORRETOS:",
-            "\n   AKE-V-0166  ← CORRETO! (com K)",
-            "\n   AKE-M-1028  ← CORRETO! (com K)",
-            "\n   AKE-P-3567  ← CORRETO! (com K)",
-            "\n",
-            "\n🔍 COMO IDENTIFICAR:",
-            "\nOlhe com ATENÇÃO EXTREMA para as primeiras 3 letras do código:",
-            "\n• Se parece 'AME' → É ERRO! Deve ser 'AKE'",
-            "\n• Se parece 'AXE' → É ERRO! Deve ser 'AKE'",
-            "\n• Se parece 'AKF' → É ERRO! Deve ser 'AKE'",
-            "\n",
-            "\n💡 DICA:",
-            "\nNeste documento, o código de credenciamento é 'AKE'.",
-            "\nPORTANTO, TODOS os vértices começam com 'AKE-'!",
-            "\n",
-            "\n⚠️ NUNCA NUNCA NUNCA escreva 'AME'!",
-            "\n⚠️ SEMPRE escreva 'AKE' com a letra K!",
-            "\n",
-            "\n🎯 EXTRAÇÃO ESPECÍFICA DO INCRA - INSTRUÇÕES CIRÚRGICAS",
-            "\n",
-            "\n════════════════════════════════════════════════════════════",
-            "\n                PARTE 1: DADOS CADASTRAIS                   ",
-            "\n════════════════════════════════════════════════════════════",
-            "\n",
-            "\nExtraia APENAS as seguintes informações, NESTA ORDEM:",
-            "\n",
-            "\n1️⃣ **Denominação:**",
-            "\n   • PROCURE: Linha que começa com 'Denominação:'",
-            "\n   • EXTRAIA: SOMENTE o nome do imóvel",
-            "\n   • REMOVA: Qualquer menção a 'Área X', 'Matrícula', números",
-            "\n   • EXEMPLO:",
-            "\n     ❌ Errado: 'Fazenda Monte Rosa - Área 2 – Matrícula n° 27.935'",
-            "\n     ✅ Correto: 'Fazenda Monte Rosa'",
-            "\n",
-            "\n2️⃣ **Proprietário(a):**",
-            "\n   • PROCURE: Linha que começa com 'Proprietário(a):'",
-            "\n   • EXTRAIA: Nome completo do proprietário",
-            "\n   • EXEMPLO: 'RENÊ EDUARDO HOTZ'",
-            "\n",
-            "\n3️⃣ **Matrícula do imóvel:**",
-            "\n   • PROCURE: Linha 'Matrícula do imóvel:'",
-            "\n   • ATENÇÃO: Pode ter continuação na página 3!",
-            "\n   • EXTRAIA: TODOS os números de matrícula",
-            "\n   • EXEMPLO: '28625, 28626, 27935, 27936, 11798'",
-            "\n   • LEMBRE: Procurar também: 'continuação da página 1: ...'",
-            "\n",
-            "\n4️⃣ **Município/UF:**",
-            "\n   • PROCURE: 'Município/UF:'",
-            "\n   • EXTRAIA: Nome do município e UF",
-            "\n   • EXEMPLO: 'Bebedouro-SP'",
-            "\n",
-            "\n5️⃣ **Código de credenciamento:**",
-            "\n   • PROCURE: 'Código de credenciamento:'",
-            "\n   • EXTRAIA: O código (geralmente 3 letras)",
-            "\n   • EXEMPLO: 'AKE'",
-            "\n",
-            "\n6️⃣ **Código INCRA/SNCR:**",
-            "\n   • PROCURE: 'Código INCRA/SNCR:'",
-            "\n   • EXTRAIA: Código completo",
-            "\n   • EXEMPLO: '6120730013504'",
-            "\n   • ⚠️ NÃO confunda com CPF!",
-            "\n",
-            "\n7️⃣ **Área (Sistema Geodésico Local):**",
-            "\n   • PROCURE: 'Área (Sistema Geodésico Local):'",
-            "\n   • EXTRAIA: Valor e unidade",
-            "\n   • EXEMPLO: '68,7187 ha'",
-            "\n",
-            "\n8️⃣ **Perímetro (m):**",
-            "\n   • PROCURE: 'Perímetro (m):'",
-            "\n   • EXTRAIA: Valor em metros",
-            "\n   • EXEMPLO: '3.873,67 m'",
-            "\n",
-            "\n════════════════════════════════════════════════════════════",
-            "\n              PARTE 2: TABELA DE COORDENADAS                ",
-            "\n════════════════════════════════════════════════════════════",
-            "\n",
-            "\n📊 LOCALIZAÇÃO DA TABELA:",
-            "\n   • Título: 'DESCRIÇÃO DA PARCELA'",
-            "\n   • Tem 2 seções lado a lado:",
-            "\n     - VÉRTICE (esquerda): Código, Longitude, Latitude, Altitude",
-            "\n     - SEGMENTO VANTE (direita): Código, Azimute, Dist.(m), Confrontações",
-            "\n",
-            "\n⚠️ INSTRUÇÕES CRÍTICAS PARA LER A TABELA:",
-            "\n",
-            "\n🚨🚨🚨 REGRA ABSOLUTA - EXTRAÇÃO COMPLETA 🚨🚨🚨",
-            "\n",
-            "\n⛔ ZERO TOLERÂNCIA PARA LINHAS FALTANDO:",
-            "\n• Você DEVE extrair 100% das linhas da tabela",
-            "\n• NÃO pule NENHUMA linha",
-            "\n• NÃO omita NENHUM vértice ou segmento",
-            "\n• MANTENHA a ordem EXATA do documento original",
-            "\n• LEIA linha por linha, da primeira até a ÚLTIMA",
-            "\n• Se a tabela tem 26 linhas, seu relatório DEVE ter 26 linhas",
-            "\n• Se a tabela tem 30 linhas, seu relatório DEVE ter 30 linhas",
-            "\n",
-            "\n📊 MÉTODO DE EXTRAÇÃO LINHA POR LINHA:",
-            "\n1. Comece na primeira linha de dados (após o cabeçalho)",
-            "\n2. Leia e extraia: linha 1, linha 2, linha 3, linha 4...",
-            "\n3. Continue SEM PULAR até a última linha",
-            "\n4. CONTE quantas linhas você extraiu",
-            "\n5. VERIFIQUE: O número de linhas extraídas = número de linhas na tabela?",
-            "\n6. Se NÃO, VOLTE e extraia as linhas que faltam!",
-            "\n",
-            "\n✅ VERIFICAÇÃO OBRIGATÓRIA:",
-            "\nApós a extração, PERGUNTE A SI MESMO:",
-            "\n• Quantas linhas de vértices tem na tabela? _____",
-            "\n• Quantas linhas de vértices eu extraí? _____",
-            "\n• Os números são IGUAIS? Se NÃO, falta algo!",
-            "\n",
-            "\n════════════════════════════════════════════════════════════",
-            "\n      🎯 ESTRATÉGIA DE EXTRAÇÃO EM DUAS ETAPAS 🎯",
-            "\n════════════════════════════════════════════════════════════",
-            "\n",
-            "\n🚨🚨🚨 IMPORTANTE: O INCRA É A FONTE DE VERDADE! 🚨🚨🚨",
-            "\n",
-            "\n📋 ETAPA 1 - EXTRAIR CÓDIGOS DO INCRA PRIMEIRO:",
-            "\n",
-            "\n1️⃣ ANTES de fazer qualquer comparação, LEIA APENAS a coluna 'Código' do INCRA",
-            "\n2️⃣ Extraia TODOS os códigos da tabela do INCRA em uma lista",
-            "\n3️⃣ Esta lista será sua FONTE DE VERDADE",
-            "\n",
-            "\n💡 POR QUÊ?",
-            "\n• O documento INCRA tem os códigos mais legíveis",
-            "\n• Os códigos do PROJETO são os MESMOS do INCRA",
-            "\n• Os códigos do SEGMENTO VANTE também são os MESMOS",
-            "\n",
-            "\n✅ EXEMPLO DE LISTA DE CÓDIGOS:",
-            "\nVÉRTICES:",
-            "\n  AKE-V-0166  ← Primeiro vértice",
-            "\n  AKE-M-1028",
-            "\n  AKE-M-1029",
-            "\n  AKE-M-1087  ← ⚠️ É 1087, NÃO 1098 ou 1069!",
-            "\n  AKE-M-1088  ← ⚠️ É 1088, NÃO 1099 ou 1089!",
-            "\n  AKE-P-3567",
-            "\n  AKE-P-3568",
-            "\n  AKE-P-3569",
-            "\n  ...",
-            "\n  AKE-P-3584",
-            "\n  AKE-P-3585",
-            "\n  AKE-P-3586  ← Último vértice (número mais alto)",
-            "\n",
-            "\n🚨🚨🚨 REGRA IMPORTANTE - SEQUÊNCIA DE CÓDIGOS 🚨🚨🚨",
-            "\n",
-            "\n⚠️ CÓDIGOS SEGUEM ORDEM CRESCENTE:",
-            "\n• Se começa com 1028, continua: 1029, 1030, 1087, 1088...",
-            "\n• Se está em 3567, continua: 3568, 3569, 3570... 3584, 3585, 3586",
-            "\n• Números SEMPRE CRESCEM, NUNCA VOLTAM!",
-            "\n• Se chegou em AKE-P-3586, o próximo NÃO pode ser AKE-V-0166",
-            "\n",
-            "\n⚠️ O PRIMEIRO VÉRTICE NÃO É O ÚLTIMO:",
-            "\n• Primeiro vértice: AKE-V-0166 (número baixo: 0166)",
-            "\n• Último vértice: AKE-P-3586 (número alto: 3586)",
-            "\n• ❌ ERRADO: ...AKE-P-3585, AKE-P-3586, AKE-V-0166 (0166 < 3586!)",
-            "\n• ✅ CORRETO: ...AKE-P-3585, AKE-P-3586 (para aqui!)",
-            "\n",
-            "\n💡 NOTA SOBRE FECHAMENTO DE POLÍGONO:",
-            "\n• Algumas tabelas mostram o primeiro vértice novamente no FINAL",
-            "\n• Isso é apenas para indicar que o polígono fecha",
-            "\n• Mas na LISTA DE CÓDIGOS, NÃO repita o primeiro!",
-            "\n• Exemplo: Se tem 26 vértices, liste 26 códigos únicos",
-            "\n",
-            "\nSEGMENTO VANTE:",
-            "\n  (mesmos códigos, na segunda parte da tabela INCRA)",
-            "\n",
-            "\n📋 ETAPA 2 - USAR CÓDIGOS DE REFERÊNCIA NO PROJETO:",
-            "\n",
-            "\n1️⃣ Quando for ler a tabela do PROJETO",
-            "\n2️⃣ Use a LISTA DE CÓDIGOS do INCRA como referência",
-            "\n3️⃣ Procure no PROJETO as coordenadas correspondentes a cada código",
-            "\n4️⃣ Os códigos são IDÊNTICOS nos dois documentos",
-            "\n",
-            "\n🔴 NÃO FAÇA OCR dos códigos do Projeto se não tiver certeza!",
-            "\n🟢 USE os códigos do INCRA como referência!",
-            "\n",
-            "\n════════════════════════════════════════════════════════════",
-            "\n",
-            "\n1. LOCALIZE a tabela 'DESCRIÇÃO DA PARCELA'",
-            "\n",
-            "\n2. A tabela tem este formato:",
-            "\n┌─────────────┬────────────────┬────────────────┬─────────────┐",
-            "\n│ VÉRTICE                                                      │",
-            "\n├─────────────┼────────────────┼────────────────┼─────────────┤",
-            "\n│ Código      │ Longitude      │ Latitude       │ Altitude(m) │",
-            "\n├─────────────┼────────────────┼────────────────┼─────────────┤",
-            "\n│ AKE-V-0166  │ -48°34'14,782\" │ -20°50'45,291\" │ 532,78      │",
-            "\n└─────────────┴────────────────┴────────────────┴─────────────┘",
-            "\n",
-            "\n┌─────────────┬─────────┬──────────┬─────────────────────────┐",
-            "\n│ SEGMENTO VANTE                                              │",
-            "\n├─────────────┼─────────┼──────────┼─────────────────────────┤",
-            "\n│ Código      │ Azimute │ Dist.(m) │ Confrontações           │",
-            "\n├─────────────┼─────────┼──────────┼─────────────────────────┤",
-            "\n│ AKE-M-1028  │ 140°40' │ 43,85    │ CNS: 12.102-0 | Mat...  │",
-            "\n└─────────────┴─────────┴──────────┴─────────────────────────┘",
-            "\n",
-            "\n3. COPIE os códigos dos vértices EXATAMENTE - CARACTERE POR CARACTERE:",
-            "\n   🚨🚨🚨 EXTREMAMENTE IMPORTANTE: NÃO INVENTE CÓDIGOS! 🚨🚨🚨",
-            "\n   • Copie o que ESTÁ ESCRITO, não o que você ACHA que deveria estar!",
-            "\n   • Exemplo: AKE-V-0166, AKE-M-1028, AKE-P-3567",
-            "\n   • ⚠️ NÃO troque letras: AKE ≠ AME ≠ AXE ≠ AKF",
-            "\n   • ⚠️ NÃO troque números: 1028 ≠ 1008 ≠ 1128 ≠ 1030",
-            "\n   • ⚠️ Se está 1087, copie 1087 (NÃO mude para 1030!)",
-            "\n   • ⚠️ Se está 1088, copie 1088 (NÃO omita!)",
-            "\n   • ⚠️ Mantenha hífens: AKE-P-3567 (não AKE P 3567)",
-            "\n   • ⚠️⚠️⚠️ UNDERSCORES são DIFERENTES de HÍFENS:",
-            "\n       - Se está AKE_P-3568 (com underscore _), copie AKE_P-3568",
-            "\n       - Se está AKE-P-3568 (com hífen -), copie AKE-P-3568",
-            "\n       - AKE_P ≠ AKE-P (são DIFERENTES!)",
-            "\n   • OLHE COM ATENÇÃO: é hífen (-) ou underscore (_)?",
-            "\n",
-            "\n4. COPIE as coordenadas COM PRECISÃO EXTREMA:",
-            "\n   ",
-            "\n   🎯 MÉTODO DE EXTRAÇÃO - LEIA DEVAGAR, CARACTERE POR CARACTERE:",
-            "\n   ",
-            "\n   📍 LONGITUDE (coluna 2):",
-            "\n   • Formato: -48°34'14,782\"",
-            "\n   • Leia: sinal (-), graus (48), símbolo (°), minutos (34), apóstrofo ('), segundos (14,782), aspas (\")",
-            "\n   • ⚠️ CUIDADO: Os segundos têm VÍRGULA e 3 casas decimais: 14,782",
-            "\n   • ⚠️ NÃO confunda: 14,782 ≠ 14,78 ≠ 14,7",
-            "\n   • ⚠️ NÃO confunda: 34 ≠ 35 ≠ 33",
-            "\n   ",
-            "\n   📍 LATITUDE (coluna 3):",
-            "\n   • Formato: -20°50'45,291\"",
-            "\n   • Leia: sinal (-), graus (20), símbolo (°), minutos (50), apóstrofo ('), segundos (45,291), aspas (\")",
-            "\n   • ⚠️ CUIDADO: Os segundos têm VÍRGULA e 3 casas decimais: 45,291",
-            "\n   • ⚠️ NÃO confunda: 45,291 ≠ 45,29 ≠ 45,2",
-            "\n   • ⚠️ NÃO confunda: 50 ≠ 51 ≠ 49",
-            "\n   ",
-            "\n   📍 ALTITUDE (coluna 4):",
-            "\n   • Formato: 532,78",
-            "\n   • Número com vírgula e 2 casas decimais",
-            "\n   • ⚠️ CUIDADO: 532,78 ≠ 532,77 ≠ 533,78",
-            "\n   ",
-            "\n   🚨🚨🚨 ATENÇÃO MÁXIMA:",
-            "\n   • Coordenadas são EXTREMAMENTE PRECISAS",
-            "\n   • Um erro de 1 segundo = ~30 metros de diferença no terreno!",
-            "\n   • LEIA DEVAGAR, confira DUAS VEZES cada número",
-            "\n   • Use ZOOM na imagem se necessário",
-            "\n   ",
-            "\n   📍 IMPORTANTE PARA COMPARAÇÃO:",
-            "\n   🚨 O INCRA tem sinal negativo (-) antes das coordenadas",
-            "\n   🚨 O PROJETO NÃO tem sinal negativo, usa W/S no final",
-            "\n   🚨 Na comparação, IGNORE o sinal negativo!",
-            "\n   ",
-            "\n   ✅ EXEMPLOS EQUIVALENTES (são a MESMA coordenada):",
-            "\n   • INCRA: -48°34'14,782\"  ≡  PROJETO: 48°34'14,782\" W",
-            "\n   • INCRA: -20°50'45,291\"  ≡  PROJETO: 20°50'45,291\" S",
-            "\n   ",
-            "\n   💡 Ao comparar:",
-            "\n   1. Ignore o sinal negativo (-) do INCRA",
-            "\n   2. Ignore a letra W/S do PROJETO",
-            "\n   3. Compare apenas os números: 48°34'14,782\" = 48°34'14,782\"",
-            "\n   4. Verifique TODAS as casas decimais: 14,782 deve ser exatamente 14,782",
-            "\n",
-            "\n5. REPRODUZA A TABELA COMPLETA - CONTAGEM OBRIGATÓRIA:",
-            "\n   ",
-            "\n   🚨 CRÍTICO: A tabela continua em MÚLTIPLAS PÁGINAS!",
-            "\n   • Página 1 do INCRA: Primeiros ~16-18 vértices",
-            "\n   • Página 2 do INCRA: Vértices restantes (~8-10)",
-            "\n   • TOTAL: ~26 vértices (ou mais)",
-            "\n   ",
-            "\n   📊 MÉTODO DE CONTAGEM:",
-            "\n   1. Leia a primeira linha após o cabeçalho",
-            "\n   2. CONTE: linha 1, linha 2, linha 3, linha 4...",
-            "\n   3. Continue até NÃO haver mais linhas",
-            "\n   4. Anote o total: \"Encontrei __ linhas\"",
-            "\n   5. Verifique: O último código tem número MAIOR que o primeiro?",
-            "\n   ",
-            "\n   ⚠️⚠️⚠️ ATENÇÃO COM O FECHAMENTO:",
-            "\n   • Algumas tabelas repetem o PRIMEIRO vértice no final",
-            "\n   • Isso serve para \"fechar o polígono\" visualmente",
-            "\n   • MAS você NÃO deve contar essa linha repetida!",
-            "\n   ",
-            "\n   ✅ EXEMPLO CORRETO:",
-            "\n   Linha 1: AKE-V-0166 (primeiro - número 0166)",
-            "\n   Linha 2: AKE-M-1028",
-            "\n   ...",
-            "\n   Linha 25: AKE-P-3585",
-            "\n   Linha 26: AKE-P-3586 (último - número 3586)",
-            "\n   [Linha extra: AKE-V-0166] ← NÃO CONTE ESTA! É repetição!",
-            "\n   Total de vértices únicos: 26",
-            "\n   ",
-            "\n   ❌ EXEMPLO ERRADO:",
-            "\n   Linha 25: AKE-P-3585",
-            "\n   Linha 26: AKE-P-3586",
-            "\n   Linha 27: AKE-V-0166 ← ERRO! 0166 < 3586 (voltou!)",
-            "\n   ",
-            "\n   💡 REGRA SIMPLES:",
-            "\n   • Se o código tem número MENOR que o anterior = É REPETIÇÃO",
-            "\n   • Pare de contar quando o número voltar ao início",
-            "\n   ",
-            "\n   ⚠️ NUNCA pare de ler na página 1!",
-            "\n   ⚠️ SEMPRE verifique se há mais páginas!",
-            "\n   ⚠️ Se você extraiu 25 vértices, PROCURE O 26º!",
-            "\n   ",
-            "\n   🚨🚨🚨 ATENÇÃO ESPECIAL - O ÚLTIMO CÓDIGO:",
-            "\n   ⚠️⚠️⚠️ O ÚLTIMO CÓDIGO É O MAIS IMPORTANTE! ⚠️⚠️⚠️",
-            "\n   ",
-            "\n   • Você DEVE encontrar e extrair o ÚLTIMO código da tabela",
-            "\n   • Procure na SEGUNDA PÁGINA do INCRA!",
-            "\n   • O último código tem o NÚMERO MAIS ALTO",
-            "\n   • Exemplo: Se tem AKE-P-3586, esse é o ÚLTIMO (3586 é o maior)",
-            "\n   • NÃO PODE FALTAR! Isso é CRÍTICO!",
-            "\n   ",
-            "\n   ✅ VERIFICAÇÃO DO ÚLTIMO CÓDIGO:",
-            "\n   1. Qual é o último código que extraí? _______",
-            "\n   2. Esse código tem o número mais alto da tabela? SIM/NÃO",
-            "\n   3. Verifiquei a segunda página do INCRA? SIM/NÃO",
-            "\n   4. Há alguma linha depois desse código? SIM/NÃO",
-            "\n   ",
-            "\n   🔴 Se alguma resposta não estiver certa, PROCURE NOVAMENTE!",
-            "\n",
-            "\n5.5 🚨🚨🚨 MÉTODO RIGOROSO DE OCR - LINHA POR LINHA, CÉLULA POR CÉLULA 🚨🚨🚨",
-            "\n   ",
-            "\n   ⚠️⚠️⚠️ CRÍTICO: A maioria dos erros está nos NÚMEROS! ⚠️⚠️⚠️",
-            "\n   ",
-            "\n   📋 PROCESSO OBRIGATÓRIO - SIGA EXATAMENTE:",
-            "\n   ",
-            "\n   PARA CADA LINHA DA TABELA:",
-            "\n   ",
-            "\n   PASSO 1 - EXTRAIR CÓDIGO (coluna 1):",
-            "\n   └─ Leia o código completo: AKE-X-XXXX",
-            "\n   └─ Anote mentalmente: \"Código = _______\"",
-            "\n   ",
-            "\n   PASSO 2 - EXTRAIR LONGITUDE (coluna 2):",
-            "\n   🎯 FOQUE EXCLUSIVAMENTE nesta célula!",
-            "\n   ",
-            "\n   A. Isole visualmente APENAS a célula de Longitude",
-            "\n   B. Ignore todas as outras colunas temporariamente",
-            "\n   C. Leia DEVAGAR, parte por parte:",
-            "\n      ",
-            "\n      Formato: -48°34'14,782\"",
-            "\n      └─ Sinal: - (tem ou não tem?)",
-            "\n      └─ Graus: __ (2 dígitos)",
-            "\n      └─ Símbolo: °",
-            "\n      └─ Minutos: __ (2 dígitos)",
-            "\n      └─ Apóstrofo: '",
-            "\n      └─ Segundos INTEIROS: __ (2 dígitos)",
-            "\n      └─ Vírgula: ,",
-            "\n      └─ Segundos DECIMAIS: ___ (EXATAMENTE 3 dígitos!)",
-            "\n      └─ Aspas: \"",
-            "\n   ",
-            "\n   D. Leia OS SEGUNDOS 2 VEZES para confirmar:",
-            "\n      └─ Primeira leitura: __.___",
-            "\n      └─ Segunda leitura: __.___",
-            "\n      └─ São IGUAIS? Se NÃO, leia uma TERCEIRA vez!",
-            "\n   ",
-            "\n   E. Verifique:",
-            "\n      ✓ Tem EXATAMENTE 3 dígitos após a vírgula?",
-            "\n      ✓ Exemplo: 14,782 (não 14,78!)",
-            "\n   ",
-            "\n   PASSO 3 - EXTRAIR LATITUDE (coluna 3):",
-            "\n   🎯 FOQUE EXCLUSIVAMENTE nesta célula!",
-            "\n   ",
-            "\n   A. Isole visualmente APENAS a célula de Latitude",
-            "\n   B. Ignore todas as outras colunas temporariamente",
-            "\n   C. Leia DEVAGAR, parte por parte:",
-            "\n      ",
-            "\n      Formato: -20°50'45,291\"",
-            "\n      └─ Sinal: - (tem ou não tem?)",
-            "\n      └─ Graus: __ (2 dígitos)",
-            "\n      └─ Símbolo: °",
-            "\n      └─ Minutos: __ (2 dígitos)",
-            "\n      └─ Apóstrofo: '",
-            "\n      └─ Segundos INTEIROS: __ (2 dígitos)",
-            "\n      └─ Vírgula: ,",
-            "\n      └─ Segundos DECIMAIS: ___ (EXATAMENTE 3 dígitos!)",
-            "\n      └─ Aspas: \"",
-            "\n   ",
-            "\n   D. Leia OS SEGUNDOS 2 VEZES para confirmar:",
-            "\n      └─ Primeira leitura: __.___",
-            "\n      └─ Segunda leitura: __.___",
-            "\n      └─ São IGUAIS? Se NÃO, leia uma TERCEIRA vez!",
-            "\n   ",
-            "\n   E. Verifique:",
-            "\n      ✓ Tem EXATAMENTE 3 dígitos após a vírgula?",
-            "\n      ✓ Exemplo: 45,291 (não 45,29!)",
-            "\n   ",
-            "\n   PASSO 4 - EXTRAIR ALTITUDE (coluna 4):",
-            "\n   🚨🚨🚨 ESTA É A MAIS DIFÍCIL! ATENÇÃO MÁXIMA! 🚨🚨🚨",
-            "\n   ",
-            "\n   A. Isole visualmente APENAS a célula de Altitude",
-            "\n   B. Ignore COMPLETAMENTE as outras colunas",
-            "\n   C. Leia dígito por dígito:",
-            "\n      ",
-            "\n      Formato: XXX,XX",
-            "\n      └─ Centenas: _ (é 5 ou 6? é 3 ou 8?)",
-            "\n      └─ Dezenas: _ (é 3 ou 8? é 2 ou 7?)",
-            "\n      └─ Unidades: _ (é 2 ou 7? é 4 ou 9?)",
-            "\n      └─ Vírgula: ,",
-            "\n      └─ Decimal 1: _ (é 7 ou 1?)",
-            "\n      └─ Decimal 2: _ (SEMPRE tem! não omita!)",
-            "\n   ",
-            "\n   D. Leia O NÚMERO COMPLETO 3 VEZES:",
-            "\n      └─ 1ª leitura: ___,__",
-            "\n      └─ 2ª leitura: ___,__",
-            "\n      └─ 3ª leitura: ___,__",
-            "\n      └─ As 3 são IGUAIS? Se NÃO, leia MAIS vezes!",
-            "\n   ",
-            "\n   E. Pares confusos - MUITO CUIDADO:",
-            "\n      • 5 ou 6? → Olhe o formato da curva",
-            "\n      • 3 ou 8? → 8 tem dois círculos, 3 tem um",
-            "\n      • 2 ou 7? → 7 tem traço horizontal em cima",
-            "\n      • 1 ou 7? → 1 é reto, 7 tem ângulo",
-            "\n   ",
-            "\n   F. Verificação cruzada:",
-            "\n      • Compare com altitude da linha anterior",
-            "\n      • Altitudes variam pouco: 530-540 geralmente",
-            "\n      • Se anterior era 532 e você leu 597 → ERRO!",
-            "\n   ",
-            "\n   PASSO 5 - ANOTAR A LINHA COMPLETA:",
-            "\n   └─ Código: _______",
-            "\n   └─ Longitude: -__°__'__,___\"",
-            "\n   └─ Latitude: -__°__'__,___\"",
-            "\n   └─ Altitude: ___,__",
-            "\n   ",
-            "\n   PASSO 6 - REPETIR PARA A PRÓXIMA LINHA",
-            "\n   ",
-            "\n   🔴 NÃO TENTE LER TUDO DE UMA VEZ!",
-            "\n   🟢 PROCESSE LINHA POR LINHA, CÉLULA POR CÉLULA!",
-            "\n",
-            "\n6. MANTENHA A FORMATAÇÃO:",
-            "\n   • Use espaços/tabs para alinhar colunas",
-            "\n   • Separe seções (VÉRTICE e SEGMENTO VANTE)",
-            "\n   • Mantenha símbolos especiais (°, ', \")",
-            "\n",
-            "\n7. SEGMENTO VANTE - EXTRAÇÃO SEPARADA:",
-            "\n   🚨 IMPORTANTE: O SEGMENTO VANTE deve ser comparado SEPARADAMENTE!",
-            "\n   • No INCRA: É a segunda parte da tabela",
-            "\n   • Colunas: Código, Azimute, Dist.(m), Confrontações",
-            "\n   • O Código do Segmento Vante geralmente é diferente do Código do Vértice",
-            "\n   • Exemplo de linha do Segmento Vante:",
-            "\n     - Código: AKE-M-1028",
-            "\n     - Azimute: 140°40'",
-            "\n     - Distância: 43,85 m",
-            "\n     - Confrontações: CNS: 12.102-0 | Mat. 28309",
-            "\n   • EXTRAIA TODOS os segmentos, não apenas alguns!",
-            "\n",
-            "\n8. CONFRONTANTES DO INCRA:",
-            "\n   • Os confrontantes estão na coluna 'Confrontações' da tabela",
-            "\n   • Exemplo: 'CNS: 12.102-0 | Mat. 28309'",
-            "\n   • Exemplo: 'Estrada Municipal - BBD 315'",
-            "\n   • Exemplo: 'CNS: 12.102-0 | Mat. 34685 | Córrego Lambari'",
-            "\n   • ⚠️ NÃO extraia nomes de pessoas!",
-            "\n   • ✅ Extraia: Matrícula, nome da estrada, córrego, etc.",
-            "\n",
-            "\n════════════════════════════════════════════════════════════",
-            "\n                    FORMATO DE SAÍDA                         ",
-            "\n════════════════════════════════════════════════════════════",
-            "\n",
-            "\nApresente no seguinte formato:",
-            "\n",
-            "\n**DADOS CADASTRAIS:**",
-            "\nDenominação: [valor]",
-            "\nProprietário(a): [valor]",
-            "\nMatrícula do imóvel: [valor]",
-            "\nMunicípio/UF: [valor]",
-            "\nCódigo de credenciamento: [valor]",
-            "\nCódigo INCRA/SNCR: [valor]",
-            "\nÁrea (Sistema Geodésico Local): [valor]",
-            "\nPerímetro (m): [valor]",
-            "\n",
-            "\n**TABELA DE COORDENADAS:**",
-            "\n[Reproduza a tabela completa aqui, mantendo formatação]",
-            "\n",
-            "\nExtraia CADA dado de CADA célula com MÁXIMA PRECISÃO!",
-        ]
-        
+        prompt = [PROMPT_INSTRUCOES_INCRA]
+
         # Adicionar imagens do INCRA
         prompt.extend(self.incra_images)
         prompt.append("\n--- FIM DOCUMENTO INCRA ---")
 
         # Adicionar imagens do Projeto
         if self.projeto_images:
-            prompt.append("\n--- INÍCIO PROJETO/PLANTA ---")
-            prompt.append("\n🎯 ATENÇÃO ESPECIAL PARA ESTE PROJETO:")
-            prompt.append("\nEste é um PDF DIGITAL (não escaneado) - ele contém TABELAS DE DADOS!")
-            prompt.append("\n")
-            prompt.append("\n📊 ONDE ESTÁ A TABELA:")
-            prompt.append("\nProcure por uma tabela com o título:")
-            prompt.append("\n'Tabela de Coordenadas - Altitudes - Azimutes - Distâncias'")
-            prompt.append("\n")
-            prompt.append("\nA tabela tem DUAS partes:")
-            prompt.append("\n")
-            prompt.append("\n📍 PARTE 1 - VÉRTICE:")
-            prompt.append("\n┌──────────┬────────────────┬────────────────┬────────────┐")
-            prompt.append("\n│ Código   │ Longitude      │ Latitude       │ Altitude   │")
-            prompt.append("\n├──────────┼────────────────┼────────────────┼────────────┤")
-            prompt.append("\n│ AKE-V... │ 48°34'14,782\" W│ 20°50'45,291\" S│ 532,78     │")
-            prompt.append("\n└──────────┴────────────────┴────────────────┴────────────┘")
-            prompt.append("\n")
-            prompt.append("\n📐 PARTE 2 - SEGMENTO VANTE (após coluna Altitude):")
-            prompt.append("\n┌──────────┬──────────┬────────────┐")
-            prompt.append("\n│ Azimute  │ Dist.(m) │ Outros     │")
-            prompt.append("\n├──────────┼──────────┼────────────┤")
-            prompt.append("\n│ 140°40'  │ 43,85    │ ...        │")
-            prompt.append("\n└──────────┴──────────┴────────────┘")
-            prompt.append("\n")
-            prompt.append("\n🚨 IMPORTANTE: No Projeto, o SEGMENTO VANTE vem LOGO APÓS a coluna Altitude!")
-            prompt.append("\n   • Procure por colunas: Azimute, Distância (ou Dist.)")
-            prompt.append("\n   • Essas colunas vêm DEPOIS de: Código, Longitude, Latitude, Altitude")
-            prompt.append("\n   • EXTRAIA também essas informações para comparação!")
-            prompt.append("\n")
-            prompt.append("\n🚨🚨🚨 REGRA ABSOLUTA - EXTRAÇÃO COMPLETA (PROJETO) 🚨🚨🚨")
-            prompt.append("\n")
-            prompt.append("\n⛔ ZERO TOLERÂNCIA PARA LINHAS FALTANDO:")
-            prompt.append("\n• Você DEVE extrair 100% das linhas da tabela do PROJETO")
-            prompt.append("\n• NÃO pule NENHUMA linha")
-            prompt.append("\n• NÃO omita NENHUM vértice")
-            prompt.append("\n• MANTENHA a ordem EXATA do documento original")
-            prompt.append("\n• LEIA linha por linha sequencialmente")
-            prompt.append("\n• Conte: Se tem 26 vértices, extraia os 26!")
-            prompt.append("\n")
-            prompt.append("\n📊 MÉTODO DE EXTRAÇÃO SEQUENCIAL:")
-            prompt.append("\n1. Localize a tabela 'Tabela de Coordenadas...'")
-            prompt.append("\n2. Identifique a primeira linha de dados")
-            prompt.append("\n3. Extraia: Linha 1 → Linha 2 → Linha 3 → ... → Última linha")
-            prompt.append("\n4. NÃO pule linhas intermediárias")
-            prompt.append("\n5. CONTE o total de linhas extraídas")
-            prompt.append("\n6. COMPARE com o total na tabela original")
-            prompt.append("\n")
-            prompt.append("\n✅ CHECKLIST DE VERIFICAÇÃO:")
-            prompt.append("\n□ Li TODAS as linhas da tabela?")
-            prompt.append("\n□ A primeira linha está incluída?")
-            prompt.append("\n□ A última linha está incluída?")
-            prompt.append("\n□ Não pulei nenhuma linha do meio?")
-            prompt.append("\n□ A ordem está correta?")
-            prompt.append("\n")
-            prompt.append("\n════════════════════════════════════════════════════════════")
-            prompt.append("\n")
-            prompt.append("\n⚠️ INSTRUÇÕES CRÍTICAS DE EXTRAÇÃO:")
-            prompt.append("\n")
-            prompt.append("\n1. 🔍 LOCALIZE a tabela completa")
-            prompt.append("\n   • Geralmente está no CANTO ESQUERDO da página")
-            prompt.append("\n   • Ou na parte SUPERIOR")
-            prompt.append("\n   • Título: 'Tabela de Coordenadas...'")
-            prompt.append("\n")
-            prompt.append("\n2. 📖 LEIA LINHA POR LINHA")
-            prompt.append("\n   • Primeira linha: Cabeçalhos (Código, Longitude, Latitude, Altitude)")
-            prompt.append("\n   • Depois: TODAS as linhas de dados")
-            prompt.append("\n   • Pode ter 20, 26, 30 ou mais vértices!")
-            prompt.append("\n")
-            prompt.append("\n3. 🎯 USE OS CÓDIGOS DO INCRA COMO REFERÊNCIA!")
-            prompt.append("\n   ")
-            prompt.append("\n   🚨🚨🚨 ESTRATÉGIA IMPORTANTE 🚨🚨🚨")
-            prompt.append("\n   ")
-            prompt.append("\n   ✅ Você JÁ extraiu a lista de códigos do INCRA na ETAPA 1")
-            prompt.append("\n   ✅ AGORA use essa lista para encontrar as coordenadas no PROJETO")
-            prompt.append("\n   ✅ Os códigos são IDÊNTICOS nos dois documentos!")
-            prompt.append("\n   ")
-            prompt.append("\n   📋 MÉTODO:")
-            prompt.append("\n   1. Pegue o primeiro código da sua lista do INCRA (ex: AKE-V-0166)")
-            prompt.append("\n   2. PROCURE esse código na tabela do PROJETO")
-            prompt.append("\n   3. Extraia as coordenadas (Long, Lat, Alt, Azimute, Dist)")
-            prompt.append("\n   4. Repita para o próximo código da lista")
-            prompt.append("\n   5. Continue até o último código")
-            prompt.append("\n   ")
-            prompt.append("\n   🔴 NÃO TENTE ler os códigos do Projeto se não conseguir!")
-            prompt.append("\n   🟢 USE a lista de códigos do INCRA que você já tem!")
-            prompt.append("\n   ")
-            prompt.append("\n   ⚠️ LEMBRE-SE:")
-            prompt.append("\n   • Se o INCRA tem AKE-M-1087, o PROJETO também tem AKE-M-1087")
-            prompt.append("\n   • Se o INCRA tem AKE-M-1088, o PROJETO também tem AKE-M-1088")
-            prompt.append("\n   • Os códigos são EXATAMENTE IGUAIS nos dois documentos!")
-            prompt.append("\n   ")
-            prompt.append("\n   COORDENADAS NO PROJETO:")
-            prompt.append("\n   • Longitude: 48°34'14,782\" W (SEM sinal negativo, COM letra W)")
-            prompt.append("\n   • Latitude: 20°50'45,291\" S (SEM sinal negativo, COM letra S)")
-            prompt.append("\n   • Altitude: 532,78 (número simples)")
-            prompt.append("\n   ")
-            prompt.append("\n   🚨 DIFERENÇA INCRA vs PROJETO:")
-            prompt.append("\n   • INCRA: -48°34'14,782\" (TEM sinal negativo -)")
-            prompt.append("\n   • PROJETO: 48°34'14,782\" W (NÃO tem sinal -, tem letra W)")
-            prompt.append("\n   • São EQUIVALENTES! Na comparação, ignore o sinal -")
-            prompt.append("\n")
-            prompt.append("\n4. ⚠️ NÃO CONFUNDA:")
-            prompt.append("\n   • ❌ NÃO pegue números do DESENHO (ex: E=741319 N=7696237)")
-            prompt.append("\n   • ❌ NÃO pegue números das LEGENDAS")
-            prompt.append("\n   • ❌ NÃO pegue números dos CARIMBOS")
-            prompt.append("\n   • ✅ SÓ pegue da TABELA DE COORDENADAS!")
-            prompt.append("\n")
-            prompt.append("\n5. 📝 LISTE TODOS OS VÉRTICES")
-            prompt.append("\n   🚨 CRÍTICO: Extraia TODOS os vértices da tabela!")
-            prompt.append("\n   • Se a tabela tem 26 vértices, liste os 26!")
-            prompt.append("\n   • Se a tabela tem 30 vértices, liste os 30!")
-            prompt.append("\n   • NÃO omita nenhum vértice")
-            prompt.append("\n   • NÃO pare em 3-4 vértices")
-            prompt.append("\n   • Leia até o FIM da tabela!")
-            prompt.append("\n   ")
-            prompt.append("\n   🚨🚨🚨 ATENÇÃO ESPECIAL - O ÚLTIMO CÓDIGO DO PROJETO:")
-            prompt.append("\n   ⚠️⚠️⚠️ O ÚLTIMO CÓDIGO É O MAIS IMPORTANTE! ⚠️⚠️⚠️")
-            prompt.append("\n   ")
-            prompt.append("\n   • Você tem a lista de códigos do INCRA")
-            prompt.append("\n   • O ÚLTIMO código dessa lista é o que você DEVE encontrar no PROJETO")
-            prompt.append("\n   • Exemplo: Se o último do INCRA é AKE-P-3586, PROCURE no PROJETO")
-            prompt.append("\n   • NÃO PODE FALTAR! Isso é CRÍTICO!")
-            prompt.append("\n   • Se não encontrou, PROCURE NOVAMENTE na tabela do PROJETO")
-            prompt.append("\n")
-            prompt.append("\n5.5 🚨🚨🚨 MÉTODO RIGOROSO DE OCR - PROJETO (LINHA POR LINHA) 🚨🚨🚨")
-            prompt.append("\n   ")
-            prompt.append("\n   ⚠️⚠️⚠️ CRÍTICO: Use o MESMO método rigoroso do INCRA! ⚠️⚠️⚠️")
-            prompt.append("\n   ")
-            prompt.append("\n   📋 PROCESSO - Para cada código da sua lista do INCRA:")
-            prompt.append("\n   ")
-            prompt.append("\n   1. Pegue o código (ex: AKE-V-0166)")
-            prompt.append("\n   2. PROCURE esse código na tabela do PROJETO")
-            prompt.append("\n   3. Quando encontrar a linha, extraia CÉLULA POR CÉLULA:")
-            prompt.append("\n   ")
-            prompt.append("\n   CÉLULA 2 - LONGITUDE:")
-            prompt.append("\n   🎯 Isole visualmente APENAS esta célula")
-            prompt.append("\n   ")
-            prompt.append("\n   Formato: 48°34'14,782\" W (SEM sinal -, TEM letra W)")
-            prompt.append("\n   ")
-            prompt.append("\n   A. Leia parte por parte:")
-            prompt.append("\n      └─ Graus: __ (2 dígitos)")
-            prompt.append("\n      └─ Símbolo: °")
-            prompt.append("\n      └─ Minutos: __ (2 dígitos)")
-            prompt.append("\n      └─ Apóstrofo: '")
-            prompt.append("\n      └─ Segundos INTEIROS: __ (2 dígitos)")
-            prompt.append("\n      └─ Vírgula: ,")
-            prompt.append("\n      └─ Segundos DECIMAIS: ___ (3 dígitos!)")
-            prompt.append("\n      └─ Aspas: \"")
-            prompt.append("\n      └─ Direção: W")
-            prompt.append("\n   ")
-            prompt.append("\n   B. Leia os segundos 2-3 VEZES para confirmar")
-            prompt.append("\n   C. Verifique: Tem 3 dígitos após vírgula?")
-            prompt.append("\n   ")
-            prompt.append("\n   D. 🔍 VALIDAÇÃO CRUZADA:")
-            prompt.append("\n      • Compare com INCRA (mesmo código)")
-            prompt.append("\n      • INCRA tinha: -48°34'14,782\"")
-            prompt.append("\n      • PROJETO deve ter: 48°34'14,782\" W")
-            prompt.append("\n      • Os NÚMEROS devem ser IDÊNTICOS!")
-            prompt.append("\n      • Se diferente → VOCÊ ERROU! Leia novamente!")
-            prompt.append("\n   ")
-            prompt.append("\n   CÉLULA 3 - LATITUDE:")
-            prompt.append("\n   🎯 Isole visualmente APENAS esta célula")
-            prompt.append("\n   ")
-            prompt.append("\n   Formato: 20°50'45,291\" S (SEM sinal -, TEM letra S)")
-            prompt.append("\n   ")
-            prompt.append("\n   A. Leia parte por parte:")
-            prompt.append("\n      └─ Graus: __ (2 dígitos)")
-            prompt.append("\n      └─ Símbolo: °")
-            prompt.append("\n      └─ Minutos: __ (2 dígitos)")
-            prompt.append("\n      └─ Apóstrofo: '")
-            prompt.append("\n      └─ Segundos INTEIROS: __ (2 dígitos)")
-            prompt.append("\n      └─ Vírgula: ,")
-            prompt.append("\n      └─ Segundos DECIMAIS: ___ (3 dígitos!)")
-            prompt.append("\n      └─ Aspas: \"")
-            prompt.append("\n      └─ Direção: S")
-            prompt.append("\n   ")
-            prompt.append("\n   B. Leia os segundos 2-3 VEZES para confirmar")
-            prompt.append("\n   C. Verifique: Tem 3 dígitos após vírgula?")
-            prompt.append("\n   ")
-            prompt.append("\n   D. 🔍 VALIDAÇÃO CRUZADA:")
-            prompt.append("\n      • Compare com INCRA (mesmo código)")
-            prompt.append("\n      • INCRA tinha: -20°50'45,291\"")
-            prompt.append("\n      • PROJETO deve ter: 20°50'45,291\" S")
-            prompt.append("\n      • Os NÚMEROS devem ser IDÊNTICOS!")
-            prompt.append("\n      • Se diferente → VOCÊ ERROU! Leia novamente!")
-            prompt.append("\n   ")
-            prompt.append("\n   CÉLULA 4 - ALTITUDE:")
-            prompt.append("\n   🚨🚨🚨 ESTA É A MAIS DIFÍCIL! ATENÇÃO MÁXIMA! 🚨🚨🚨")
-            prompt.append("\n   🎯 Isole visualmente APENAS esta célula")
-            prompt.append("\n   ")
-            prompt.append("\n   Formato: XXX,XX")
-            prompt.append("\n   ")
-            prompt.append("\n   A. Leia dígito por dígito:")
-            prompt.append("\n      └─ Centenas: _ (5 ou 6? 3 ou 8?)")
-            prompt.append("\n      └─ Dezenas: _ (3 ou 8? 2 ou 7?)")
-            prompt.append("\n      └─ Unidades: _ (2 ou 7? 4 ou 9?)")
-            prompt.append("\n      └─ Vírgula: ,")
-            prompt.append("\n      └─ Decimal 1: _")
-            prompt.append("\n      └─ Decimal 2: _ (não omita!)")
-            prompt.append("\n   ")
-            prompt.append("\n   B. Leia 3 VEZES:")
-            prompt.append("\n      └─ 1ª: ___,__")
-            prompt.append("\n      └─ 2ª: ___,__")
-            prompt.append("\n      └─ 3ª: ___,__")
-            prompt.append("\n      └─ Iguais? Se não, leia mais!")
-            prompt.append("\n   ")
-            prompt.append("\n   C. Pares confusos:")
-            prompt.append("\n      • 5 ou 6? → forma da curva")
-            prompt.append("\n      • 3 ou 8? → 8=dois círculos, 3=um")
-            prompt.append("\n      • 2 ou 7? → 7=traço em cima")
-            prompt.append("\n   ")
-            prompt.append("\n   D. 🔍🔍🔍 VALIDAÇÃO CRUZADA (CRÍTICA):")
-            prompt.append("\n      • Compare com INCRA (mesmo código)")
-            prompt.append("\n      • INCRA e PROJETO devem ter altitude IGUAL ou MUITO próxima")
-            prompt.append("\n      • Diferença máxima: ±5 metros")
-            prompt.append("\n      • Exemplo:")
-            prompt.append("\n        - INCRA: 532,78 → PROJETO deve ser ~532,78")
-            prompt.append("\n        - Se você leu 597,78 → ERRO! (diferença de 65m!)")
-            prompt.append("\n        - Se você leu 537,78 → Provavelmente ERRO!")
-            prompt.append("\n        - Releia com mais cuidado!")
-            prompt.append("\n   ")
-            prompt.append("\n   4. Repita para o próximo código da lista")
-            prompt.append("\n   ")
-            prompt.append("\n   🟢 DICA FINAL: Use INCRA para VALIDAR PROJETO!")
-            prompt.append("\n   • Mesmos códigos = mesmas coordenadas")
-            prompt.append("\n   • Se diferença grande → você errou no OCR")
-            prompt.append("\n")
-            prompt.append("\n💡 EXEMPLO CORRETO DE EXTRAÇÃO:")
-            prompt.append("\nVértice AKE-V-0166:")
-            prompt.append("\n  • Longitude: 48°34'14,782\" W")
-            prompt.append("\n  • Latitude: 20°50'45,291\" S")
-            prompt.append("\n  • Altitude: 532,78 m")
-            prompt.append("\n")
-            prompt.append("\nVértice AKE-M-1028:")
-            prompt.append("\n  • Longitude: 48°34'13,821\" W")
-            prompt.append("\n  • Latitude: 20°50'46,394\" S")
-            prompt.append("\n  • Altitude: 533,92 m")
-            prompt.append("\n")
-            prompt.append("\n... (continua para TODOS os vértices da tabela)")
-            prompt.append("\n")
-            prompt.append("\n❌ EXEMPLO ERRADO (NÃO FAÇA ISSO):")
-            prompt.append("\n'E=741319 N=7696237' ← Isso é do DESENHO, não da tabela!")
-            prompt.append("\n")
+            prompt.append(PROMPT_INSTRUCOES_PROJETO)
             prompt.extend(self.projeto_images)
             prompt.append("\n--- FIM PROJETO/PLANTA ---")
 
-        # INSTRUÇÕES FINAIS CRÍTICAS ANTES DO HTML
-        prompt.append("\n")
-        prompt.append("\n════════════════════════════════════════════════════════════")
-        prompt.append("\n           🚨 LEMBRETE FINAL - ANTES DE GERAR O HTML 🚨")
-        prompt.append("\n════════════════════════════════════════════════════════════")
-        prompt.append("\n")
-        prompt.append("\n⚠️ ANTES de gerar o relatório HTML, VERIFIQUE:")
-        prompt.append("\n")
-        prompt.append("\n1. ✅ Extraí TODAS as linhas da tabela INCRA?")
-        prompt.append("\n   • Contei quantas linhas tem na tabela original?")
-        prompt.append("\n   • Contei quantas linhas extraí?")
-        prompt.append("\n   • Os números são IGUAIS?")
-        prompt.append("\n")
-        prompt.append("\n2. ✅ Extraí TODAS as linhas da tabela PROJETO?")
-        prompt.append("\n   • Contei quantas linhas tem na tabela original?")
-        prompt.append("\n   • Contei quantas linhas extraí?")
-        prompt.append("\n   • Os números são IGUAIS?")
-        prompt.append("\n")
-        prompt.append("\n3. ✅ Mantive a ORDEM EXATA dos documentos originais?")
-        prompt.append("\n   • Primeira linha → vem primeiro no relatório")
-        prompt.append("\n   • Segunda linha → vem em segundo no relatório")
-        prompt.append("\n   • Última linha → vem por último no relatório")
-        prompt.append("\n")
-        prompt.append("\n4. ✅ NÃO pulei nenhuma linha do meio?")
-        prompt.append("\n   • Se tem vértices V-01, V-02, V-03... V-26")
-        prompt.append("\n   • Meu relatório tem TODOS eles, em sequência?")
-        prompt.append("\n")
-        prompt.append("\n4.5 ✅ NÃO repeti o primeiro vértice como último?")
-        prompt.append("\n   🚨 VERIFICAÇÃO CRÍTICA DOS CÓDIGOS:")
-        prompt.append("\n   • Primeiro código: número baixo (ex: AKE-V-0166 = 0166)")
-        prompt.append("\n   • Último código: número alto (ex: AKE-P-3586 = 3586)")
-        prompt.append("\n   • ⚠️ Se vejo AKE-V-0166 no final, é REPETIÇÃO (não conte!)")
-        prompt.append("\n   • ⚠️ Se o último número é MENOR que o primeiro = ERRO!")
-        prompt.append("\n   • ✅ Números devem ser CRESCENTES: 0166 < 1028 < 3586")
-        prompt.append("\n   • ❌ ERRADO: ...AKE-P-3586, AKE-V-0166 (voltou para 0166!)")
-        prompt.append("\n   • ✅ CORRETO: ...AKE-P-3585, AKE-P-3586 (terminou em 3586)")
-        prompt.append("\n")
-        prompt.append("\n5. ✅ Extraí TODOS os SEGMENTOS VANTE?")
-        prompt.append("\n   🚨🚨🚨 OBRIGATÓRIO: A seção SEGMENTO VANTE deve estar preenchida!")
-        prompt.append("\n   • Tanto do INCRA quanto do PROJETO")
-        prompt.append("\n   • NO INCRA: Está na segunda parte da tabela (Código, Azimute, Dist., Confrontações)")
-        prompt.append("\n   • NO PROJETO: Está após as colunas de coordenadas (colunas Azimute e Distância)")
-        prompt.append("\n   • Se não encontrei dados de SEGMENTO VANTE, PROCURE NOVAMENTE!")
-        prompt.append("\n   • O relatório HTML DEVE ter a SEÇÃO 4: SEGMENTO VANTE preenchida!")
-        prompt.append("\n")
-        prompt.append("\n6. ✅ Copiei os CÓDIGOS EXATAMENTE como aparecem?")
-        prompt.append("\n   🚨 CRÍTICO: Códigos devem ser copiados CARACTERE POR CARACTERE!")
-        prompt.append("\n   • Se está escrito AKE-M-1087, copie AKE-M-1087 (NÃO invente 1030!)")
-        prompt.append("\n   • Se está escrito AKE_P-3568 (com underscore), copie AKE_P-3568")
-        prompt.append("\n   • Se está escrito AKE-P-3568 (com hífen), copie AKE-P-3568")
-        prompt.append("\n   • UNDERSCORES (_) são DIFERENTES de HÍFENS (-)")
-        prompt.append("\n   • Números devem ser EXATOS: 1087 ≠ 1030 ≠ 1088")
-        prompt.append("\n   • NÃO normalize, NÃO corrija, COPIE EXATAMENTE!")
-        prompt.append("\n")
-        prompt.append("\n🔴 SE ALGUMA RESPOSTA FOR \"NÃO\": VOLTE E EXTRAIA NOVAMENTE!")
-        prompt.append("\n🟢 SE TODAS AS RESPOSTAS FOREM \"SIM\": Prossiga com o HTML!")
-        prompt.append("\n")
-        prompt.append("\n════════════════════════════════════════════════════════════")
-        prompt.append("\n")
-        prompt.append("\n🚨🚨🚨 REGRA ABSOLUTA DE RESPOSTA 🚨🚨🚨")
-        prompt.append("\n")
-        prompt.append("\n⛔ SUA RESPOSTA DEVE COMEÇAR DIRETAMENTE COM: <!DOCTYPE html>")
-        prompt.append("\n")
-        prompt.append("\n❌ NÃO ESCREVA:")
-        prompt.append("\n   • \"OK. Entendido! Vou analisar...\"")
-        prompt.append("\n   • \"ANÁLISE DOS DOCUMENTOS:\"")
-        prompt.append("\n   • \"DADOS CADASTRAIS:\"")
-        prompt.append("\n   • \"TABELA DE COORDENADAS:\"")
-        prompt.append("\n   • Qualquer texto explicativo ou rascunho")
-        prompt.append("\n")
-        prompt.append("\n✅ ESCREVA APENAS:")
-        prompt.append("\n   • Primeira linha: <!DOCTYPE html>")
-        prompt.append("\n   • Depois: <html>")
-        prompt.append("\n   • Depois: todo o HTML do relatório")
-        prompt.append("\n   • Última linha: </html>")
-        prompt.append("\n")
-        prompt.append("\n🔴 NADA ANTES DO <!DOCTYPE html>")
-        prompt.append("\n🔴 NADA DEPOIS DO </html>")
-        prompt.append("\n🔴 SEM RASCUNHOS, SEM ANÁLISES PRÉVIAS")
-        prompt.append("\n🟢 SOMENTE O CÓDIGO HTML PURO!")
-        prompt.append("\n")
-        prompt.append("\n════════════════════════════════════════════════════════════")
-        prompt.append("\n")
-
-        # Instruções de formato de saída - HTML PROFISSIONAL COM CORES
-
-        instrucoes_saida = (
-            "\n\n"
-            "\n════════════════════════════════════════════════════════════════════"
-            "\n                    FORMATO DO RELATÓRIO HTML                       "
-            "\n════════════════════════════════════════════════════════════════════"
-            "\n"
-            "\n🎯 DOCUMENTOS SENDO COMPARADOS: INCRA + PROJETO"
-            "\n"
-            "\n⚠️⚠️⚠️ REGRA CRÍTICA DE FORMATAÇÃO:"
-            "\n"
-            "\n1️⃣ Você está comparando: INCRA + PROJETO"
-            "\n   • Tabela deve ter 3 colunas: DADO | INCRA | PROJETO | STATUS"
-            "\n"
-            "\n2️⃣ Estrutura da tabela:"
-            "\n   <thead><tr>"
-            "\n       <th>DADO</th>"
-            "\n       <th>INCRA</th>"
-            "\n       <th>PROJETO</th>"
-            "\n       <th>STATUS</th>"
-            "\n   </tr></thead>"
-        )
-        
-        instrucoes_saida += (
-            "\n"
-            "\n⚠️ IMPORTANTE: Gere um relatório em HTML completo e profissional."
-            "\nUse CSS inline para cores, estilos e organização visual perfeita."
-            "\nCada seção deve ter cores diferentes para fácil identificação."
-            "\n"
-            "\nGere EXATAMENTE este formato HTML (adapte os dados):"
-            "\n"
-            "\n```html"
-            "\n<!DOCTYPE html>"
-            "\n<html lang='pt-BR'>"
-            "\n<head>"
-            "\n    <meta charset='UTF-8'>"
-            "\n    <meta name='viewport' content='width=device-width, initial-scale=1.0'>"
-            "\n    <title>Relatório de Consistência - Georreferenciamento</title>"
-            "\n    <style>"
-            "\n        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }"
-            "\n        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }"
-            "\n        h1 { color: #2c3e50; border-bottom: 4px solid #3498db; padding-bottom: 10px; }"
-            "\n        h2 { color: #34495e; margin-top: 30px; padding: 10px; border-left: 5px solid #3498db; background: #ecf0f1; }"
-            "\n        .resumo { background: #e8f5e9; padding: 20px; border-left: 5px solid #4caf50; margin: 20px 0; font-size: 16px; }"
-            "\n        .resumo.alerta { background: #fff3e0; border-left-color: #ff9800; }"
-            "\n        .resumo.erro { background: #ffebee; border-left-color: #f44336; }"
-            "\n        table { width: 100%; border-collapse: collapse; margin: 20px 0; font-size: 14px; }"
-            "\n        th { background: #3498db; color: white; padding: 12px; text-align: left; font-weight: bold; }"
-            "\n        td { padding: 10px; border: 1px solid #ddd; }"
-            "\n        tr:nth-child(even) { background: #f9f9f9; }"
-            "\n        tr:hover { background: #f0f0f0; }"
-            "\n        .status-ok { color: #4caf50; font-weight: bold; font-size: 18px; }"
-            "\n        .status-alerta { color: #ff9800; font-weight: bold; font-size: 18px; }"
-            "\n        .status-erro { color: #f44336; font-weight: bold; font-size: 18px; }"
-            "\n        .secao-cadastro th { background: #2196f3; }"
-            "\n        .secao-tecnico th { background: #009688; }"
-            "\n        .secao-vertices th { background: #673ab7; }"
-            "\n        .secao-confrontantes th { background: #ff5722; }"
-            "\n        .secao-erros { background: #ffebee; padding: 15px; border-left: 5px solid #f44336; margin: 20px 0; }"
-            "\n        .secao-alertas { background: #fff3e0; padding: 15px; border-left: 5px solid #ff9800; margin: 20px 0; }"
-            "\n        .secao-ok { background: #e8f5e9; padding: 15px; border-left: 5px solid #4caf50; margin: 20px 0; }"
-            "\n        .parecer { padding: 20px; margin: 20px 0; border: 3px solid; font-size: 16px; font-weight: bold; }"
-            "\n        .parecer-aprovado { background: #e8f5e9; border-color: #4caf50; color: #2e7d32; }"
-            "\n        .parecer-ressalvas { background: #fff3e0; border-color: #ff9800; color: #e65100; }"
-            "\n        .parecer-reprovado { background: #ffebee; border-color: #f44336; color: #c62828; }"
-            "\n        .legenda { background: #ecf0f1; padding: 15px; margin: 20px 0; border-radius: 5px; }"
-            "\n        .analise { font-style: italic; color: #555; margin: 10px 0; padding: 10px; background: #f9f9f9; }"
-            "\n    </style>"
-            "\n</head>"
-            "\n<body>"
-            "\n<div class='container'>"
-            "\n"
-            "\n<!-- SEÇÃO 1: DADOS CADASTRAIS -->"
-            "\n<h2>📋 1. DADOS CADASTRAIS</h2>"
-            "\n<table class='secao-cadastro'>"
-            "\n<thead>"
-            "\n    <tr>"
-            "\n        <th>DADO</th>"
-            "\n        [COLUNAS DOS DOCUMENTOS FORNECIDOS]"
-            "\n        <th style='text-align:center;'>STATUS</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><strong>Proprietário(s)</strong></td>"
-            "\n        [DADOS DE CADA DOCUMENTO]"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <!-- Repetir para: Nome do Imóvel, Matrícula(s), Município, UF, Código INCRA, etc -->"
-            "\n    <tr>"
-            "\n        <td><strong>UF</strong></td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Código INCRA</strong></td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>CCIR</strong></td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n</tbody>"
-            "\n</table>"
-            "\n<p class='analise'><strong>Análise:</strong> [Breve comentário sobre consistência destes dados]</p>"
-            "\n"
-            "\n<!-- SEÇÃO 2: DADOS TÉCNICOS -->"
-            "\n<h2>📐 2. DADOS TÉCNICOS/MENSURAÇÕES</h2>"
-            "\n<table class='secao-tecnico'>"
-            "\n<thead>"
-            "\n    <tr>"
-            "\n        <th>DADO</th>"
-            "\n        <th>INCRA</th>"
-            "\n        <th>MEMORIAL</th>"
-            "\n        <th>PROJETO</th>"
-            "\n        <th style='text-align:center;'>STATUS</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><strong>Área Total (ha)</strong></td>"
-            "\n        <td>[X,XXXX]</td>"
-            "\n        <td>[X,XXXX]</td>"
-            "\n        <td>[X,XXXX/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Perímetro (m)</strong></td>"
-            "\n        <td>[X.XXX,XX]</td>"
-            "\n        <td>[X.XXX,XX]</td>"
-            "\n        <td>[X.XXX,XX/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Sistema Coordenadas</strong></td>"
-            "\n        <td>[UTM/GEO]</td>"
-            "\n        <td>[UTM/GEO]</td>"
-            "\n        <td>[UTM/GEO/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Datum</strong></td>"
-            "\n        <td>[SIRGAS]</td>"
-            "\n        <td>[SIRGAS]</td>"
-            "\n        <td>[SIRGAS/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Fuso</strong></td>"
-            "\n        <td>[22/23]</td>"
-            "\n        <td>[22/23]</td>"
-            "\n        <td>[22/23/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n</tbody>"
-            "\n</table>"
-            "\n<p class='analise'><strong>Análise:</strong> [Breve comentário sobre consistência destes dados]</p>"
-            "\n"
-            "\n<!-- SEÇÃO 3: VÉRTICES -->"
-            "\n<h2>🗺️ 3. COORDENADAS DOS VÉRTICES</h2>"
-            "\n<table class='secao-vertices'>"
-            "\n<thead>"
-            "\n    <tr>"
-            "\n        <th>VÉRTICE</th>"
-            "\n        <th>INCRA (Coordenadas)</th>"
-            "\n        <th>MEMORIAL (Coordenadas)</th>"
-            "\n        <th>PROJETO (Coordenadas)</th>"
-            "\n        <th style='text-align:center;'>STATUS</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><strong>V1 (AKE-V-XXXX)</strong></td>"
-            "\n        <td>Long: -XX°XX'XX,XXX\"<br>Lat: -XX°XX'XX,XXX\"<br>Alt: XXX,XX</td>"
-            "\n        <td>Long: XX°XX'XX,XXX\" W<br>Lat: XX°XX'XX,XXX\" S<br>Alt: XXX,XX</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <!-- ADICIONE UMA LINHA PARA CADA VÉRTICE (V2, V3, V4... até o último!) -->"
-            "\n    <!-- NÃO OMITA NENHUM VÉRTICE! -->"
-            "\n</tbody>"
-            "\n</table>"
-            "\n<p class='analise'><strong>Análise:</strong> [Comentário sobre consistência das coordenadas]</p>"
-            "\n"
-            "\n<!-- SEÇÃO 4: SEGMENTO VANTE -->"
-            "\n<h2>📐 4. SEGMENTO VANTE</h2>"
-            "\n<table class='secao-vertices'>"
-            "\n<thead>"
-            "\n    <tr>"
-            "\n        <th>SEGMENTO</th>"
-            "\n        <th>INCRA (Azimute/Dist./Confrontações)</th>"
-            "\n        <th>PROJETO (Azimute/Dist.)</th>"
-            "\n        <th style='text-align:center;'>STATUS</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><strong>S1</strong></td>"
-            "\n        <td>[Az=XXX° Dist=YY.YYm Conf=...]</td>"
-            "\n        <td>[Az=XXX° Dist=YY.YYm]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <!-- ADICIONE UMA LINHA PARA CADA SEGMENTO VANTE (S2, S3, S4... até o último!) -->"
-            "\n    <!-- NÃO OMITA NENHUM SEGMENTO! -->"
-            "\n</tbody>"
-            "\n</table>"
-            "\n<p class='analise'><strong>Análise:</strong> [Comentário sobre consistência dos segmentos vante]</p>"
-            "\n"
-            "\n<!-- LEGENDA -->"
-            "\n<div class='legenda'>"
-            "\n    <h3>LEGENDA DE STATUS</h3>"
-            "\n    <p><span class='status-ok'>✅</span> = Dados idênticos e corretos</p>"
-            "\n    <p><span class='status-alerta'>⚠️</span> = Pequena diferença (revisar, mas não bloqueia)</p>"
-            "\n    <p><span class='status-erro'>❌</span> = Erro grave (correção obrigatória)</p>"
-            "\n</div>"
-            "\n"
-            "\n<hr>"
-            "\n<p style='text-align:center; color:#888; margin-top:30px;'><em>Relatório gerado por IA - Verificação humana sempre recomendada</em></p>"
-            "\n"
-            "\n</div>"
-            "\n</body>"
-            "\n</html>"
-            "\n```"
-            "\n"
-            "\n⚠️ LEMBRE-SE:"
-            "\n- Use <span class='status-ok'>✅</span> para dados corretos"
-            "\n- Use <span class='status-alerta'>⚠️</span> para pequenas diferenças"
-            "\n- Use <span class='status-erro'>❌</span> para erros graves"
-            "\n- Liste TODOS os vértices encontrados na tabela de coordenadas"
-            "\n- Liste TODOS os segmentos vante encontrados"
-            "\n- Compare INCRA x PROJETO em todas as seções"
-        )
-
-        prompt.append(instrucoes_saida)
+        prompt.append(PROMPT_LEMBRETE_FINAL)
+        prompt.append(PROMPT_FORMATO_SAIDA)
         return prompt
     def _extrair_html_puro(self, texto: str) -> str:
         """
@@ -1512,19 +1557,8 @@ class VerificadorGeorreferenciamento:
 
         if inicio_html != -1 and fim_html != -1:
             # Extrair apenas o HTML, cortando TODO o texto antes e depois
-            html_puro = texto[inicio_html:fim_html + 7]  # +7 para incluir </html>
-
-            # Limpar qualquer texto que ainda esteja antes do DOCTYPE
-            # (remover linhas antes que não sejam HTML)
-            linhas = html_puro.split('\n')
-            primeira_linha_html = 0
-            for i, linha in enumerate(linhas):
-                if '<!DOCTYPE' in linha or '<html' in linha or '<HTML' in linha:
-                    primeira_linha_html = i
-                    break
-
-            html_puro = '\n'.join(linhas[primeira_linha_html:])
-            return html_puro
+            # (inicio_html já aponta para o primeiro marcador HTML)
+            return texto[inicio_html:fim_html + 7]  # +7 para incluir </html>
         else:
             # Se não encontrar marcadores HTML, retornar o texto original
             return texto
@@ -1539,35 +1573,48 @@ class VerificadorGeorreferenciamento:
             self.resultado_text.delete(1.0, tk.END)
             self.resultado_text.insert(tk.END, "🔄 Processando documentos...\n\n")
 
-            # Carregar INCRA (com rotação)
-            self._atualizar_status("Carregando INCRA...")
-            self.incra_images = self._carregar_pdf_como_imagens(
-                self.incra_path.get(),
-                rotacionar_90=True
-            )
-            self.resultado_text.insert(
-                tk.END,
-                f"✅ INCRA carregado: {len(self.incra_images)} página(s)\n"
-            )
+            # Carregar INCRA (com rotação) e Projeto em paralelo: cada conversão
+            # é um processo do Poppler, então o tempo total passa a ser o do maior
+            self._atualizar_status("Carregando INCRA e Projeto/Planta...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # 100 DPI: resolução suficiente para o Gemini, com metade dos bytes
+                futuro_incra = executor.submit(
+                    self._carregar_pdf_como_imagens,
+                    self.incra_path.get(),
+                    rotacionar_90=True,
+                    dpi=100
+                )
+                futuro_projeto = executor.submit(
+                    self._carregar_pdf_como_imagens,
+                    self.projeto_path.get(),
+                    dpi=100
+                )
 
-            # Carregar Projeto
-            self._atualizar_status("Carregando Projeto/Planta...")
-            self.projeto_images = self._carregar_pdf_como_imagens(
-                self.projeto_path.get()
-            )
-            self.resultado_text.insert(
-                tk.END,
-                f"✅ Projeto carregado: {len(self.projeto_images)} página(s)\n"
+                self.incra_images = futuro_incra.result()
+                self.projeto_images = futuro_projeto.result()
+            self._atualizar_status(
+                f"✅ INCRA ({len(self.incra_images)} pág.) e "
+                f"Projeto ({len(self.projeto_images)} pág.) carregados"
             )
 
-            self.resultado_text.insert(tk.END, "\n" + "="*80 + "\n\n")
+            # Montar o resumo do carregamento e inserir de uma só vez no Text
+            resumo = io.StringIO()
+            resumo.write(f"✅ INCRA carregado: {len(self.incra_images)} página(s)\n")
+            resumo.write(f"✅ Projeto carregado: {len(self.projeto_images)} página(s)\n")
+            resumo.write("\n" + "="*80 + "\n\n")
+            resumo.write("🤖 Gemini AI analisando os documentos...\n\n")
+            self.resultado_text.insert(tk.END, resumo.getvalue())
 
-            # Configurar API do Gemini
-            self._atualizar_status("Configurando API do Gemini...")
-            genai.configure(api_key=self.api_key.get().strip())
+            # Configurar API do Gemini (somente na primeira análise ou se a chave mudou)
+            api_key = self.api_key.get().strip()
+            if api_key != self._gemini_api_key_configurada:
+                self._atualizar_status("Configurando API do Gemini...")
+                genai.configure(api_key=api_key)
 
-            # Usar modelo Gemini 2.5 Flash Lite conforme especificado
-            model = genai.GenerativeModel('gemini-2.0-flash-exp')
+                # Usar modelo Gemini 2.5 Flash Lite conforme especificado
+                self._gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+                self._gemini_api_key_configurada = api_key
+            model = self._gemini_model
 
             # Construir prompt
             self._atualizar_status("Construindo análise multimodal...")
@@ -1575,15 +1622,30 @@ class VerificadorGeorreferenciamento:
             
             # Executar análise
             self._atualizar_status("Analisando documentos com IA... (pode levar alguns minutos)")
-            self.resultado_text.insert(tk.END, "🤖 Gemini AI analisando os documentos...\n\n")
-            self.root.update_idletasks()
-            
-            response = model.generate_content(prompt)
+
+            # Marcar onde começa a resposta para substituí-la pelo HTML limpo no final
+            self.resultado_text.mark_set("inicio_resposta", "end-1c")
+            self.resultado_text.mark_gravity("inicio_resposta", tk.LEFT)
+
+            # Receber a resposta em streaming e exibir cada trecho assim que chega
+            response = model.generate_content(prompt, stream=True)
+            resposta = io.StringIO()
+            for chunk in response:
+                # chunk.text valida as partes a cada leitura: ler uma única vez
+                try:
+                    texto = chunk.text
+                except ValueError:
+                    continue  # Trecho sem texto (só término ou bloqueio de segurança)
+                resposta.write(texto)
+                self.resultado_text.insert(tk.END, texto)
+                self.resultado_text.see(tk.END)
+                self.root.update_idletasks()
 
             # Limpar resposta - extrair apenas o HTML puro
-            html_limpo = self._extrair_html_puro(response.text)
+            html_limpo = self._extrair_html_puro(resposta.getvalue())
 
-            # Exibir resultado
+            # Exibir resultado (substitui o texto bruto recebido em streaming)
+            self.resultado_text.delete("inicio_resposta", tk.END)
             self.resultado_text.insert(tk.END, html_limpo)
 
             # Salvar HTML para poder exportar depois
@@ -1603,6 +1665,13 @@ class VerificadorGeorreferenciamento:
             messagebox.showerror("Erro", f"Ocorreu um erro durante a análise:\n\n{str(e)}")
             
         finally:
+            # Soltar as referências às imagens das páginas (dezenas de MB cada),
+            # para que não fiquem presas à janela entre análises; a memória volta
+            # quando este método retorna (o prompt local também as referencia).
+            # Uma nova análise converte os PDFs novamente
+            self.incra_images = []
+            self.projeto_images = []
+
             self._habilitar_botoes()
             
     def _comparar_documentos(self):
@@ -1618,9 +1687,175 @@ class VerificadorGeorreferenciamento:
         thread.start()
 
 
+def limitar_posicao(pos: int, delta: int, tamanho_imagem: int, tamanho_canvas: int,
+                    margem: int = 50) -> int:
+    """
+    Aplica um deslocamento a uma coordenada sem deixar a imagem sair do canvas.
+
+    Args:
+        pos: Posição atual da borda da imagem (eixo x ou y)
+        delta: Deslocamento desejado
+        tamanho_imagem: Largura ou altura da imagem exibida
+        tamanho_canvas: Largura ou altura do canvas
+        margem: Quantos pixels da imagem devem continuar visíveis
+
+    Returns:
+        Nova posição, limitada para manter parte da imagem visível
+    """
+    visivel = min(margem, tamanho_imagem)
+    return max(visivel - tamanho_imagem, min(tamanho_canvas - visivel, pos + delta))
+
+
+def calcular_recorte(pos: int, tamanho_imagem: int, tamanho_canvas: int,
+                     bloco: int = 256) -> tuple:
+    """
+    Calcula o trecho da imagem ampliada que precisa ser renderizado em um eixo.
+
+    Cobre a área visível mais uma margem de um canvas para cada lado, para o
+    arrasto não mostrar bordas vazias. Os limites são alinhados a blocos, de
+    modo que pequenos deslocamentos reaproveitem o mesmo recorte do cache.
+
+    Args:
+        pos: Posição da borda da imagem no canvas (eixo x ou y)
+        tamanho_imagem: Largura ou altura da imagem com o zoom aplicado
+        tamanho_canvas: Largura ou altura do canvas
+        bloco: Tamanho (px) usado para alinhar os limites do recorte
+
+    Returns:
+        Tupla (inicio, fim) em pixels da imagem ampliada
+    """
+    if tamanho_canvas <= 1:
+        # Canvas ainda não exibido: renderizar a imagem inteira
+        return 0, tamanho_imagem
+
+    inicio = max(0, -pos - tamanho_canvas) // bloco * bloco
+    fim = min(tamanho_imagem, -(-(2 * tamanho_canvas - pos) // bloco) * bloco)
+    if inicio >= fim:
+        return 0, tamanho_imagem
+    return inicio, fim
+
+
+class CacheLRU:
+    """
+    Cache com descarte do item usado há mais tempo (LRU).
+
+    Limita a quantidade de itens e, opcionalmente, o total de pixels das
+    imagens guardadas, já que uma página ampliada ocupa dezenas de MB.
+    Pode ser usado a partir de várias threads.
+    """
+
+    def __init__(self, max_itens: int, max_pixels: Optional[int] = None):
+        self.max_itens = max_itens
+        self.max_pixels = max_pixels
+        self._itens = OrderedDict()
+        self._total_pixels = 0
+        self._lock = threading.Lock()
+
+    def obter(self, chave):
+        """Retorna o valor da chave (ou None) e o marca como usado recentemente."""
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is None:
+                return None
+            self._itens.move_to_end(chave)
+            return item[0]
+
+    def guardar(self, chave, valor, pixels: int = 0):
+        """Guarda um valor, descartando os itens mais antigos se passar dos limites."""
+        with self._lock:
+            antigo = self._itens.pop(chave, None)
+            if antigo is not None:
+                self._total_pixels -= antigo[1]
+
+            self._itens[chave] = (valor, pixels)
+            self._total_pixels += pixels
+
+            while len(self._itens) > 1 and (
+                len(self._itens) > self.max_itens
+                or (self.max_pixels is not None and self._total_pixels > self.max_pixels)
+            ):
+                _, (_, pixels_descartados) = self._itens.popitem(last=False)
+                self._total_pixels -= pixels_descartados
+
+    def limpar(self):
+        """Remove todos os itens do cache."""
+        with self._lock:
+            self._itens.clear()
+            self._total_pixels = 0
+
+
+@dataclass(slots=True)
+class EstadoPainel:
+    """Estado de visualização de um painel da comparação manual."""
+
+    # Páginas do documento e página atual
+    imagens: List[Image.Image] = field(default_factory=list)
+    pagina: int = 0
+
+    # Nível de zoom: índice em ESCALA_ZOOM (PASSO_ZOOM_100 = 100%)
+    zoom_passo: int = PASSO_ZOOM_100
+
+    # Ângulo de rotação (0, 90, 180, 270) e cliques em "Girar" ainda não aplicados
+    rotacao: int = 0
+    giros_pendentes: int = 0
+
+    # Posição da imagem no canvas e controle de arrastar
+    pos_x: int = 0
+    pos_y: int = 0
+    drag_start: Optional[tuple] = None
+    cursor: str = ""
+
+    # Tamanho da página com o zoom atual e o trecho dela (x0, y0, x1, y1)
+    # realmente renderizado: só a área visível e arredores são processados
+    largura_exibida: int = 0
+    altura_exibida: int = 0
+    recorte: Optional[tuple] = None
+
+    # Widgets do painel, PhotoImage exibida (manter referência) e o id do
+    # item de imagem no canvas (movido diretamente durante o arrasto)
+    canvas: Optional[tk.Canvas] = None
+    label_pagina: Optional[tk.Label] = None
+    label_zoom: Optional[tk.Label] = None
+    label_rotacao: Optional[tk.Label] = None
+    photo: Optional[ImageTk.PhotoImage] = None
+    item_imagem: Optional[int] = None
+
+    # Níveis de zoom acumulados do scroll, aplicados juntos no próximo ciclo,
+    # e o delta da roda que ainda não completou um "clique" (touchpads)
+    zoom_pendente: int = 0
+    zoom_agendado: bool = False
+    delta_roda: int = 0
+
+    # Durante arrasto/scroll a imagem é redimensionada com o filtro rápido
+    # (NEAREST); o redesenho em alta qualidade fica agendado para depois
+    interagindo: bool = False
+    job_qualidade: Optional[str] = None
+
+    # Renderização em segundo plano: a geração identifica o pedido mais
+    # recente, para descartar resultados que chegarem atrasados
+    geracao: int = 0
+    futuro: Optional[Future] = None
+
+
 class JanelaComparacaoManual:
     """Janela para comparação visual manual dos documentos PDF."""
 
+    # Limites do cache de imagens já renderizadas (página + zoom + rotação)
+    MAX_RENDERIZACOES_CACHE = 32
+    MAX_PIXELS_CACHE = 60_000_000
+
+    # Limite do cache de páginas rotacionadas em resolução original
+    MAX_ROTACOES_CACHE = 6
+
+    # Tempo sem interação (ms) até redesenhar com o filtro de alta qualidade
+    ATRASO_QUALIDADE_MS = 150
+
+    # Intervalo (ms) para acumular eventos de scroll antes de aplicar o zoom
+    INTERVALO_ZOOM_MS = 16
+
+    # Intervalo (ms) para acumular cliques seguidos em "Girar 90°"
+    INTERVALO_ROTACAO_MS = 50
+
     def __init__(self, parent, incra_path, projeto_path):
         self.janela = tk.Toplevel(parent)
         self.janela.title("Comparação Visual Manual - Georreferenciamento")
@@ -1631,35 +1866,26 @@ class JanelaComparacaoManual:
         self.incra_path = incra_path
         self.projeto_path = projeto_path
 
-        # Listas de imagens carregadas
-        self.incra_images = []
-        self.projeto_images = []
+        # Estado de visualização de cada painel, criado em _criar_painel
+        self.estados: Dict[str, EstadoPainel] = {}
 
-        # Índices de página atual
-        self.incra_pagina = 0
-        self.projeto_pagina = 0
+        # Cache de PhotoImages por (tipo, página, zoom, rotação, recorte); o
+        # arrasto só muda a posição no canvas e não invalida o cache
+        self._cache_render = CacheLRU(self.MAX_RENDERIZACOES_CACHE, self.MAX_PIXELS_CACHE)
 
-        # Níveis de zoom (100% = 1.0)
-        self.incra_zoom = 1.0
-        self.projeto_zoom = 1.0
+        # Cache das páginas rotacionadas por (tipo, página, rotação): a rotação
+        # só muda ao clicar em girar, então zoom e arrasto reaproveitam a base
+        self._cache_rotacao = CacheLRU(self.MAX_ROTACOES_CACHE)
 
-        # Ângulo de rotação (0, 90, 180, 270)
-        self.incra_rotacao = 0
-        self.projeto_rotacao = 0
+        # Rotação e redimensionamento rodam fora da thread do Tk (o PIL libera
+        # o GIL nessas operações), para a janela não travar
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self.janela.protocol("WM_DELETE_WINDOW", self._fechar)
 
-        # Posição do canvas (para arrastar)
-        self.incra_pos_x = 0
-        self.incra_pos_y = 0
-        self.projeto_pos_x = 0
-        self.projeto_pos_y = 0
-
-        # Controle de arrastar
-        self.incra_drag_start = None
-        self.projeto_drag_start = None
-
-        # Imagens PhotoImage (para exibição no Tkinter)
-        self.incra_photo = None
-        self.projeto_photo = None
+        # Delta de <MouseWheel> equivalente a um clique da roda: 120 no
+        # Windows (e X11 com Tk 8.7+); no macOS cada unidade já é um passo
+        sistema_janelas = self.janela.tk.call('tk', 'windowingsystem')
+        self._delta_clique_roda = 1 if sistema_janelas == 'aqua' else 120
 
         self._criar_interface()
         self._carregar_documentos()
@@ -1703,6 +1929,17 @@ class JanelaComparacaoManual:
         footer_frame = tk.Frame(self.janela, bg='#34495e', height=50)
         footer_frame.pack(fill=tk.X, side=tk.BOTTOM)
         footer_frame.pack_propagate(False)
+
+        # Status do carregamento dos documentos
+        self._status_var = tk.StringVar(value="")
+        status_label = tk.Label(
+            footer_frame,
+            textvariable=self._status_var,
+            font=('Arial', 10, 'bold'),
+            bg='#34495e',
+            fg='#f1c40f'
+        )
+        status_label.pack(side=tk.RIGHT, padx=15)
         
         instrucoes = tk.Label(
             footer_frame,
@@ -1744,8 +1981,9 @@ class JanelaComparacaoManual:
         canvas = tk.Canvas(canvas_frame, bg='white', highlightthickness=0)
         canvas.pack(fill=tk.BOTH, expand=True)
         
-        # Salvar referência ao canvas
-        setattr(self, f'{tipo}_canvas', canvas)
+        # Criar o estado do painel e salvar referência ao canvas
+        estado = EstadoPainel(canvas=canvas)
+        self.estados[tipo] = estado
         
         # Configurar eventos do mouse para arrastar e zoom
         canvas.bind('<ButtonPress-1>', lambda e: self._iniciar_arrasto(tipo, e))
@@ -1755,6 +1993,8 @@ class JanelaComparacaoManual:
         # Para Linux
         canvas.bind('<Button-4>', lambda e: self._zoom_scroll(tipo, e))
         canvas.bind('<Button-5>', lambda e: self._zoom_scroll(tipo, e))
+        # Ao aumentar o painel, o recorte renderizado pode deixar de cobrir a área visível
+        canvas.bind('<Configure>', lambda e: self._verificar_recorte(tipo))
         
         # Frame de controles
         controles = tk.Frame(painel, bg='#ecf0f1', height=120)
@@ -1786,7 +2026,7 @@ class JanelaComparacaoManual:
             bg='#ecf0f1'
         )
         label_pagina.pack(side=tk.LEFT, padx=10)
-        setattr(self, f'{tipo}_label_pagina', label_pagina)
+        estado.label_pagina = label_pagina
         
         btn_proximo = tk.Button(
             nav_frame,
@@ -1808,7 +2048,7 @@ class JanelaComparacaoManual:
         btn_zoom_out = tk.Button(
             zoom_frame,
             text="➖ Zoom -",
-            command=lambda: self._ajustar_zoom(tipo, -0.2),
+            command=lambda: self._ajustar_zoom(tipo, -2),
             font=('Arial', 10),
             bg='#e74c3c',
             fg='white',
@@ -1834,7 +2074,7 @@ class JanelaComparacaoManual:
         btn_zoom_in = tk.Button(
             zoom_frame,
             text="➕ Zoom +",
-            command=lambda: self._ajustar_zoom(tipo, 0.2),
+            command=lambda: self._ajustar_zoom(tipo, 2),
             font=('Arial', 10),
             bg='#27ae60',
             fg='white',
@@ -1852,7 +2092,7 @@ class JanelaComparacaoManual:
             bg='#ecf0f1'
         )
         label_zoom.pack(side=tk.LEFT, padx=10)
-        setattr(self, f'{tipo}_label_zoom', label_zoom)
+        estado.label_zoom = label_zoom
         
         # Linha 3: Controles de rotação
         rotacao_frame = tk.Frame(controles, bg='#ecf0f1')
@@ -1892,43 +2132,41 @@ class JanelaComparacaoManual:
             bg='#ecf0f1'
         )
         label_rotacao.pack(side=tk.LEFT, padx=10)
-        setattr(self, f'{tipo}_label_rotacao', label_rotacao)
+        estado.label_rotacao = label_rotacao
         
     def _carregar_documentos(self):
         """Carrega os documentos PDF como imagens."""
         try:
-            # Criar diálogo de progresso
-            progress = tk.Toplevel(self.janela)
-            progress.title("Carregando...")
-            progress.geometry("400x150")
-            progress.transient(self.janela)
-            progress.grab_set()
-            
-            tk.Label(
-                progress,
-                text="⏳ Carregando documentos...",
-                font=('Arial', 12, 'bold')
-            ).pack(pady=20)
-            
-            status_label = tk.Label(progress, text="", font=('Arial', 10))
-            status_label.pack(pady=10)
-            
-            progress.update()
-            
+            # Páginas rotacionadas de uma carga anterior não valem mais
+            self._cache_rotacao.limpar()
+            self._cache_render.limpar()
+
             # Carregar INCRA (com rotação)
-            status_label.config(text="Carregando INCRA...")
-            progress.update()
-            self.incra_images = convert_from_path(self.incra_path, dpi=150)
+            self._status_var.set("⏳ Carregando INCRA...")
+            self.janela.update_idletasks()
+            incra_images = convert_from_path(
+                self.incra_path,
+                dpi=150,
+                thread_count=POPPLER_THREADS,
+                use_pdftocairo=True
+            )
             # Rotacionar INCRA
-            self.incra_images = [img.rotate(-90, expand=True) for img in self.incra_images]
+            self.estados['incra'].imagens = [
+                img.transpose(TRANSPOSICAO_ROTACAO[90]) for img in incra_images
+            ]
 
             # Carregar Projeto
-            status_label.config(text="Carregando Projeto...")
-            progress.update()
-            self.projeto_images = convert_from_path(self.projeto_path, dpi=150)
-            
-            progress.destroy()
-            
+            self._status_var.set("⏳ Carregando Projeto...")
+            self.janela.update_idletasks()
+            self.estados['projeto'].imagens = convert_from_path(
+                self.projeto_path,
+                dpi=150,
+                thread_count=POPPLER_THREADS,
+                use_pdftocairo=True
+            )
+
+            self._status_var.set("")
+
             # Exibir primeira página de cada documento
             self._exibir_pagina('incra')
             self._exibir_pagina('memorial')
@@ -1937,151 +2175,381 @@ class JanelaComparacaoManual:
                 
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao carregar documentos:\n{str(e)}")
-            self.janela.destroy()
+            self._fechar()
             
     def _exibir_pagina(self, tipo):
-        """Exibe a página atual de um documento."""
-        # Obter lista de imagens e índice atual
-        images = getattr(self, f'{tipo}_images')
-        pagina = getattr(self, f'{tipo}_pagina')
-        zoom = getattr(self, f'{tipo}_zoom')
-        rotacao = getattr(self, f'{tipo}_rotacao')
-        pos_x = getattr(self, f'{tipo}_pos_x')
-        pos_y = getattr(self, f'{tipo}_pos_y')
-        canvas = getattr(self, f'{tipo}_canvas')
+        """
+        Exibe a página atual de um documento.
+
+        Se a imagem já estiver no cache ela é exibida na hora; senão, a
+        rotação e o zoom são processados em segundo plano e a imagem é
+        instalada no canvas quando ficar pronta.
+        """
+        estado = self.estados[tipo]
+        images = estado.imagens
+        pagina = estado.pagina
         
         if not images or pagina >= len(images):
             return
-            
-        # Obter imagem original
-        img_original = images[pagina].copy()
-        
-        # Aplicar rotação (se houver)
-        if rotacao != 0:
-            img_original = img_original.rotate(-rotacao, expand=True)
-        
-        # Aplicar zoom
-        largura = int(img_original.width * zoom)
-        altura = int(img_original.height * zoom)
-        img_zoom = img_original.resize((largura, altura), Image.Resampling.LANCZOS)
-        
-        # Converter para PhotoImage
+
+        zoom = ESCALA_ZOOM[estado.zoom_passo]
+        rotacao = estado.rotacao
+        interagindo = estado.interagindo
+
+        # Tamanho da página com zoom e o trecho dela que aparece no canvas
+        largura_base, altura_base = images[pagina].size
+        if rotacao in (90, 270):
+            largura_base, altura_base = altura_base, largura_base
+        largura = estado.largura_exibida = int(largura_base * zoom)
+        altura = estado.altura_exibida = int(altura_base * zoom)
+
+        canvas = estado.canvas
+        x0, x1 = calcular_recorte(estado.pos_x, largura, canvas.winfo_width())
+        y0, y1 = calcular_recorte(estado.pos_y, altura, canvas.winfo_height())
+        recorte = (x0, y0, x1, y1)
+
+        # Atualizar labels de página, zoom e rotação
+        estado.label_pagina.config(text=f"Página {pagina + 1}/{len(images)}")
+        estado.label_zoom.config(text=f"{int(zoom * 100)}%")
+        estado.label_rotacao.config(text=f"{rotacao}°")
+
+        # Um novo pedido torna obsoleta qualquer renderização ainda pendente
+        estado.geracao += 1
+        if estado.futuro is not None:
+            estado.futuro.cancel()
+            estado.futuro = None
+
+        # Reaproveitar a imagem se esta combinação já foi renderizada; durante a
+        # interação a versão em alta qualidade também serve, se já existir
+        chave = (tipo, pagina, estado.zoom_passo, rotacao, recorte)
+        photo = self._cache_render.obter(chave + (False,))
+        if photo is None and interagindo:
+            photo = self._cache_render.obter(chave + (True,))
+
+        if photo is not None:
+            self._instalar_imagem(tipo, photo, recorte)
+            return
+
+        geracao = estado.geracao
+        chave_render = chave + (interagindo,)
+        futuro = self._executor.submit(
+            self._renderizar_imagem, tipo, pagina, rotacao, zoom, recorte, interagindo
+        )
+        estado.futuro = futuro
+        futuro.add_done_callback(
+            lambda f: self._agendar_conclusao_render(tipo, geracao, chave_render, recorte, f)
+        )
+
+    def _renderizar_imagem(self, tipo, pagina, rotacao, zoom, recorte, rapido):
+        """
+        Aplica rotação e zoom a uma página (executado em thread de trabalho).
+
+        Apenas o trecho da página indicado em recorte é redimensionado, em
+        vez da página inteira.
+
+        Args:
+            tipo: Documento do painel ('incra', 'memorial' ou 'projeto')
+            pagina: Índice da página
+            rotacao: Ângulo de rotação (0, 90, 180, 270)
+            zoom: Fator de zoom
+            recorte: Trecho (x0, y0, x1, y1) em coordenadas da página ampliada
+            rapido: Se True, usa o filtro rápido (NEAREST) em vez do BICUBIC
+
+        Returns:
+            Imagem PIL pronta para ser convertida em PhotoImage
+        """
+        img_base = self._obter_pagina_rotacionada(tipo, pagina, rotacao)
+
+        # Converter o recorte para coordenadas da página original
+        x0, y0, x1, y1 = recorte
+        caixa = (
+            x0 / zoom,
+            y0 / zoom,
+            min(img_base.width, x1 / zoom),
+            min(img_base.height, y1 / zoom),
+        )
+
+        # Recorte e zoom numa única passada: o resize lê direto da caixa de
+        # origem (com precisão subpixel), sem criar uma cópia intermediária
+        filtro = Image.Resampling.NEAREST if rapido else Image.Resampling.BICUBIC
+        return img_base.resize((x1 - x0, y1 - y0), filtro, box=caixa)
+
+    def _agendar_conclusao_render(self, tipo, geracao, chave, recorte, futuro):
+        """Repassa o resultado da thread de trabalho para a thread do Tk."""
+        if futuro.cancelled():
+            return
+        try:
+            self.janela.after(0, self._concluir_render, tipo, geracao, chave, recorte, futuro)
+        except (tk.TclError, RuntimeError):
+            # Janela já fechada
+            pass
+
+    def _concluir_render(self, tipo, geracao, chave, recorte, futuro):
+        """Converte a imagem renderizada em PhotoImage e a exibe (thread do Tk)."""
+        estado = self.estados[tipo]
+        if geracao != estado.geracao:
+            return  # Pedido superado por outro mais recente
+        estado.futuro = None
+
+        try:
+            img_zoom = futuro.result()
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao exibir página:\n{str(e)}", parent=self.janela)
+            return
+
         photo = ImageTk.PhotoImage(img_zoom)
-        setattr(self, f'{tipo}_photo', photo)  # Manter referência
-        
-        # Limpar canvas e exibir imagem
-        canvas.delete("all")
-        canvas.create_image(pos_x, pos_y, anchor=tk.NW, image=photo, tags='imagem')
+        self._cache_render.guardar(chave, photo, img_zoom.width * img_zoom.height)
+        self._instalar_imagem(tipo, photo, recorte)
+
+    def _instalar_imagem(self, tipo, photo, recorte):
+        """Exibe a PhotoImage (um recorte da página) no canvas, na posição atual."""
+        estado = self.estados[tipo]
+        estado.photo = photo  # Manter referência (a anterior é liberada aqui)
+        estado.recorte = recorte
+
+        # O recorte fica deslocado em relação ao canto da página
+        x = estado.pos_x + recorte[0]
+        y = estado.pos_y + recorte[1]
+        
+        # Criar o item de imagem uma única vez e depois só trocar imagem e posição
+        canvas = estado.canvas
+        if estado.item_imagem is None:
+            estado.item_imagem = canvas.create_image(
+                x, y, anchor=tk.NW, image=photo, tags='imagem'
+            )
+        else:
+            canvas.itemconfig(estado.item_imagem, image=photo)
+            canvas.coords(estado.item_imagem, x, y)
         canvas.config(scrollregion=canvas.bbox("all"))
+
+    def _recorte_cobre_viewport(self, estado):
+        """Indica se o recorte exibido cobre toda a área visível do canvas."""
+        if estado.recorte is None:
+            return True
+
+        x0, y0, x1, y1 = estado.recorte
+        canvas = estado.canvas
+        visivel_x0 = max(0, -estado.pos_x)
+        visivel_y0 = max(0, -estado.pos_y)
+        visivel_x1 = min(estado.largura_exibida, canvas.winfo_width() - estado.pos_x)
+        visivel_y1 = min(estado.altura_exibida, canvas.winfo_height() - estado.pos_y)
+        return x0 <= visivel_x0 and y0 <= visivel_y0 and visivel_x1 <= x1 and visivel_y1 <= y1
+
+    def _verificar_recorte(self, tipo):
+        """Renderiza um novo recorte se o atual não cobrir mais a área visível."""
+        if not self._recorte_cobre_viewport(self.estados[tipo]):
+            self._exibir_pagina(tipo)
+
+    def _fechar(self):
+        """Encerra as renderizações pendentes e fecha a janela."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.janela.destroy()
         
-        # Atualizar label de página
-        label_pagina = getattr(self, f'{tipo}_label_pagina')
-        label_pagina.config(text=f"Página {pagina + 1}/{len(images)}")
-        
-        # Atualizar label de zoom
-        label_zoom = getattr(self, f'{tipo}_label_zoom')
-        label_zoom.config(text=f"{int(zoom * 100)}%")
-        
-        # Atualizar label de rotação
-        label_rotacao = getattr(self, f'{tipo}_label_rotacao')
-        label_rotacao.config(text=f"{rotacao}°")
-        
+    def _obter_pagina_rotacionada(self, tipo, pagina, rotacao):
+        """
+        Retorna a página em resolução original já com a rotação aplicada.
+
+        Args:
+            tipo: Documento do painel ('incra', 'memorial' ou 'projeto')
+            pagina: Índice da página
+            rotacao: Ângulo de rotação (0, 90, 180, 270)
+
+        Returns:
+            Imagem PIL rotacionada (a própria página quando rotacao é 0)
+        """
+        img_original = self.estados[tipo].imagens[pagina]
+        if rotacao == 0:
+            return img_original
+
+        chave = (tipo, pagina, rotacao)
+        img_rotacionada = self._cache_rotacao.obter(chave)
+        if img_rotacionada is None:
+            img_rotacionada = img_original.transpose(TRANSPOSICAO_ROTACAO[rotacao])
+            self._cache_rotacao.guardar(chave, img_rotacionada)
+        return img_rotacionada
+
     def _mudar_pagina(self, tipo, direcao):
         """Muda para página anterior ou próxima."""
-        images = getattr(self, f'{tipo}_images')
-        pagina_atual = getattr(self, f'{tipo}_pagina')
-        
-        nova_pagina = pagina_atual + direcao
+        estado = self.estados[tipo]
+        nova_pagina = estado.pagina + direcao
         
         # Verificar limites
-        if 0 <= nova_pagina < len(images):
-            setattr(self, f'{tipo}_pagina', nova_pagina)
+        if 0 <= nova_pagina < len(estado.imagens):
+            estado.pagina = nova_pagina
             self._exibir_pagina(tipo)
             
-    def _ajustar_zoom(self, tipo, delta):
-        """Ajusta o nível de zoom."""
-        zoom_atual = getattr(self, f'{tipo}_zoom')
-        novo_zoom = max(0.2, min(3.0, zoom_atual + delta))  # Limitar entre 20% e 300%
-        
-        setattr(self, f'{tipo}_zoom', novo_zoom)
+    def _ajustar_zoom(self, tipo, passos):
+        """
+        Ajusta o nível de zoom.
+
+        Args:
+            tipo: Documento do painel ('incra', 'memorial' ou 'projeto')
+            passos: Quantidade de níveis de ESCALA_ZOOM a avançar (negativo reduz)
+        """
+        estado = self.estados[tipo]
+        estado.zoom_passo = max(0, min(len(ESCALA_ZOOM) - 1, estado.zoom_passo + passos))
         self._exibir_pagina(tipo)
         
     def _resetar_zoom(self, tipo):
         """Reseta o zoom para 100%."""
-        setattr(self, f'{tipo}_zoom', 1.0)
+        self.estados[tipo].zoom_passo = PASSO_ZOOM_100
         self._exibir_pagina(tipo)
     
     def _girar_imagem(self, tipo):
-        """Gira a imagem em 90 graus no sentido horário."""
-        rotacao_atual = getattr(self, f'{tipo}_rotacao')
-        nova_rotacao = (rotacao_atual + 90) % 360
-        setattr(self, f'{tipo}_rotacao', nova_rotacao)
+        """
+        Gira a imagem em 90 graus no sentido horário.
+
+        Cliques seguidos são acumulados e aplicados juntos, com um único
+        redesenho na orientação final.
+        """
+        estado = self.estados[tipo]
+        estado.giros_pendentes += 1
+        if estado.giros_pendentes == 1:
+            estado.canvas.after(self.INTERVALO_ROTACAO_MS, self._aplicar_giros_pendentes, tipo)
+
+    def _aplicar_giros_pendentes(self, tipo):
+        """Aplica de uma só vez as rotações acumuladas por _girar_imagem."""
+        estado = self.estados[tipo]
+        estado.rotacao = (estado.rotacao + 90 * estado.giros_pendentes) % 360
+        estado.giros_pendentes = 0
         
         # Resetar posição ao girar
-        setattr(self, f'{tipo}_pos_x', 0)
-        setattr(self, f'{tipo}_pos_y', 0)
+        estado.pos_x = 0
+        estado.pos_y = 0
         
         self._exibir_pagina(tipo)
     
     def _resetar_rotacao(self, tipo):
         """Reseta a rotação para 0 graus."""
-        setattr(self, f'{tipo}_rotacao', 0)
-        setattr(self, f'{tipo}_pos_x', 0)
-        setattr(self, f'{tipo}_pos_y', 0)
+        estado = self.estados[tipo]
+        estado.rotacao = 0
+        estado.pos_x = 0
+        estado.pos_y = 0
         self._exibir_pagina(tipo)
     
     def _iniciar_arrasto(self, tipo, event):
         """Inicia o arrasto da imagem."""
-        canvas = getattr(self, f'{tipo}_canvas')
-        canvas.config(cursor="fleur")  # Cursor de mover
-        setattr(self, f'{tipo}_drag_start', (event.x, event.y))
+        estado = self.estados[tipo]
+        self._definir_cursor(estado, "fleur")  # Cursor de mover
+        estado.drag_start = (event.x, event.y)
     
     def _arrastar(self, tipo, event):
         """Arrasta a imagem."""
-        drag_start = getattr(self, f'{tipo}_drag_start')
-        if drag_start is None:
+        estado = self.estados[tipo]
+        if estado.drag_start is None:
             return
         
-        # Calcular deslocamento
-        dx = event.x - drag_start[0]
-        dy = event.y - drag_start[1]
-        
-        # Atualizar posição
-        pos_x = getattr(self, f'{tipo}_pos_x')
-        pos_y = getattr(self, f'{tipo}_pos_y')
+        # Calcular a nova posição, sem deixar a imagem sair do canvas
+        canvas = estado.canvas
+        novo_x = limitar_posicao(
+            estado.pos_x, event.x - estado.drag_start[0],
+            estado.largura_exibida, canvas.winfo_width()
+        )
+        novo_y = limitar_posicao(
+            estado.pos_y, event.y - estado.drag_start[1],
+            estado.altura_exibida, canvas.winfo_height()
+        )
+        dx = novo_x - estado.pos_x
+        dy = novo_y - estado.pos_y
         
-        setattr(self, f'{tipo}_pos_x', pos_x + dx)
-        setattr(self, f'{tipo}_pos_y', pos_y + dy)
+        # Atualizar posição (usada no próximo redesenho completo)
+        estado.pos_x = novo_x
+        estado.pos_y = novo_y
         
         # Atualizar ponto de início
-        setattr(self, f'{tipo}_drag_start', (event.x, event.y))
+        estado.drag_start = (event.x, event.y)
         
-        # Redesenhar
-        self._exibir_pagina(tipo)
+        # Mover a imagem já exibida, sem reprocessá-la
+        if estado.item_imagem is not None and (dx or dy):
+            canvas.move(estado.item_imagem, dx, dy)
     
     def _finalizar_arrasto(self, tipo):
         """Finaliza o arrasto da imagem."""
-        canvas = getattr(self, f'{tipo}_canvas')
-        canvas.config(cursor="")  # Cursor normal
-        setattr(self, f'{tipo}_drag_start', None)
+        estado = self.estados[tipo]
+        self._definir_cursor(estado, "")  # Cursor normal
+        estado.drag_start = None
+
+        # O arrasto pode ter trazido para a tela partes fora do recorte renderizado
+        self._verificar_recorte(tipo)
+
+    def _definir_cursor(self, estado, cursor):
+        """Altera o cursor do canvas apenas se ele for diferente do atual."""
+        if estado.cursor != cursor:
+            estado.canvas.config(cursor=cursor)
+            estado.cursor = cursor
     
     def _zoom_scroll(self, tipo, event):
-        """Ajusta o zoom com o scroll do mouse."""
-        # Determinar direção do scroll
-        if event.num == 4 or event.delta > 0:
+        """
+        Ajusta o zoom com o scroll do mouse.
+
+        Cada clique completo da roda vale um nível da escala. Touchpads de
+        alta precisão enviam muitos eventos com delta pequeno, que são somados
+        até completar um clique em vez de virarem um nível cada.
+        """
+        estado = self.estados[tipo]
+
+        # Linux (X11): botões 4 e 5, sempre um clique por evento
+        if event.num == 4:
             # Scroll para cima = zoom in
-            delta = 0.1
-        elif event.num == 5 or event.delta < 0:
+            passos = 1
+        elif event.num == 5:
             # Scroll para baixo = zoom out
-            delta = -0.1
+            passos = -1
         else:
+            estado.delta_roda += event.delta
+            passos = int(estado.delta_roda / self._delta_clique_roda)
+            if not passos:
+                return
+            estado.delta_roda -= passos * self._delta_clique_roda
+        
+        # Acumular e aplicar uma vez por ciclo
+        estado.zoom_pendente += passos
+        if not estado.zoom_agendado:
+            estado.zoom_agendado = True
+            estado.canvas.after(self.INTERVALO_ZOOM_MS, self._aplicar_zoom_pendente, tipo)
+
+    def _aplicar_zoom_pendente(self, tipo):
+        """
+        Aplica de uma só vez os níveis de zoom acumulados pelo scroll.
+
+        Uma rajada de eventos da roda do mouse gera um único redesenho,
+        já no nível final, em vez de um redesenho por evento.
+        """
+        estado = self.estados[tipo]
+        novo_passo = max(0, min(len(ESCALA_ZOOM) - 1, estado.zoom_passo + estado.zoom_pendente))
+        estado.zoom_pendente = 0
+        estado.zoom_agendado = False
+
+        if novo_passo == estado.zoom_passo:
             return
-        
-        # Ajustar zoom
-        zoom_atual = getattr(self, f'{tipo}_zoom')
-        novo_zoom = max(0.2, min(5.0, zoom_atual + delta))  # Limitar entre 20% e 500%
-        
-        setattr(self, f'{tipo}_zoom', novo_zoom)
+
+        estado.zoom_passo = novo_passo
+        self._iniciar_interacao(tipo)
+        self._agendar_qualidade_final(tipo)
+        self._exibir_pagina(tipo)
+
+    def _iniciar_interacao(self, tipo):
+        """Passa a redesenhar com o filtro rápido e cancela o redesenho final pendente."""
+        estado = self.estados[tipo]
+        estado.interagindo = True
+        if estado.job_qualidade is not None:
+            estado.canvas.after_cancel(estado.job_qualidade)
+            estado.job_qualidade = None
+
+    def _agendar_qualidade_final(self, tipo):
+        """Agenda o redesenho em alta qualidade após um intervalo sem interação."""
+        estado = self.estados[tipo]
+        if estado.job_qualidade is not None:
+            estado.canvas.after_cancel(estado.job_qualidade)
+        estado.job_qualidade = estado.canvas.after(
+            self.ATRASO_QUALIDADE_MS, self._redesenhar_qualidade_final, tipo
+        )
+
+    def _redesenhar_qualidade_final(self, tipo):
+        """Redesenha a página com o filtro de alta qualidade."""
+        estado = self.estados[tipo]
+        estado.job_qualidade = None
+        estado.interagindo = False
         self._exibir_pagina(tipo)
 
 
@@ -7,39 +7,528 @@ Autor: Sistema Automatizado
 Versão: 3.0 - Com extração para Excel integrada
 """
 
+import io
 import os
 import sys
+import hashlib
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 from tkinter import ttk
 from pathlib import Path
 import threading
-from typing import List, Optional, Dict
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import zip_longest
+from typing import Optional, Dict
 import json
+import queue
+import re
+import shutil
 import tempfile
+import time
+import importlib.util
+
+
+def _verificar_modulo(nome: str):
+    """Lança ImportError se o módulo não estiver instalado (sem importá-lo)."""
+    try:
+        encontrado = importlib.util.find_spec(nome) is not None
+    except ModuleNotFoundError:
+        encontrado = False
+    if not encontrado:
+        raise ImportError(f"No module named '{nome}'")
+
 
 try:
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
     from PIL import Image, ImageTk
-    import google.generativeai as genai
-    from openpyxl import load_workbook
-    # Importar funções de extração do script existente
-    from process_memorial_descritivo_v2 import (
-        extract_table_from_pdf,
-        extrair_memorial_incra,
-        create_excel_file
-    )
+    # google-generativeai, openpyxl e o script de extração são pesados para
+    # carregar e só são usados na comparação: são importados no primeiro uso.
+    # Aqui apenas se confirma que estão disponíveis
+    _verificar_modulo("google.generativeai")
+    _verificar_modulo("openpyxl")
+    _verificar_modulo("docx")  # python-docx, importado por process_memorial_descritivo_v2
+    _verificar_modulo("process_memorial_descritivo_v2")
 except ImportError as e:
     print(f"❌ Erro: Biblioteca necessária não encontrada: {e}")
     print("\nInstale as dependências com:")
-    print("pip install pdf2image Pillow google-generativeai openpyxl --break-system-packages")
+    print("pip install pdf2image Pillow google-generativeai openpyxl python-docx --break-system-packages")
     print("\nNota: Também é necessário ter o 'poppler-utils' instalado no sistema.")
     print("Certifique-se de que process_memorial_descritivo_v2.py está no mesmo diretório.")
     sys.exit(1)
 
 
+# Resolução das páginas exibidas na comparação visual manual (zoom 100%)
+DPI_VISUALIZACAO = 150
+
+# Resoluções usadas para rasterizar as páginas quando o zoom é menor que 100%
+# (a menor que ainda cobre o tamanho exibido, para não gerar pixels descartados)
+NIVEIS_DPI_VISUALIZACAO = (50, 75, 100, DPI_VISUALIZACAO)
+
+# Rotação horária da comparação visual (múltiplos de 90°) → transposição
+# equivalente a rotate(-graus, expand=True), sem interpolação
+TRANSPOSICOES_ROTACAO = {
+    90: Image.Transpose.ROTATE_270,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_90,
+}
+
+# Versão das extrações salvas em disco; incrementar quando os prompts ou o
+# formato de extração de process_memorial_descritivo_v2 mudarem
+VERSAO_CACHE_EXTRACAO = 1
+
+
+# Sequências de dois ou mais espaços nos valores comparados do relatório
+RE_ESPACOS_MULTIPLOS = re.compile(r" {2,}")
+
+# Ponto decimal → vírgula (padrão brasileiro) nos valores comparados
+TABELA_DECIMAL = str.maketrans(".", ",")
+
+# Caracteres Unicode especiais das coordenadas do projeto:
+# ′ (U+2032 prime) → ' (aspas simples), ″ (U+2033 double prime) → " (aspas duplas)
+TABELA_PRIMOS = str.maketrans({"′": "'", "″": '"'})
+
+# Partes fixas do relatório de comparação, formatadas com % onde há valores
+
+# Início do relatório de comparação: documento, estilos e título
+HTML_CABECALHO = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Relatório de Conferência - Georreferenciamento</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #2c3e50;
+            text-align: center;
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #34495e;
+            background-color: #ecf0f1;
+            padding: 10px;
+            border-radius: 5px;
+            margin-top: 30px;
+        }
+        .info-box {
+            background-color: #e8f4f8;
+            border-left: 4px solid #3498db;
+            padding: 15px;
+            margin: 20px 0;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }
+        th {
+            background-color: #3498db;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            font-weight: bold;
+        }
+        td {
+            padding: 10px;
+            border: 1px solid #ddd;
+        }
+        tr:nth-child(even) {
+            background-color: #f9f9f9;
+        }
+        .identico {
+            background-color: #d4edda !important;
+        }
+        .diferente {
+            background-color: #f8d7da !important;
+        }
+        .status-ok {
+            color: #28a745;
+            font-weight: bold;
+        }
+        .status-erro {
+            color: #dc3545;
+            font-weight: bold;
+        }
+        .resumo {
+            background-color: #fff3cd;
+            border: 2px solid #ffc107;
+            padding: 20px;
+            border-radius: 5px;
+            margin: 20px 0;
+        }
+        .resumo h3 {
+            color: #856404;
+            margin-top: 0;
+        }
+        .destaque {
+            font-size: 1.1em;
+            font-weight: bold;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>📋 RELATÓRIO DE CONFERÊNCIA DE GEORREFERENCIAMENTO</h1>
+        <p style="text-align: center; color: #7f8c8d;"><strong>Versão 3.0 - Comparação de Dados Estruturados (Excel)</strong></p>
+"""
+
+# Estatísticas e início da tabela de vértices (total INCRA, total PROJETO)
+HTML_TABELA_VERTICE = """
+        <div class="info-box">
+            <p><strong>📊 Estatísticas:</strong></p>
+            <ul>
+                <li>Total de vértices INCRA: <strong>%d</strong></li>
+                <li>Total de vértices PROJETO: <strong>%d</strong></li>
+            </ul>
+        </div>
+
+        <h2>📐 COMPARAÇÃO: INCRA vs. PROJETO/PLANTA</h2>
+
+        <table>
+            <thead>
+                <tr>
+                    <th style="width: 80px;">Vértice</th>
+                    <th style="width: 120px;">Campo</th>
+                    <th>INCRA</th>
+                    <th>PROJETO</th>
+                    <th style="width: 100px;">Status</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+
+# Fechamento das tabelas de comparação
+HTML_FIM_TABELA = """
+            </tbody>
+        </table>
+"""
+
+# Início da tabela de segmentos vante
+HTML_TABELA_SEGMENTO = """
+        <h2>🔄 COMPARAÇÃO: SEGMENTO VANTE</h2>
+
+        <table>
+            <thead>
+                <tr>
+                    <th style="width: 80px;">Vértice</th>
+                    <th style="width: 120px;">Campo</th>
+                    <th>INCRA</th>
+                    <th>PROJETO</th>
+                    <th style="width: 100px;">Status</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+
+# Resumo da comparação (totais, cor e texto do resultado, aviso de revisão)
+HTML_RESUMO = """
+        <div class="resumo">
+            <h3>📊 RESUMO DA COMPARAÇÃO</h3>
+            <p class="destaque">Total de vértices analisados: %d</p>
+
+            <h4 style="margin-top: 20px; color: #2c3e50;">📍 VÉRTICE (Código, Longitude, Latitude, Altitude):</h4>
+            <p>✅ Idênticos: <strong style="color: #28a745;">%d</strong></p>
+            <p>❌ Diferentes: <strong style="color: #dc3545;">%d</strong></p>
+
+            <h4 style="margin-top: 20px; color: #2c3e50;">🔄 SEGMENTO VANTE (Código, Azimute, Distância):</h4>
+            <p>✅ Idênticos: <strong style="color: #28a745;">%d</strong></p>
+            <p>❌ Diferentes: <strong style="color: #dc3545;">%d</strong></p>
+
+            <hr style="margin: 20px 0;">
+
+            <h4 style="color: #2c3e50;">🎯 TOTAL GERAL:</h4>
+            <p>✅ Total idênticos: <strong style="color: #28a745;">%d</strong></p>
+            <p>❌ Total diferentes: <strong style="color: #dc3545;">%d</strong></p>
+
+            <hr style="margin: 20px 0;">
+            <p class="destaque" style="color: %s; font-size: 1.2em;">%s</p>
+            %s
+        </div>
+"""
+
+# Aviso do resumo quando há diferenças
+HTML_AVISO_REVISAO = '<p style="color: #856404;">Por favor, revise os itens marcados como DIFERENTE nas tabelas acima.</p>'
+
+# Informações do processo e fim do relatório (Excel do INCRA, Excel do PROJETO)
+HTML_RODAPE = """
+        <div class="info-box">
+            <h3>📁 INFORMAÇÕES DO PROCESSO</h3>
+            <p><strong>Arquivos Excel gerados para auditoria:</strong></p>
+            <ul>
+                <li>INCRA: <code>%s</code></li>
+                <li>PROJETO: <code>%s</code></li>
+            </ul>
+        </div>
+
+        <p style="text-align: center; color: #7f8c8d; margin-top: 40px;">
+            <em>Relatório gerado automaticamente - Versão 3.0</em>
+        </p>
+    </div>
+</body>
+</html>
+"""
+
+# Status exibido em cada vértice/segmento comparado
+HTML_STATUS_IDENTICO = '<span class="status-ok">✅ IDÊNTICO</span>'
+HTML_STATUS_DIFERENTE = '<span class="status-erro">❌ DIFERENTE</span>'
+
+# Classe da linha e status, indexados pelo resultado da comparação (False/True)
+CLASSES_STATUS = ("diferente", "identico")
+TEXTOS_STATUS = (HTML_STATUS_DIFERENTE, HTML_STATUS_IDENTICO)
+
+# Modelos das linhas das tabelas do relatório de comparação, formatados com %
+# (os valores entram na ordem em que aparecem no HTML)
+
+# Linhas de um vértice presente nos dois documentos (Código, Longitude, Latitude, Altitude)
+HTML_LINHAS_VERTICE = """
+                <tr class="%s">
+                    <td rowspan="4" style="text-align: center; vertical-align: middle; font-weight: bold;">#%d</td>
+                    <td><strong>Código</strong></td>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td rowspan="4" style="text-align: center; vertical-align: middle;">%s</td>
+                </tr>
+                <tr class="%s">
+                    <td><strong>Longitude</strong></td>
+                    <td>%s</td>
+                    <td>%s</td>
+                </tr>
+                <tr class="%s">
+                    <td><strong>Latitude</strong></td>
+                    <td>%s</td>
+                    <td>%s</td>
+                </tr>
+                <tr class="%s">
+                    <td><strong>Altitude</strong></td>
+                    <td>%s</td>
+                    <td>%s</td>
+                </tr>
+"""
+
+# Vértice do INCRA sem correspondente no projeto
+HTML_VERTICE_AUSENTE = """
+                <tr class="diferente">
+                    <td style="text-align: center; font-weight: bold;">#%d</td>
+                    <td colspan="3"><strong>❌ AUSENTE NO PROJETO</strong> - Código INCRA: %s</td>
+                    <td style="text-align: center;"><span class="status-erro">❌ ERRO</span></td>
+                </tr>
+"""
+
+# Vértice do projeto sem correspondente no INCRA
+HTML_VERTICE_EXTRA = """
+                <tr class="diferente">
+                    <td style="text-align: center; font-weight: bold;">#%d</td>
+                    <td colspan="3"><strong>❌ EXTRA NO PROJETO</strong> (não existe no INCRA) - Código: %s</td>
+                    <td style="text-align: center;"><span class="status-erro">❌ ERRO</span></td>
+                </tr>
+"""
+
+# Linhas do segmento vante presente nos dois documentos (Código, Azimute, Distância)
+HTML_LINHAS_SEGMENTO = """
+                <tr class="%s">
+                    <td rowspan="3" style="text-align: center; vertical-align: middle; font-weight: bold;">#%d</td>
+                    <td><strong>Código</strong></td>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td rowspan="3" style="text-align: center; vertical-align: middle;">%s</td>
+                </tr>
+                <tr class="%s">
+                    <td><strong>Azimute</strong></td>
+                    <td>%s</td>
+                    <td>%s</td>
+                </tr>
+                <tr class="%s">
+                    <td><strong>Dist. (m)</strong></td>
+                    <td>%s</td>
+                    <td>%s</td>
+                </tr>
+"""
+
+# Segmento vante do INCRA sem correspondente no projeto
+HTML_SEGMENTO_AUSENTE = """
+                <tr class="diferente">
+                    <td style="text-align: center; font-weight: bold;">#%d</td>
+                    <td colspan="3"><strong>❌ AUSENTE NO PROJETO</strong></td>
+                    <td style="text-align: center;"><span class="status-erro">❌ ERRO</span></td>
+                </tr>
+"""
+
+# Segmento vante do projeto sem correspondente no INCRA
+HTML_SEGMENTO_EXTRA = """
+                <tr class="diferente">
+                    <td style="text-align: center; font-weight: bold;">#%d</td>
+                    <td colspan="3"><strong>❌ EXTRA NO PROJETO</strong></td>
+                    <td style="text-align: center;"><span class="status-erro">❌ ERRO</span></td>
+                </tr>
+"""
+
+# Os modelos acima ficam indentados para leitura; no arquivo gerado, cada
+# sequência de espaços e quebras de linha vira um único espaço (o navegador
+# exibe igual e o relatório fica bem menor)
+RE_ESPACOS_HTML = re.compile(r"\s+")
+(HTML_CABECALHO, HTML_TABELA_VERTICE, HTML_FIM_TABELA, HTML_TABELA_SEGMENTO,
+ HTML_RESUMO, HTML_RODAPE, HTML_LINHAS_VERTICE, HTML_VERTICE_AUSENTE,
+ HTML_VERTICE_EXTRA, HTML_LINHAS_SEGMENTO, HTML_SEGMENTO_AUSENTE,
+ HTML_SEGMENTO_EXTRA) = (
+    RE_ESPACOS_HTML.sub(" ", modelo).strip() for modelo in (
+        HTML_CABECALHO, HTML_TABELA_VERTICE, HTML_FIM_TABELA, HTML_TABELA_SEGMENTO,
+        HTML_RESUMO, HTML_RODAPE, HTML_LINHAS_VERTICE, HTML_VERTICE_AUSENTE,
+        HTML_VERTICE_EXTRA, HTML_LINHAS_SEGMENTO, HTML_SEGMENTO_AUSENTE,
+        HTML_SEGMENTO_EXTRA,
+    )
+)
+
+
+def _converter_pagina_pdf(pdf_path: str, pagina: int, dpi: int) -> Image.Image:
+    """
+    Converte uma única página de um PDF em imagem.
+
+    Usada pela comparação visual manual, que só rasteriza as páginas
+    exibidas (e as vizinhas) em vez do documento inteiro; o cache das
+    páginas fica na janela (JanelaComparacaoManual._paginas).
+
+    Args:
+        pdf_path: Caminho do arquivo PDF
+        pagina: Índice da página (começando em 0)
+        dpi: Resolução da conversão
+
+    Returns:
+        Objeto PIL.Image da página
+    """
+    return convert_from_path(
+        pdf_path, dpi=dpi, first_page=pagina + 1, last_page=pagina + 1
+    )[0]
+
+
+def _dpi_para_zoom(zoom: float) -> int:
+    """
+    Escolhe a resolução de rasterização para um nível de zoom da comparação visual.
+
+    Retorna o menor nível de NIVEIS_DPI_VISUALIZACAO que ainda cobre
+    DPI_VISUALIZACAO * zoom; acima de 100% usa DPI_VISUALIZACAO e amplia.
+
+    Args:
+        zoom: Nível de zoom (1.0 = 100%)
+
+    Returns:
+        DPI a usar na conversão da página
+    """
+    necessario = DPI_VISUALIZACAO * zoom
+    for dpi in NIVEIS_DPI_VISUALIZACAO:
+        if dpi >= necessario:
+            return dpi
+    return DPI_VISUALIZACAO
+
+
+@lru_cache(maxsize=32)
+def _nomes_arquivo(caminho: str) -> tuple:
+    """
+    Retorna o nome e o nome sem extensão de um arquivo, guardados em cache.
+
+    Os mesmos caminhos escolhidos na interface são usados várias vezes em
+    cada comparação; assim o Path é montado uma única vez por caminho.
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Returns:
+        Tupla (nome, nome_sem_extensao)
+    """
+    path = Path(caminho)
+    return path.name, path.stem
+
+
+def _calcular_hash_arquivo(caminho: str) -> str:
+    """
+    Calcula o SHA-256 do conteúdo de um arquivo, lendo-o em blocos.
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Returns:
+        Hash em hexadecimal
+    """
+    sha = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+
+def _normalizar_coordenada(coord: str) -> str:
+    """
+    Normaliza coordenadas para comparação, ignorando diferenças de formato.
+    Remove "-" do INCRA e "W"/"S" do projeto para comparação equivalente.
+    Normaliza caracteres Unicode especiais (prime → aspas normais).
+
+    Exemplos:
+    - INCRA: "-48°34'14,782"" → "48°34'14,782""
+    - PROJETO: "48°34′14,782" W" → "48°34'14,782""
+    """
+    if not coord:
+        return ""
+
+    # Converter para string, remover espaços em branco e normalizar
+    # caracteres Unicode especiais (prime → aspas) numa única passada
+    coord = str(coord).strip().translate(TABELA_PRIMOS)
+
+    # Remover "-" do início (INCRA)
+    if coord.startswith("-"):
+        coord = coord[1:].strip()
+
+    # Remover " W" ou " S" do final (PROJETO)
+    coord = coord.replace(" W", "").replace(" S", "")
+
+    # Remover aspas e espaços extras
+    return coord.strip().strip('"').strip("'").strip()
+
+
+def _limpar_string(valor) -> str:
+    """
+    Limpa qualquer valor convertendo para string e removendo espaços em branco.
+    Remove também caracteres invisíveis que podem causar diferenças falsas.
+    Converte pontos decimais em vírgulas para padronização numérica brasileira.
+    """
+    if valor is None:
+        return ""
+
+    # Converter para string e aplicar strip múltiplas vezes
+    valor_limpo = str(valor).strip()
+
+    # Remover espaços duplos internos (numa única passada)
+    if "  " in valor_limpo:
+        valor_limpo = RE_ESPACOS_MULTIPLOS.sub(" ", valor_limpo)
+
+    # Converter ponto decimal para vírgula (padrão brasileiro)
+    return valor_limpo.translate(TABELA_DECIMAL)
+
+
 class VerificadorGeorreferenciamento:
     """Classe principal da aplicação de verificação de documentos."""
+
+    # Quantidade de extrações (PDF → Excel) mantidas em memória
+    MAX_EXTRACOES_CACHE = 32
+
+    # Intervalo mínimo (s) entre atualizações da barra de status
+    INTERVALO_STATUS = 0.1
+
+    # Intervalo (ms) com que as mensagens da análise são levadas à área de resultados
+    INTERVALO_RESULTADO_MS = 50
     
     def __init__(self, root):
         self.root = root
@@ -54,15 +543,30 @@ class VerificadorGeorreferenciamento:
         self.projeto_path = tk.StringVar()
         self.api_key = tk.StringVar()
 
-        # Variáveis para armazenar imagens processadas (para comparação visual)
-        self.incra_images: List[Image.Image] = []
-        self.projeto_images: List[Image.Image] = []
-
         # Variáveis para armazenar dados extraídos (nova funcionalidade v3)
         self.incra_excel_path: Optional[str] = None
         self.projeto_excel_path: Optional[str] = None
         self.incra_data: Optional[Dict] = None
         self.projeto_data: Optional[Dict] = None
+
+        # Diretório temporário para os Excel e o relatório HTML. Usa
+        # tempfile.gettempdir() que é multiplataforma (Windows/Linux/Mac); é
+        # (re)criado antes de cada gravação, caso um limpador de temporários o remova
+        self._tmp_dir = Path(tempfile.gettempdir()) / "conferencia_geo"
+
+        # Extrações já feitas, por (hash do PDF, tipo) → (excel, dados, mtime do
+        # excel). Evita repetir a chamada ao Gemini ao comparar os mesmos PDFs
+        self._extracoes_cache: OrderedDict = OrderedDict()
+        self._extracoes_lock = threading.Lock()
+
+        # Controle das atualizações da barra de status (ver _atualizar_status)
+        self._status_pendente = ""
+        self._status_agendado = False
+        self._ultimo_status = 0.0
+
+        # Mensagens da análise para a área de resultados (ver _registrar_resultado)
+        self._fila_resultado: queue.Queue = queue.Queue()
+        self._resultado_agendado = False
         
         self._criar_interface()
         
@@ -174,8 +678,9 @@ class VerificadorGeorreferenciamento:
                                       relief=tk.SUNKEN, anchor=tk.W, font=('Arial', 11))
         self.status_label.grid(row=11, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
         
-        # Variável para armazenar o HTML do último relatório
-        self.ultimo_relatorio_html = ""
+        # Arquivo em que o último relatório HTML foi gravado (em streaming) no
+        # diretório temporário; "Salvar relatório" copia esse arquivo
+        self.ultimo_relatorio_html_path: Optional[Path] = None
         
     def _criar_linha_arquivo(self, parent, row, label_text, text_var):
         """Cria uma linha com label, entry e botão para seleção de arquivo."""
@@ -204,7 +709,7 @@ class VerificadorGeorreferenciamento:
             
     def _salvar_relatorio_html(self):
         """Salva o relatório atual em arquivo HTML."""
-        if not self.ultimo_relatorio_html:
+        if not self.ultimo_relatorio_html_path or not self.ultimo_relatorio_html_path.exists():
             messagebox.showwarning("Aviso", "Nenhum relatório para salvar. Execute uma análise primeiro.")
             return
             
@@ -217,8 +722,8 @@ class VerificadorGeorreferenciamento:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.ultimo_relatorio_html)
+                # O relatório já está gravado no diretório temporário
+                shutil.copyfile(self.ultimo_relatorio_html_path, filename)
                 messagebox.showinfo("Sucesso", f"Relatório salvo em:\n{filename}")
             except Exception as e:
                 messagebox.showerror("Erro", f"Erro ao salvar arquivo:\n{str(e)}")
@@ -233,20 +738,19 @@ class VerificadorGeorreferenciamento:
             )
             return
         
-        if not self.memorial_path.get() and not self.projeto_path.get():
+        if not self.projeto_path.get():
             messagebox.showwarning(
                 "Aviso",
-                "Por favor, selecione pelo menos o Memorial ou o Projeto para comparar."
+                "Por favor, selecione o arquivo do Projeto para comparar."
             )
             return
         
-        # Criar e abrir janela de comparação
+        # Criar e abrir janela de comparação (a V3 não usa Memorial)
         try:
             janela_comparacao = JanelaComparacaoManual(
                 self.root,
                 self.incra_path.get(),
-                self.memorial_path.get() if self.memorial_path.get() else None,
-                self.projeto_path.get() if self.projeto_path.get() else None
+                projeto_path=self.projeto_path.get()
             )
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao abrir comparação manual:\n{str(e)}")
@@ -268,1605 +772,324 @@ class VerificadorGeorreferenciamento:
         return True
         
     def _atualizar_status(self, mensagem: str):
-        """Atualiza a barra de status."""
-        self.status_label.config(text=mensagem)
-        self.root.update_idletasks()
-        
-    def _desabilitar_botoes(self):
-        """Desabilita os botões durante o processamento."""
-        self.btn_comparar.config(state='disabled')
-
-    def _habilitar_botoes(self):
-        """Reabilita os botões após o processamento."""
-        self.btn_comparar.config(state='normal')
-
-    # ========== NOVAS FUNÇÕES V3: EXTRAÇÃO PARA EXCEL ==========
-
-    def _extrair_pdf_para_excel(self, pdf_path: str, tipo: str = "normal") -> tuple[str, Dict]:
         """
-        Extrai dados de um PDF memorial para Excel usando Gemini API.
+        Atualiza a barra de status.
 
-        Args:
-            pdf_path: Caminho do arquivo PDF
-            tipo: "incra" para usar extração especializada INCRA, "normal" para outros
-
-        Returns:
-            Tupla (caminho_excel, dados_dict)
+        Pode ser chamado das threads de trabalho: a alteração é feita na thread
+        do Tk. Mensagens enviadas em sequência rápida (menos de INTERVALO_STATUS)
+        são agrupadas e só a mais recente é exibida; mensagens finais (✅/❌)
+        são exibidas sem espera.
         """
-        try:
-            api_key = self.api_key.get().strip()
-
-            # Criar diretório temporário para Excel se não existir
-            # Usa tempfile.gettempdir() que é multiplataforma (Windows/Linux/Mac)
-            output_dir = Path(tempfile.gettempdir()) / "conferencia_geo"
-
-            # Criar diretório com permissões adequadas
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Verificar se o diretório foi criado
-            if not output_dir.exists():
-                raise RuntimeError(f"Não foi possível criar o diretório: {output_dir}")
-
-            # Definir nome do arquivo Excel
-            pdf_name = Path(pdf_path).stem
-            excel_path = output_dir / f"{pdf_name}_extraido.xlsx"
-
-            # Extrair dados usando função apropriada
-            if tipo == "incra":
-                dados = extrair_memorial_incra(Path(pdf_path), api_key)
-            else:
-                dados = extract_table_from_pdf(pdf_path, api_key)
-
-            # Verificar se dados foram extraídos
-            if not dados or 'data' not in dados:
-                raise ValueError("Nenhum dado foi extraído do PDF")
-
-            if not dados['data']:
-                raise ValueError("PDF extraído, mas tabela de dados está vazia")
-
-            # Criar arquivo Excel
-            create_excel_file(dados, str(excel_path))
+        self._status_pendente = mensagem
+        if self._status_agendado:
+            return  # A atualização já agendada exibirá esta mensagem
 
-            # Verificar se o arquivo foi criado
-            if not excel_path.exists():
-                raise RuntimeError(f"Arquivo Excel não foi criado em: {excel_path}\n"
-                                 f"Verifique permissões no diretório: {output_dir}")
-
-            # Verificar se o arquivo tem conteúdo
-            file_size = excel_path.stat().st_size
-            if file_size == 0:
-                raise RuntimeError(f"Arquivo Excel criado mas está vazio: {excel_path}")
-            return str(excel_path), dados
-
-        except Exception as e:
-            error_msg = f"Erro ao extrair PDF para Excel: {str(e)}"
-            print(f"❌ {error_msg}")
-            raise RuntimeError(error_msg) from e
-
-    def _ler_dados_excel(self, excel_path: str) -> Dict:
-        """
-        Lê dados estruturados de um arquivo Excel gerado pela extração.
-
-        Args:
-            excel_path: Caminho do arquivo Excel
-
-        Returns:
-            Dicionário com estrutura padronizada dos dados
-        """
-        wb = load_workbook(excel_path)
-        ws = wb.active
-
-        dados = {
-            "header_row1": ["VÉRTICE", "SEGMENTO VANTE"],
-            "header_row2": ["Código", "Longitude", "Latitude", "Altitude (m)",
-                           "Código", "Azimute", "Dist. (m)", "Confrontações"],
-            "data": []
-        }
-
-        # Ler dados a partir da linha 3 (linhas 1 e 2 são cabeçalhos)
-        for row in ws.iter_rows(min_row=3, values_only=True):
-            if row[0]:  # Se tem código no vértice
-                dados["data"].append(list(row))
-
-        wb.close()
-        return dados
-
-    # ========== FIM NOVAS FUNÇÕES V3 ==========
-
-    def _carregar_pdf_como_imagens(self, pdf_path: str, rotacionar_90: bool = False) -> List[Image.Image]:
-        """
-        Converte um PDF em lista de imagens PIL.
-        
-        Args:
-            pdf_path: Caminho do arquivo PDF
-            rotacionar_90: Se True, rotaciona as imagens 90 graus (para INCRA)
-            
-        Returns:
-            Lista de objetos PIL.Image
-        """
-        try:
-            self._atualizar_status(f"Convertendo PDF: {Path(pdf_path).name}...")
-            
-            # Converter PDF para imagens
-            images = convert_from_path(pdf_path, dpi=200)
-            
-            # Rotacionar se necessário (INCRA em paisagem)
-            if rotacionar_90:
-                self._atualizar_status(f"Rotacionando imagens do INCRA...")
-                images = [img.rotate(-90, expand=True) for img in images]
-                
-            return images
-            
-        except Exception as e:
-            raise Exception(f"Erro ao processar PDF {Path(pdf_path).name}: {str(e)}")
-            
-    def _construir_prompt_gemini(self, incluir_projeto: bool = False, incluir_memorial: bool = True) -> List:
-        """
-        Constrói o prompt multimodal para a API do Gemini.
-        
-        Args:
-            incluir_projeto: Se True, inclui as imagens do projeto na análise
-            incluir_memorial: Se True, inclui as imagens do memorial na análise
-            
-        Returns:
-            Lista contendo strings de texto e objetos PIL.Image
-        """
-        prompt = [
-            "Você é um assistente ESPECIALISTA em análise de documentos de georreferenciamento de imóveis rurais para cartórios no Brasil.",
-            "\n═══════════════════════════════════════════════════════════",
-            "\n=== INSTRUÇÕES CRÍTICAS DE EXTRAÇÃO ===",
-            "\n═══════════════════════════════════════════════════════════",
-            "\n",
-            "\n⚠️⚠️⚠️ ATENÇÃO MÁXIMA - ERROS COMUNS A EVITAR ⚠️⚠️⚠️",
-            "\n",
-            "\n❌ NÃO CONFUNDA:",
-            "\n1. CPF (formato XXX.XXX.XXX-XX) ≠ Código INCRA (formato XXX.XXX.XXX.XXX-X)",
-            "\n   • CPF: 765.656.618-04 (pessoa física)",
-            "\n   • Código INCRA: 951.742.953-1 (imóvel rural)",
-            "\n   • São COMPLETAMENTE diferentes!",
-            "\n",
-            "\n2. Nomes de proprietários DIFERENTES = STATUS ❌ (não ⚠️!)",
-            "\n   • 'PAULO EDUARDO HOTZ' ≠ 'Paulo Gemma Henge'",
-            "\n   • São PESSOAS DIFERENTES! Marque como ❌ ERRO GRAVE!",
-            "\n   • Não diga 'pequena divergência' - é ERRO TOTAL!",
-            "\n",
-            "\n3. Memorial em texto corrido TEM perímetro - PROCURE NO TEXTO!",
-            "\n   • Busque por: 'perímetro de X metros' ou 'perímetro de X m'",
-            "\n   • Exemplo: 'Perímetro (m): 3.873,67 m' ou 'perímetro de 3.873,67 metros'",
-            "\n   • Se encontrar, extraia! Não diga 'Não encontrado'!",
-            "\n",
-            "\n4. Projeto/Planta tem TABELAS - LEIA A TABELA COMPLETA!",
-            "\n   • Projetos em PDF digital têm tabelas de coordenadas",
-            "\n   • Procure por colunas: Código, Longitude, Latitude, Altitude",
-            "\n   • Ou: Código, E (Este), N (Norte)",
-            "\n   • EXTRAIA TODOS OS VÉRTICES DA TABELA!",
-            "\n   • Não invente coordenadas - copie da tabela!",
-            "\n",
-            "\n**FORMATO DOS DOCUMENTOS:**",
-            "\n1. 📋 INCRA: Dados em TABELAS - extraia TODAS as células com precisão",
-            "\n2. 📄 MEMORIAL: Dados em TEXTO CORRIDO - ⚠️ CRÍTICO: LEIA LETRA POR LETRA!",
-            "\n   • O Memorial é um texto em PROSA (parágrafos longos)",
-            "\n   • As informações estão DISPERSAS e MISTURADAS no texto",
-            "\n   • Você DEVE ler com EXTREMA ATENÇÃO cada palavra",
-            "\n   • NÃO invente informações - copie EXATAMENTE como está escrito",
-            "\n   • Exemplo: Se está 'NCXC-P-1032', escreva EXATAMENTE 'NCXC-P-1032'",
-            "\n   • ⚠️ NÃO troque letras! NCXC ≠ NXCX ≠ NCXX ≠ NCCX",
-            "\n3. 🗺️ PROJETO/PLANTA: ",
-            "\n   • Se for PDF DIGITAL (texto selecionável): TEM TABELAS! Leia-as!",
-            "\n   • Se for ESCANEADO (imagem): Extraia visualmente",
-            "\n   • Procure por 'Tabela de Coordenadas' ou grade com vértices",
-            "\n   • NO PROJETO que você está analisando agora: HÁ UMA TABELA NO CANTO!",
-            "\n",
-            "\n**⚠️ ATENÇÃO MÁXIMA AO LER MEMORIAL DESCRITIVO:**",
-            "\nO Memorial é um TEXTO LONGO onde as informações aparecem assim:",
-            "\n'...inicia-se no vértice NCXC-P-1032, de coordenadas (Longitude: -48°40'19,003\", Latitude: -21°00'03,754\"...'",
-            "\nOU:",
-            "\n'Perímetro (m): 3.873,67 m'",
-            "\n",
-            "\nVocê DEVE:",
-            "\n✅ Ler palavra por palavra, letra por letra",
-            "\n✅ Copiar códigos EXATAMENTE: NCXC-P-1032 (não invente NXCX ou similar)",
-            "\n✅ Extrair coordenadas completas (Longitude, Latitude, Altitude se houver)",
-            "\n✅ Identificar TODOS os vértices mesmo que estejam em parágrafos diferentes",
-            "\n✅ Procurar informações em TODO o texto (começo, meio, fim)",
-            "\n✅ Buscar 'Perímetro' ou 'perímetro' no texto - NÃO diga 'não encontrado' sem procurar!",
-            "\n",
-            "\n**⚠️ ATENÇÃO MÁXIMA AO LER PROJETO/PLANTA:**",
-            "\n",
-            "\n🎯 O PROJETO TEM UMA TABELA! Exemplo:",
-            "\n```",
-            "\nCódigo      | Longitude        | Latitude         | Altitude",
-            "\nAKE-V-0166  | 48°34'14,782\" W | 20°50'45,291\" S | 532,78",
-            "\nAKE-M-1028  | 48°34'13,821\" W | 20°50'46,394\" S | 533,92",
-            "\n```",
-            "\n",
-            "\nOU formato UTM:",
-            "\n```",
-            "\nCódigo      | E (Este)  | N (Norte)",
-            "\nAKE-V-0166  | 741319    | 7696237",
-            "\n```",
-            "\n",
-            "\nVocê DEVE:",
-            "\n✅ Procurar pela tabela (geralmente no canto ou no topo)",
-            "\n✅ Ler TODAS as linhas da tabela",
-            "\n✅ Extrair TODOS os vértices listados",
-            "\n✅ Copiar coordenadas EXATAMENTE como na tabela",
-            "\n✅ Se houver 26 vértices na tabela, liste os 26!",
-            "\n✅ NÃO invente coordenadas - só o que está na tabela",
-            "\n",
-            "\n**EQUIVALÊNCIAS SEMÂNTICAS (MUITO IMPORTANTE!):**",
-            "\n- '19,0211 ha' = 'Área: 19.0211 hectares' = 'ÁREA TOTAL (ha): 19,0211'",
-            "\n- 'José da Silva' = 'Sr. José da Silva' = 'JOSÉ DA SILVA' = 'Jose da Silva'",
-            "\n- Vírgula e ponto decimal são equivalentes: 19,02 = 19.02",
-            "\n- Espaços e formatação diferentes não importam",
-            "\n",
-            "\n**⚠️ MAS ATENÇÃO - QUANDO NÃO É EQUIVALENTE:**",
-            "\n- 'PAULO EDUARDO HOTZ' ≠ 'Paulo Gemma Henge' → São PESSOAS DIFERENTES! Status = ❌",
-            "\n- '951.742.953-1' ≠ '765.656.618-04' → Um é Código INCRA, outro é CPF! Status = ❌",
-            "\n- '3.873,67 m' ≠ 'Não encontrado' → Um tem valor, outro não! Status = ❌",
-            "\n- 'Latitude/Longitude' ≠ 'UTM' → Sistemas DIFERENTES! Status = ⚠️",
-            "\n",
-            "\n**⚠️ ATENÇÃO ESPECIAL - INFORMAÇÕES PARCIAIS:**",
-            "\n- Se um documento tem TEXTO PARCIAL de outro, isso NÃO é igual!",
-            "\n- Exemplo ERRADO de considerar igual:",
-            "\n  • INCRA: 'Estrada Municipal'",
-            "\n  • Memorial: 'Estrada Municipal que liga o distrito de São José ao centro'",
-            "\n  → Isso é DIFERENTE! O Memorial tem informação ADICIONAL importante!",
-            "\n- Quando encontrar casos assim, marque como <span class='status-alerta'>⚠️</span>",
-            "\n- E adicione observação: 'VERIFICAR: Um documento tem informação mais completa'",
-            "\n- O usuário DEVE verificar manualmente se a informação adicional é relevante",
-            "\n",
-            "\n**DADOS QUE VOCÊ DEVE EXTRAIR DE CADA DOCUMENTO:**",
-            "\n",
-            "\n✅ **DADOS BÁSICOS:**",
-            "\n   • Proprietário(s) - nome completo EXATO",
-            "\n   • Nome do Imóvel/Propriedade",
-            "\n   • Matrícula(s) do cartório",
-            "\n   • Município e Estado (UF)",
-            "\n   • Código INCRA (código de certificação) - NÃO CONFUNDA COM CPF!",
-            "\n   • CCIR (se houver)",
-            "\n   • Cartório/CNS",
-            "\n",
-            "\n✅ **DADOS TÉCNICOS:**",
-            "\n   • Área Total em hectares (todas as casas decimais)",
-            "\n   • Perímetro em metros - BUSQUE NO TEXTO DO MEMORIAL!",
-            "\n   • Sistema de coordenadas (UTM/Geográfico/SIRGAS)",
-            "\n   • Datum (SIRGAS2000, SAD69, etc)",
-            "\n",
-            "\n✅ **VÉRTICES E COORDENADAS - ⚠️ MÁXIMA ATENÇÃO:**",
-            "\n   • TODOS os vértices (V1, V2, V3, V4, V5, V6...)",
-            "\n   • Códigos COMPLETOS dos vértices (ex: NCXC-P-1032, YGGA-M-0046, AKE-V-0166)",
-            "\n   • ⚠️ COPIE O CÓDIGO EXATAMENTE LETRA POR LETRA!",
-            "\n   • Coordenadas COMPLETAS de cada vértice:",
-            "\n     - Longitude (ex: -48°40'19,003\") OU E=741319 (UTM)",
-            "\n     - Latitude (ex: -21°00'03,754\") OU N=7696237 (UTM)",
-            "\n     - Altitude se houver (ex: 509,05 m)",
-            "\n   • CRÍTICO: Não omita vértices! Liste TODOS que encontrar!",
-            "\n   • No Memorial, os vértices aparecem assim:",
-            "\n     'vértice NCXC-P-1032, de coordenadas (Longitude: -48°40'19,003\", Latitude: -21°00'03,754\"...'",
-            "\n     ou",
-            "\n     '12,68 m até o vértice NCXC-P-1033, de coordenadas...'",
-            "\n   • No Projeto, os vértices estão em TABELAS:",
-            "\n     Procure por tabela com colunas: Código | Longitude | Latitude | Altitude",
-            "\n     Ou: Código | E | N",
-            "\n",
-            "\n✅ **CONFRONTANTES/LIMITES:**",
-            "\n   • Norte: [quem/o quê]",
-            "\n   • Sul: [quem/o quê]",
-            "\n   • Leste: [quem/o quê]",
-            "\n   • Oeste: [quem/o quê]",
-            "\n",
-            "\n--- INÍCIO DOCUMENTO INCRA ---",
-            "\n",
-            "\n🚨🚨🚨 ALERTA CRÍTICO - CÓDIGOS DOS VÉRTICES 🚨🚨🚨",
-            "\n",
-            "\n⚠️⚠️⚠️ PROBLEMA COMUM DE OCR:",
-            "\nO OCR frequentemente CONFUNDE a letra 'K' com 'M'!",
-            "\n",
-            "\n❌ ERRO GRAVÍSSIMO:",
-            "\n   AME-V-0166  ← ERRADO! (K virou M)",
-            "\n   AME-M-1028  ← ERRADO! (K virou M)",
-            "\n   AME-P-3567  ← ERRADO! (K virou M)",
-            "\n",
-            "\n✅ CÓDIGOS CORRETOS:",
-            "\n   AKE-V-0166  ← CORRETO! (com K)",
-            "\n   AKE-M-1028  ← CORRETO! (com K)",
-            "\n   AKE-P-3567  ← CORRETO! (com K)",
-            "\n",
-            "\n🔍 COMO IDENTIFICAR:",
-            "\nOlhe com ATENÇÃO EXTREMA para as primeiras 3 letras do código:",
-            "\n• Se parece 'AME' → É ERRO! Deve ser 'AKE'",
-            "\n• Se parece 'AXE' → É ERRO! Deve ser 'AKE'",
-            "\n• Se parece 'AKF' → É ERRO! Deve ser 'AKE'",
-            "\n",
-            "\n💡 DICA:",
-            "\nNeste documento, o código de credenciamento é 'AKE'.",
-            "\nPORTANTO, TODOS os vértices começam com 'AKE-'!",
-            "\n",
-            "\n⚠️ NUNCA NUNCA NUNCA escreva 'AME'!",
-            "\n⚠️ SEMPRE escreva 'AKE' com a letra K!",
-            "\n",
-            "\n🎯 EXTRAÇÃO ESPECÍFICA DO INCRA - INSTRUÇÕES CIRÚRGICAS",
-            "\n",
-            "\n════════════════════════════════════════════════════════════",
-            "\n                PARTE 1: DADOS CADASTRAIS                   ",
-            "\n════════════════════════════════════════════════════════════",
-            "\n",
-            "\nExtraia APENAS as seguintes informações, NESTA ORDEM:",
-            "\n",
-            "\n1️⃣ **Denominação:**",
-            "\n   • PROCURE: Linha que começa com 'Denominação:'",
-            "\n   • EXTRAIA: SOMENTE o nome do imóvel",
-            "\n   • REMOVA: Qualquer menção a 'Área X', 'Matrícula', números",
-            "\n   • EXEMPLO:",
-            "\n     ❌ Errado: 'Fazenda Monte Rosa - Área 2 – Matrícula n° 27.935'",
-            "\n     ✅ Correto: 'Fazenda Monte Rosa'",
-            "\n",
-            "\n2️⃣ **Proprietário(a):**",
-            "\n   • PROCURE: Linha que começa com 'Proprietário(a):'",
-            "\n   • EXTRAIA: Nome completo do proprietário",
-            "\n   • EXEMPLO: 'RENÊ EDUARDO HOTZ'",
-            "\n",
-            "\n3️⃣ **Matrícula do imóvel:**",
-            "\n   • PROCURE: Linha 'Matrícula do imóvel:'",
-            "\n   • ATENÇÃO: Pode ter continuação na página 3!",
-            "\n   • EXTRAIA: TODOS os números de matrícula",
-            "\n   • EXEMPLO: '28625, 28626, 27935, 27936, 11798'",
-            "\n   • LEMBRE: Procurar também: 'continuação da página 1: ...'",
-            "\n",
-            "\n4️⃣ **Município/UF:**",
-            "\n   • PROCURE: 'Município/UF:'",
-            "\n   • EXTRAIA: Nome do município e UF",
-            "\n   • EXEMPLO: 'Bebedouro-SP'",
-            "\n",
-            "\n5️⃣ **Código de credenciamento:**",
-            "\n   • PROCURE: 'Código de credenciamento:'",
-            "\n   • EXTRAIA: O código (geralmente 3 letras)",
-            "\n   • EXEMPLO: 'AKE'",
-            "\n",
-            "\n6️⃣ **Código INCRA/SNCR:**",
-            "\n   • PROCURE: 'Código INCRA/SNCR:'",
-            "\n   • EXTRAIA: Código completo",
-            "\n   • EXEMPLO: '6120730013504'",
-            "\n   • ⚠️ NÃO confunda com CPF!",
-            "\n",
-            "\n7️⃣ **Área (Sistema Geodésico Local):**",
-            "\n   • PROCURE: 'Área (Sistema Geodésico Local):'",
-            "\n   • EXTRAIA: Valor e unidade",
-            "\n   • EXEMPLO: '68,7187 ha'",
-            "\n",
-            "\n8️⃣ **Perímetro (m):**",
-            "\n   • PROCURE: 'Perímetro (m):'",
-            "\n   • EXTRAIA: Valor em metros",
-            "\n   • EXEMPLO: '3.873,67 m'",
-            "\n",
-            "\n════════════════════════════════════════════════════════════",
-            "\n              PARTE 2: TABELA DE COORDENADAS                ",
-            "\n════════════════════════════════════════════════════════════",
-            "\n",
-            "\n📊 LOCALIZAÇÃO DA TABELA:",
-            "\n   • Título: 'DESCRIÇÃO DA PARCELA'",
-            "\n   • Tem 2 seções lado a lado:",
-            "\n     - VÉRTICE (esquerda): Código, Longitude, Latitude, Altitude",
-            "\n     - SEGMENTO VANTE (direita): Código, Azimute, Dist.(m), Confrontações",
-            "\n",
-            "\n⚠️ INSTRUÇÕES CRÍTICAS PARA LER A TABELA:",
-            "\n",
-            "\n1. LOCALIZE a tabela 'DESCRIÇÃO DA PARCELA'",
-            "\n",
-            "\n2. A tabela tem este formato:",
-            "\n┌─────────────┬────────────────┬────────────────┬─────────────┐",
-            "\n│ VÉRTICE                                                      │",
-            "\n├─────────────┼────────────────┼────────────────┼─────────────┤",
-            "\n│ Código      │ Longitude      │ Latitude       │ Altitude(m) │",
-            "\n├─────────────┼────────────────┼────────────────┼─────────────┤",
-            "\n│ AKE-V-0166  │ -48°34'14,782\" │ -20°50'45,291\" │ 532,78      │",
-            "\n└─────────────┴────────────────┴────────────────┴─────────────┘",
-            "\n",
-            "\n┌─────────────┬─────────┬──────────┬─────────────────────────┐",
-            "\n│ SEGMENTO VANTE                                              │",
-            "\n├─────────────┼─────────┼──────────┼─────────────────────────┤",
-            "\n│ Código      │ Azimute │ Dist.(m) │ Confrontações           │",
-            "\n├─────────────┼─────────┼──────────┼─────────────────────────┤",
-            "\n│ AKE-M-1028  │ 140°40' │ 43,85    │ CNS: 12.102-0 | Mat...  │",
-            "\n└─────────────┴─────────┴──────────┴─────────────────────────┘",
-            "\n",
-            "\n3. COPIE os códigos dos vértices EXATAMENTE:",
-            "\n   • Exemplo: AKE-V-0166, AKE-M-1028, AKE-P-3567",
-            "\n   • ⚠️ NÃO troque letras: AKE ≠ AME ≠ AXE ≠ AKF",
-            "\n   • ⚠️ NÃO troque números: 1028 ≠ 1008 ≠ 1128",
-            "\n   • ⚠️ Mantenha hífens e letras: AKE-P-3567 (não AKE P 3567)",
-            "\n",
-            "\n4. COPIE as coordenadas COM TODOS OS SÍMBOLOS:",
-            "\n   • Longitude: -48°34'14,782\" (sinal, °, ', \")",
-            "\n   • Latitude: -20°50'45,291\" (sinal, °, ', \")",
-            "\n   • Altitude: 532,78 (número com vírgula)",
-            "\n   • Azimute: 140°40' (graus e minutos)",
-            "\n   • Distância: 43,85 (número com vírgula)",
-            "\n",
-            "\n5. REPRODUZA A TABELA COMPLETA:",
-            "\n   • ⚠️ A tabela continua em MÚLTIPLAS PÁGINAS!",
-            "\n   • Página 1: Primeiros ~16 vértices",
-            "\n   • Página 2: Vértices restantes (~10)",
-            "\n   • TOTAL: ~26 vértices",
-            "\n   • COPIE TODOS! Não pare na página 1!",
-            "\n",
-            "\n6. MANTENHA A FORMATAÇÃO:",
-            "\n   • Use espaços/tabs para alinhar colunas",
-            "\n   • Separe seções (VÉRTICE e SEGMENTO VANTE)",
-            "\n   • Mantenha símbolos especiais (°, ', \")",
-            "\n",
-            "\n7. CONFRONTANTES DO INCRA:",
-            "\n   • Os confrontantes estão na coluna 'Confrontações' da tabela",
-            "\n   • Exemplo: 'CNS: 12.102-0 | Mat. 28309'",
-            "\n   • Exemplo: 'Estrada Municipal - BBD 315'",
-            "\n   • Exemplo: 'CNS: 12.102-0 | Mat. 34685 | Córrego Lambari'",
-            "\n   • ⚠️ NÃO extraia nomes de pessoas!",
-            "\n   • ✅ Extraia: Matrícula, nome da estrada, córrego, etc.",
-            "\n",
-            "\n════════════════════════════════════════════════════════════",
-            "\n                    FORMATO DE SAÍDA                         ",
-            "\n════════════════════════════════════════════════════════════",
-            "\n",
-            "\nApresente no seguinte formato:",
-            "\n",
-            "\n**DADOS CADASTRAIS:**",
-            "\nDenominação: [valor]",
-            "\nProprietário(a): [valor]",
-            "\nMatrícula do imóvel: [valor]",
-            "\nMunicípio/UF: [valor]",
-            "\nCódigo de credenciamento: [valor]",
-            "\nCódigo INCRA/SNCR: [valor]",
-            "\nÁrea (Sistema Geodésico Local): [valor]",
-            "\nPerímetro (m): [valor]",
-            "\n",
-            "\n**TABELA DE COORDENADAS:**",
-            "\n[Reproduza a tabela completa aqui, mantendo formatação]",
-            "\n",
-            "\nExtraia CADA dado de CADA célula com MÁXIMA PRECISÃO!",
-        ]
-        
-        # Adicionar imagens do INCRA
-        prompt.extend(self.incra_images)
-        prompt.append("\n--- FIM DOCUMENTO INCRA ---")
-        
-        # Adicionar imagens do Memorial se necessário
-        if incluir_memorial and self.memorial_images:
-            prompt.append("\n--- INÍCIO MEMORIAL DESCRITIVO ---")
-            prompt.append("\n⚠️ ATENÇÃO: Este documento tem TEXTO CORRIDO.")
-            prompt.append("\nLeia TODO o conteúdo com cuidado.")
-            prompt.append("\nAs informações estão espalhadas em parágrafos diferentes.")
-            prompt.extend(self.memorial_images)
-            prompt.append("\n--- FIM MEMORIAL DESCRITIVO ---")
-        
-        # Adicionar imagens do Projeto se solicitado
-        if incluir_projeto and self.projeto_images:
-            prompt.append("\n--- INÍCIO PROJETO/PLANTA ---")
-            prompt.append("\n🎯 ATENÇÃO ESPECIAL PARA ESTE PROJETO:")
-            prompt.append("\nEste é um PDF DIGITAL (não escaneado) - ele contém TABELAS DE DADOS!")
-            prompt.append("\n")
-            prompt.append("\n📊 ONDE ESTÁ A TABELA:")
-            prompt.append("\nProcure por uma tabela com o título:")
-            prompt.append("\n'Tabela de Coordenadas - Altitudes - Azimutes - Distâncias'")
-            prompt.append("\n")
-            prompt.append("\nA tabela tem as seguintes colunas:")
-            prompt.append("\n┌──────────┬────────────────┬────────────────┬────────────┐")
-            prompt.append("\n│ Código   │ Longitude      │ Latitude       │ Altitude   │")
-            prompt.append("\n├──────────┼────────────────┼────────────────┼────────────┤")
-            prompt.append("\n│ AKE-V... │ 48°34'14,782\" W│ 20°50'45,291\" S│ 532,78     │")
-            prompt.append("\n└──────────┴────────────────┴────────────────┴────────────┘")
-            prompt.append("\n")
-            prompt.append("\n⚠️ INSTRUÇÕES CRÍTICAS DE EXTRAÇÃO:")
-            prompt.append("\n")
-            prompt.append("\n1. 🔍 LOCALIZE a tabela completa")
-            prompt.append("\n   • Geralmente está no CANTO ESQUERDO da página")
-            prompt.append("\n   • Ou na parte SUPERIOR")
-            prompt.append("\n   • Título: 'Tabela de Coordenadas...'")
-            prompt.append("\n")
-            prompt.append("\n2. 📖 LEIA LINHA POR LINHA")
-            prompt.append("\n   • Primeira linha: Cabeçalhos (Código, Longitude, Latitude, Altitude)")
-            prompt.append("\n   • Depois: TODAS as linhas de dados")
-            prompt.append("\n   • Pode ter 20, 26, 30 ou mais vértices!")
-            prompt.append("\n")
-            prompt.append("\n3. ✍️ COPIE EXATAMENTE")
-            prompt.append("\n   • Código do vértice: AKE-V-0166, AKE-M-1028, AKE-P-3567...")
-            prompt.append("\n   • Longitude: 48°34'14,782\" W (com graus, minutos, segundos E direção)")
-            prompt.append("\n   • Latitude: 20°50'45,291\" S (com graus, minutos, segundos E direção)")
-            prompt.append("\n   • Altitude: 532,78 (número simples)")
-            prompt.append("\n")
-            prompt.append("\n4. ⚠️ NÃO CONFUNDA:")
-            prompt.append("\n   • ❌ NÃO pegue números do DESENHO (ex: E=741319 N=7696237)")
-            prompt.append("\n   • ❌ NÃO pegue números das LEGENDAS")
-            prompt.append("\n   • ❌ NÃO pegue números dos CARIMBOS")
-            prompt.append("\n   • ✅ SÓ pegue da TABELA DE COORDENADAS!")
-            prompt.append("\n")
-            prompt.append("\n5. 📝 LISTE TODOS")
-            prompt.append("\n   • Se a tabela tem 26 vértices, liste os 26!")
-            prompt.append("\n   • Não omita nenhum vértice")
-            prompt.append("\n   • Não pare em 3-4 vértices")
-            prompt.append("\n")
-            prompt.append("\n💡 EXEMPLO CORRETO DE EXTRAÇÃO:")
-            prompt.append("\nVértice AKE-V-0166:")
-            prompt.append("\n  • Longitude: 48°34'14,782\" W")
-            prompt.append("\n  • Latitude: 20°50'45,291\" S")
-            prompt.append("\n  • Altitude: 532,78 m")
-            prompt.append("\n")
-            prompt.append("\nVértice AKE-M-1028:")
-            prompt.append("\n  • Longitude: 48°34'13,821\" W")
-            prompt.append("\n  • Latitude: 20°50'46,394\" S")
-            prompt.append("\n  • Altitude: 533,92 m")
-            prompt.append("\n")
-            prompt.append("\n... (continua para TODOS os vértices da tabela)")
-            prompt.append("\n")
-            prompt.append("\n❌ EXEMPLO ERRADO (NÃO FAÇA ISSO):")
-            prompt.append("\n'E=741319 N=7696237' ← Isso é do DESENHO, não da tabela!")
-            prompt.append("\n")
-            prompt.extend(self.projeto_images)
-            prompt.append("\n--- FIM PROJETO/PLANTA ---")
-            
-        # Instruções de formato de saída - HTML PROFISSIONAL COM CORES
-        
-        # Determinar quais documentos foram fornecidos
-        docs_fornecidos = []
-        if self.incra_images:
-            docs_fornecidos.append("INCRA")
-        if incluir_memorial and self.memorial_images:
-            docs_fornecidos.append("MEMORIAL")
-        if incluir_projeto and self.projeto_images:
-            docs_fornecidos.append("PROJETO")
-        
-        docs_texto = " + ".join(docs_fornecidos)
-        
-        instrucoes_saida = (
-            "\n\n"
-            "\n════════════════════════════════════════════════════════════════════"
-            "\n                    FORMATO DO RELATÓRIO HTML                       "
-            "\n════════════════════════════════════════════════════════════════════"
-            "\n"
-            f"\n🎯 DOCUMENTOS SENDO COMPARADOS: {docs_texto}"
-            "\n"
-            "\n⚠️⚠️⚠️ REGRA CRÍTICA DE FORMATAÇÃO:"
-            "\n"
-            "\n1️⃣ SOMENTE inclua no relatório os documentos que foram fornecidos!"
-            "\n"
-        )
-        
-        # Adicionar instruções específicas baseadas nos documentos
-        if incluir_memorial and not incluir_projeto:
-            instrucoes_saida += (
-                "\n   Você está comparando: INCRA + MEMORIAL"
-                "\n   • Tabela deve ter 3 colunas: DADO | INCRA | MEMORIAL | STATUS"
-                "\n   • NÃO mencione 'Projeto' ou 'Planta' em lugar nenhum"
-                "\n   • NÃO crie coluna 'PROJETO'"
-                "\n"
-            )
-        elif incluir_projeto and not incluir_memorial:
-            instrucoes_saida += (
-                "\n   Você está comparando: INCRA + PROJETO"
-                "\n   • Tabela deve ter 3 colunas: DADO | INCRA | PROJETO | STATUS"
-                "\n   • NÃO mencione 'Memorial' ou 'Memorial Descritivo' em lugar nenhum"
-                "\n   • NÃO crie coluna 'MEMORIAL'"
-                "\n"
-            )
-        else:  # Todos os 3
-            instrucoes_saida += (
-                "\n   Você está comparando: INCRA + MEMORIAL + PROJETO"
-                "\n   • Tabela deve ter 4 colunas: DADO | INCRA | MEMORIAL | PROJETO | STATUS"
-                "\n"
-            )
-        
-        instrucoes_saida += (
-            "\n2️⃣ Para documentos NÃO fornecidos:"
-            "\n   • NÃO crie coluna para eles"
-            "\n   • NÃO escreva 'N/A' ou 'Não fornecido'"
-            "\n   • SIMPLESMENTE omita essa coluna"
-            "\n"
-            "\n3️⃣ Estrutura da tabela:"
-        )
-        
-        # Cabeçalho da tabela baseado nos documentos
-        if incluir_memorial and not incluir_projeto:
-            instrucoes_saida += (
-                "\n   <thead><tr>"
-                "\n       <th>DADO</th>"
-                "\n       <th>INCRA</th>"
-                "\n       <th>MEMORIAL</th>"
-                "\n       <th>STATUS</th>"
-                "\n   </tr></thead>"
-            )
-        elif incluir_projeto and not incluir_memorial:
-            instrucoes_saida += (
-                "\n   <thead><tr>"
-                "\n       <th>DADO</th>"
-                "\n       <th>INCRA</th>"
-                "\n       <th>PROJETO</th>"
-                "\n       <th>STATUS</th>"
-                "\n   </tr></thead>"
-            )
+        decorrido = time.monotonic() - self._ultimo_status
+        if mensagem.startswith(("✅", "❌")) or decorrido >= self.INTERVALO_STATUS:
+            atraso_ms = 0
         else:
-            instrucoes_saida += (
-                "\n   <thead><tr>"
-                "\n       <th>DADO</th>"
-                "\n       <th>INCRA</th>"
-                "\n       <th>MEMORIAL</th>"
-                "\n       <th>PROJETO</th>"
-                "\n       <th>STATUS</th>"
-                "\n   </tr></thead>"
-            )
-        
-        instrucoes_saida += (
-            "\n"
-            "\n⚠️ IMPORTANTE: Gere um relatório em HTML completo e profissional."
-            "\nUse CSS inline para cores, estilos e organização visual perfeita."
-            "\nCada seção deve ter cores diferentes para fácil identificação."
-            "\n"
-            "\nGere EXATAMENTE este formato HTML (adapte os dados):"
-            "\n"
-            "\n```html"
-            "\n<!DOCTYPE html>"
-            "\n<html lang='pt-BR'>"
-            "\n<head>"
-            "\n    <meta charset='UTF-8'>"
-            "\n    <meta name='viewport' content='width=device-width, initial-scale=1.0'>"
-            "\n    <title>Relatório de Consistência - Georreferenciamento</title>"
-            "\n    <style>"
-            "\n        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }"
-            "\n        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }"
-            "\n        h1 { color: #2c3e50; border-bottom: 4px solid #3498db; padding-bottom: 10px; }"
-            "\n        h2 { color: #34495e; margin-top: 30px; padding: 10px; border-left: 5px solid #3498db; background: #ecf0f1; }"
-            "\n        .resumo { background: #e8f5e9; padding: 20px; border-left: 5px solid #4caf50; margin: 20px 0; font-size: 16px; }"
-            "\n        .resumo.alerta { background: #fff3e0; border-left-color: #ff9800; }"
-            "\n        .resumo.erro { background: #ffebee; border-left-color: #f44336; }"
-            "\n        table { width: 100%; border-collapse: collapse; margin: 20px 0; font-size: 14px; }"
-            "\n        th { background: #3498db; color: white; padding: 12px; text-align: left; font-weight: bold; }"
-            "\n        td { padding: 10px; border: 1px solid #ddd; }"
-            "\n        tr:nth-child(even) { background: #f9f9f9; }"
-            "\n        tr:hover { background: #f0f0f0; }"
-            "\n        .status-ok { color: #4caf50; font-weight: bold; font-size: 18px; }"
-            "\n        .status-alerta { color: #ff9800; font-weight: bold; font-size: 18px; }"
-            "\n        .status-erro { color: #f44336; font-weight: bold; font-size: 18px; }"
-            "\n        .secao-cadastro th { background: #2196f3; }"
-            "\n        .secao-tecnico th { background: #009688; }"
-            "\n        .secao-vertices th { background: #673ab7; }"
-            "\n        .secao-confrontantes th { background: #ff5722; }"
-            "\n        .secao-erros { background: #ffebee; padding: 15px; border-left: 5px solid #f44336; margin: 20px 0; }"
-            "\n        .secao-alertas { background: #fff3e0; padding: 15px; border-left: 5px solid #ff9800; margin: 20px 0; }"
-            "\n        .secao-ok { background: #e8f5e9; padding: 15px; border-left: 5px solid #4caf50; margin: 20px 0; }"
-            "\n        .parecer { padding: 20px; margin: 20px 0; border: 3px solid; font-size: 16px; font-weight: bold; }"
-            "\n        .parecer-aprovado { background: #e8f5e9; border-color: #4caf50; color: #2e7d32; }"
-            "\n        .parecer-ressalvas { background: #fff3e0; border-color: #ff9800; color: #e65100; }"
-            "\n        .parecer-reprovado { background: #ffebee; border-color: #f44336; color: #c62828; }"
-            "\n        .legenda { background: #ecf0f1; padding: 15px; margin: 20px 0; border-radius: 5px; }"
-            "\n        .analise { font-style: italic; color: #555; margin: 10px 0; padding: 10px; background: #f9f9f9; }"
-            "\n    </style>"
-            "\n</head>"
-            "\n<body>"
-            "\n<div class='container'>"
-            "\n"
-            "\n<h1>📊 RELATÓRIO DE CONSISTÊNCIA - GEORREFERENCIAMENTO</h1>"
-            "\n"
-            "\n<!-- RESUMO EXECUTIVO -->"
-            "\n<h2>🎯 RESUMO EXECUTIVO</h2>"
-            "\n<div class='resumo'> <!-- Use classe 'alerta' ou 'erro' se houver problemas -->"
-            "\n[Em 2-3 frases diretas: os documentos estão consistentes ou há erros?]"
-            "\n</div>"
-            "\n"
-            "\n<!-- SEÇÃO 1: DADOS CADASTRAIS -->"
-            "\n<h2>📋 1. DADOS CADASTRAIS</h2>"
-            "\n<table class='secao-cadastro'>"
-            "\n<thead>"
-            "\n    <tr>"
-            "\n        <th>DADO</th>"
-            "\n        [COLUNAS DOS DOCUMENTOS FORNECIDOS]"
-            "\n        <th style='text-align:center;'>STATUS</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><strong>Proprietário(s)</strong></td>"
-            "\n        [DADOS DE CADA DOCUMENTO]"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <!-- Repetir para: Nome do Imóvel, Matrícula(s), Município, UF, Código INCRA, etc -->"
-            "\n    <tr>"
-            "\n        <td><strong>UF</strong></td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Código INCRA</strong></td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>CCIR</strong></td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair]</td>"
-            "\n        <td>[extrair/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n</tbody>"
-            "\n</table>"
-            "\n<p class='analise'><strong>Análise:</strong> [Breve comentário sobre consistência destes dados]</p>"
-            "\n"
-            "\n<!-- SEÇÃO 2: DADOS TÉCNICOS -->"
-            "\n<h2>📐 2. DADOS TÉCNICOS/MENSURAÇÕES</h2>"
-            "\n<table class='secao-tecnico'>"
-            "\n<thead>"
-            "\n    <tr>"
-            "\n        <th>DADO</th>"
-            "\n        <th>INCRA</th>"
-            "\n        <th>MEMORIAL</th>"
-            "\n        <th>PROJETO</th>"
-            "\n        <th style='text-align:center;'>STATUS</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><strong>Área Total (ha)</strong></td>"
-            "\n        <td>[X,XXXX]</td>"
-            "\n        <td>[X,XXXX]</td>"
-            "\n        <td>[X,XXXX/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Perímetro (m)</strong></td>"
-            "\n        <td>[X.XXX,XX]</td>"
-            "\n        <td>[X.XXX,XX]</td>"
-            "\n        <td>[X.XXX,XX/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Sistema Coordenadas</strong></td>"
-            "\n        <td>[UTM/GEO]</td>"
-            "\n        <td>[UTM/GEO]</td>"
-            "\n        <td>[UTM/GEO/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Datum</strong></td>"
-            "\n        <td>[SIRGAS]</td>"
-            "\n        <td>[SIRGAS]</td>"
-            "\n        <td>[SIRGAS/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>Fuso</strong></td>"
-            "\n        <td>[22/23]</td>"
-            "\n        <td>[22/23]</td>"
-            "\n        <td>[22/23/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n</tbody>"
-            "\n</table>"
-            "\n<p class='analise'><strong>Análise:</strong> [Breve comentário sobre consistência destes dados]</p>"
-            "\n"
-            "\n<!-- SEÇÃO 3: VÉRTICES -->"
-            "\n<h2>🗺️ 3. COORDENADAS DOS VÉRTICES</h2>"
-            "\n<p><strong>⚠️ CRÍTICO: Liste TODOS os vértices encontrados!</strong></p>"
-            "\n<p><strong>⚠️ COPIE os códigos EXATAMENTE como aparecem no documento!</strong></p>"
-            "\n<p style='background:#fff3e0; padding:10px; border-left:3px solid #ff9800;'>"
-            "\n<strong>Exemplo de extração do Memorial:</strong><br>"
-            "\nSe o texto diz: 'vértice NCXC-P-1032, de coordenadas (Longitude: -48°40'19,003\", Latitude: -21°00'03,754\" e Altitude: 509,05 m)'<br>"
-            "\nVocê deve extrair:<br>"
-            "\n• Código: <strong>NCXC-P-1032</strong> (exatamente assim!)<br>"
-            "\n• Longitude: -48°40'19,003\"<br>"
-            "\n• Latitude: -21°00'03,754\"<br>"
-            "\n• Altitude: 509,05 m"
-            "\n</p>"
-            "\n<table class='secao-vertices'>"
-            "\n<thead>"
-            "\n    <tr>"
-            "\n        <th>VÉRTICE</th>"
-            "\n        <th>INCRA (Coordenadas)</th>"
-            "\n        <th>MEMORIAL (Coordenadas)</th>"
-            "\n        <th>PROJETO (Coordenadas)</th>"
-            "\n        <th style='text-align:center;'>STATUS</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><strong>V1</strong></td>"
-            "\n        <td>[E=XXX N=YYY]</td>"
-            "\n        <td>[E=XXX N=YYY]</td>"
-            "\n        <td>[E=XXX N=YYY/N/A]</td>"
-            "\n        <td style='text-align:center;'><span class='status-ok'>✅</span></td>"
-            "\n    </tr>"
-            "\n    <!-- ADICIONE UMA LINHA PARA CADA VÉRTICE (V2, V3, V4... até o último!) -->"
-            "\n    <!-- NÃO OMITA NENHUM VÉRTICE! -->"
-            "\n</tbody>"
-            "\n</table>"
-            "\n<p class='analise'><strong>Análise:</strong> [Comentário sobre consistência das coordenadas]</p>"
-            "\n"
-            "\n<!-- SEÇÃO 4: CONFRONTANTES -->"
-            "\n<h2>🧭 4. CONFRONTANTES/LIMITES</h2>"
-            "\n"
-            "\n⚠️ INSTRUÇÕES ESPECIAIS PARA CONFRONTANTES:"
-            "\n"
-            "\n📋 INCRA:"
-            "\n   • Os confrontantes do INCRA estão na coluna 'Confrontações' da tabela"
-            "\n   • Exemplos:"
-            "\n     - 'CNS: 12.102-0 | Mat. 28309'"
-            "\n     - 'Estrada Municipal - BBD 315'"
-            "\n     - 'CNS: 12.102-0 | Mat. 34685 | Córrego Lambari'"
-            "\n   • ⚠️ NÃO extraia nomes de pessoas!"
-            "\n   • ✅ Extraia: Matrículas, estradas, córregos, limites"
-            "\n   • Liste os confrontantes únicos (sem repetir)"
-            "\n"
-            "\n📄 MEMORIAL:"
-            "\n   • Procure por 'confrontando com' ou 'divisa com'"
-            "\n   • Pode estar no texto corrido"
-            "\n"
-            "\n🗺️ PROJETO:"
-            "\n   • Pode estar em legendas ou carimbos"
-            "\n   • Ou em texto descritivo"
-            "\n"
-            "\n<table class='secao-confrontantes'>"
-            "\n<thead>"
-            "\n    <tr>"
-            "\n        <th>DIREÇÃO</th>"
-            "\n        [COLUNAS DOS DOCUMENTOS FORNECIDOS]"
-            "\n        <th style='text-align:center;'>STATUS</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <!-- Liste os confrontantes encontrados -->"
-            "\n    <!-- Pode não ter direção específica, liste todos encontrados -->"
-            "\n</tbody>"
-            "\n</table>"
-            "\n<p class='analise'><strong>Análise:</strong> [Comentário sobre consistência dos confrontantes]</p>"
-            "\n"
-            "\n<!-- SEÇÃO 5: DISCREPÂNCIAS CRÍTICAS -->"
-            "\n<h2>🚨 5. DISCREPÂNCIAS CRÍTICAS</h2>"
-            "\n<div class='secao-erros'>"
-            "\n[Se NÃO houver erros graves, escreva:]"
-            "\n<p><strong>✅ Nenhuma discrepância crítica identificada.</strong></p>"
-            "\n"
-            "\n[Se HOUVER erros graves, use esta tabela:]"
-            "\n<table>"
-            "\n<thead>"
-            "\n    <tr style='background:#f44336;'>"
-            "\n        <th>TIPO</th><th>CAMPO</th><th>INCRA</th><th>MEMORIAL</th><th>PROJETO</th><th>AÇÃO NECESSÁRIA</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><span class='status-erro'>❌</span></td>"
-            "\n        <td>[campo]</td>"
-            "\n        <td>[valor]</td>"
-            "\n        <td>[valor]</td>"
-            "\n        <td>[valor]</td>"
-            "\n        <td>[o que corrigir]</td>"
-            "\n    </tr>"
-            "\n</tbody>"
-            "\n</table>"
-            "\n</div>"
-            "\n"
-            "\n<!-- SEÇÃO 6: PEQUENAS DIVERGÊNCIAS -->"
-            "\n<h2>⚠️ 6. PEQUENAS DIVERGÊNCIAS</h2>"
-            "\n<div class='secao-alertas'>"
-            "\n[Se NÃO houver diferenças pequenas, escreva:]"
-            "\n<p><strong>✅ Nenhuma divergência menor identificada.</strong></p>"
-            "\n"
-            "\n[Se HOUVER pequenas diferenças, use esta tabela:]"
-            "\n<table>"
-            "\n<thead>"
-            "\n    <tr style='background:#ff9800;'>"
-            "\n        <th>TIPO</th><th>CAMPO</th><th>INCRA</th><th>MEMORIAL</th><th>PROJETO</th><th>OBSERVAÇÃO</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><span class='status-alerta'>⚠️</span></td>"
-            "\n        <td>[campo]</td>"
-            "\n        <td>[valor]</td>"
-            "\n        <td>[valor]</td>"
-            "\n        <td>[valor]</td>"
-            "\n        <td>[explicação]</td>"
-            "\n    </tr>"
-            "\n</tbody>"
-            "\n</table>"
-            "\n</div>"
-            "\n"
-            "\n<!-- SEÇÃO 7: CONSISTÊNCIAS -->"
-            "\n<h2>✅ 7. CONSISTÊNCIAS CONFIRMADAS</h2>"
-            "\n<div class='secao-ok'>"
-            "\n<table>"
-            "\n<thead>"
-            "\n    <tr style='background:#4caf50;'>"
-            "\n        <th>CAMPO</th><th>VALOR CONSISTENTE</th><th>OBSERVAÇÃO</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td>[campo]</td>"
-            "\n        <td>[valor]</td>"
-            "\n        <td>Todos os documentos conferem</td>"
-            "\n    </tr>"
-            "\n</tbody>"
-            "\n</table>"
-            "\n</div>"
-            "\n"
-            "\n<!-- SEÇÃO 8: QUALIDADE -->"
-            "\n<h2>📝 8. QUALIDADE DOS DOCUMENTOS</h2>"
-            "\n<table>"
-            "\n<thead>"
-            "\n    <tr>"
-            "\n        <th>DOCUMENTO</th><th>QUALIDADE</th><th>LEGIBILIDADE</th><th>OBSERVAÇÕES</th>"
-            "\n    </tr>"
-            "\n</thead>"
-            "\n<tbody>"
-            "\n    <tr>"
-            "\n        <td><strong>INCRA</strong></td>"
-            "\n        <td>[Excelente/Boa/Ruim]</td>"
-            "\n        <td>[100%/80%/50%]</td>"
-            "\n        <td>[comentário]</td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>MEMORIAL</strong></td>"
-            "\n        <td>[Excelente/Boa/Ruim]</td>"
-            "\n        <td>[100%/80%/50%]</td>"
-            "\n        <td>[comentário]</td>"
-            "\n    </tr>"
-            "\n    <tr>"
-            "\n        <td><strong>PROJETO</strong></td>"
-            "\n        <td>[Excelente/Boa/Ruim/N/A]</td>"
-            "\n        <td>[100%/80%/50%/N/A]</td>"
-            "\n        <td>[comentário]</td>"
-            "\n    </tr>"
-            "\n</tbody>"
-            "\n</table>"
-            "\n"
-            "\n<!-- SEÇÃO 9: PARECER FINAL -->"
-            "\n<h2>⚖️ 9. PARECER FINAL</h2>"
-            "\n"
-            "\n[Escolha UMA das divs abaixo conforme o resultado:]"
-            "\n"
-            "\n<div class='parecer parecer-aprovado'>"
-            "\n    <p>✅ <strong>APROVADO PARA REGISTRO</strong></p>"
-            "\n    <p><strong>Justificativa:</strong> Todos os dados principais estão consistentes entre os documentos.</p>"
-            "\n</div>"
-            "\n"
-            "\n<!-- OU -->"
-            "\n"
-            "\n<div class='parecer parecer-ressalvas'>"
-            "\n    <p>⚠️ <strong>APROVADO COM RESSALVAS</strong></p>"
-            "\n    <p><strong>Justificativa:</strong> Há pequenas divergências que não impedem o registro.</p>"
-            "\n    <p><strong>Ressalvas:</strong> [listar]</p>"
-            "\n</div>"
-            "\n"
-            "\n<!-- OU -->"
-            "\n"
-            "\n<div class='parecer parecer-reprovado'>"
-            "\n    <p>❌ <strong>REPROVADO - CORREÇÕES OBRIGATÓRIAS</strong></p>"
-            "\n    <p><strong>Justificativa:</strong> Discrepâncias críticas impedem o registro.</p>"
-            "\n    <p><strong>Correções necessárias:</strong> [listar]</p>"
-            "\n</div>"
-            "\n"
-            "\n<!-- LEGENDA -->"
-            "\n<div class='legenda'>"
-            "\n    <h3>LEGENDA DE STATUS</h3>"
-            "\n    <p><span class='status-ok'>✅</span> = Dados idênticos e corretos</p>"
-            "\n    <p><span class='status-alerta'>⚠️</span> = Pequena diferença (revisar, mas não bloqueia)</p>"
-            "\n    <p><span class='status-erro'>❌</span> = Erro grave (correção obrigatória)</p>"
-            "\n    <p><strong>N/A</strong> = Não encontrado/não aplicável</p>"
-            "\n</div>"
-            "\n"
-            "\n<hr>"
-            "\n<p style='text-align:center; color:#888; margin-top:30px;'><em>Relatório gerado por IA - Verificação humana sempre recomendada</em></p>"
-            "\n"
-            "\n</div>"
-            "\n</body>"
-            "\n</html>"
-            "\n```"
-            "\n"
-            "\n⚠️ LEMBRE-SE:"
-            "\n- Use <span class='status-ok'>✅</span> para dados corretos"
-            "\n- Use <span class='status-alerta'>⚠️</span> para pequenas diferenças"
-            "\n- Use <span class='status-erro'>❌</span> para erros graves"
-            "\n- Escolha APENAS UMA classe de parecer (aprovado/ressalvas/reprovado)"
-            "\n- Liste TODOS os vértices encontrados na tabela de coordenadas"
-            "\n- Adapte as classes 'resumo' no início conforme o resultado geral"
-        )
-        
-        prompt.append(instrucoes_saida)
-        return prompt
-        instrucoes_saida = (
-            "\n\n"
-            "\n════════════════════════════════════════════════════════════════════"
-            "\n                    FORMATO DO RELATÓRIO                            "
-            "\n════════════════════════════════════════════════════════════════════"
-            "\n"
-            "\nGere um relatório EXTREMAMENTE ORGANIZADO usando APENAS TABELAS."
-            "\nCada tipo de dado deve ter sua própria tabela."
-            "\nUse linguagem SIMPLES e DIRETA."
-            "\n"
-            "\n"
-            "\n# 📊 RELATÓRIO DE CONSISTÊNCIA - GEORREFERENCIAMENTO"
-            "\n"
-            "\n## 🎯 RESUMO EXECUTIVO"
-            "\n"
-            "\n[Em 2-3 frases diretas: os documentos estão consistentes ou há erros?]"
-            "\n"
-            "\n---"
-            "\n"
-            "\n## 📋 1. DADOS CADASTRAIS"
-            "\n"
-            "\n| DADO | INCRA | MEMORIAL | PROJETO | STATUS |"
-            "\n|:-----|:------|:---------|:--------|:------:|"
-            "\n| **Proprietário(s)** | [extrair] | [extrair] | [extrair/N/A] | ✅/⚠️/❌ |"
-            "\n| **Nome do Imóvel** | [extrair] | [extrair] | [extrair/N/A] | ✅/⚠️/❌ |"
-            "\n| **Matrícula(s)** | [extrair] | [extrair] | [extrair/N/A] | ✅/⚠️/❌ |"
-            "\n| **Município** | [extrair] | [extrair] | [extrair/N/A] | ✅/⚠️/❌ |"
-            "\n| **UF** | [extrair] | [extrair] | [extrair/N/A] | ✅/⚠️/❌ |"
-            "\n| **Código INCRA** | [extrair] | [extrair] | [extrair/N/A] | ✅/⚠️/❌ |"
-            "\n| **CCIR** | [extrair] | [extrair] | [extrair/N/A] | ✅/⚠️/❌ |"
-            "\n"
-            "\n**Análise:** [Breve comentário sobre consistência destes dados]"
-            "\n"
-            "\n---"
-            "\n"
-            "\n## 📐 2. DADOS TÉCNICOS/MENSURAÇÕES"
-            "\n"
-            "\n| DADO | INCRA | MEMORIAL | PROJETO | STATUS |"
-            "\n|:-----|:------|:---------|:--------|:------:|"
-            "\n| **Área Total (ha)** | [X,XXXX] | [X,XXXX] | [X,XXXX/N/A] | ✅/⚠️/❌ |"
-            "\n| **Perímetro (m)** | [X.XXX,XX] | [X.XXX,XX] | [X.XXX,XX/N/A] | ✅/⚠️/❌ |"
-            "\n| **Sistema Coordenadas** | [UTM/GEO/etc] | [UTM/GEO/etc] | [UTM/GEO/N/A] | ✅/⚠️/❌ |"
-            "\n| **Datum** | [SIRGAS/etc] | [SIRGAS/etc] | [SIRGAS/N/A] | ✅/⚠️/❌ |"
-            "\n| **Fuso** | [22/23/etc] | [22/23/etc] | [22/23/N/A] | ✅/⚠️/❌ |"
-            "\n"
-            "\n**Análise:** [Breve comentário sobre consistência destes dados]"
-            "\n"
-            "\n---"
-            "\n"
-            "\n## 🗺️ 3. COORDENADAS DOS VÉRTICES"
-            "\n"
-            "\n**⚠️ CRÍTICO: Liste TODOS os vértices encontrados!**"
-            "\n"
-            "\n| VÉRTICE | INCRA (Coord) | MEMORIAL (Coord) | PROJETO (Coord) | STATUS |"
-            "\n|:--------|:--------------|:-----------------|:----------------|:------:|"
-            "\n| **V1** | [E=XXX N=YYY] | [E=XXX N=YYY] | [E=XXX N=YYY/N/A] | ✅/⚠️/❌ |"
-            "\n| **V2** | [E=XXX N=YYY] | [E=XXX N=YYY] | [E=XXX N=YYY/N/A] | ✅/⚠️/❌ |"
-            "\n| **V3** | [E=XXX N=YYY] | [E=XXX N=YYY] | [E=XXX N=YYY/N/A] | ✅/⚠️/❌ |"
-            "\n| **V4** | [E=XXX N=YYY] | [E=XXX N=YYY] | [E=XXX N=YYY/N/A] | ✅/⚠️/❌ |"
-            "\n| **V5** | [E=XXX N=YYY] | [E=XXX N=YYY] | [E=XXX N=YYY/N/A] | ✅/⚠️/❌ |"
-            "\n| **V6** | [E=XXX N=YYY] | [E=XXX N=YYY] | [E=XXX N=YYY/N/A] | ✅/⚠️/❌ |"
-            "\n| **...** | [...] | [...] | [...] | ... |"
-            "\n"
-            "\n**⚠️ SE HOUVER MAIS VÉRTICES (V7, V8, V9...), ADICIONE MAIS LINHAS!**"
-            "\n"
-            "\n**Análise:** [Comentário sobre consistência das coordenadas]"
-            "\n"
-            "\n---"
-            "\n"
-            "\n## 🧭 4. CONFRONTANTES/LIMITES"
-            "\n"
-            "\n| DIREÇÃO | INCRA | MEMORIAL | PROJETO | STATUS |"
-            "\n|:--------|:------|:---------|:--------|:------:|"
-            "\n| **Norte** | [quem/o quê] | [quem/o quê] | [quem/o quê/N/A] | ✅/⚠️/❌ |"
-            "\n| **Sul** | [quem/o quê] | [quem/o quê] | [quem/o quê/N/A] | ✅/⚠️/❌ |"
-            "\n| **Leste** | [quem/o quê] | [quem/o quê] | [quem/o quê/N/A] | ✅/⚠️/❌ |"
-            "\n| **Oeste** | [quem/o quê] | [quem/o quê] | [quem/o quê/N/A] | ✅/⚠️/❌ |"
-            "\n"
-            "\n**Análise:** [Comentário sobre consistência dos confrontantes]"
-            "\n"
-            "\n---"
-            "\n"
-            "\n## 🚨 5. DISCREPÂNCIAS CRÍTICAS"
-            "\n"
-            "\n[Se NÃO houver erros graves, escreva:]"
-            "\n✅ **Nenhuma discrepância crítica identificada.**"
-            "\n"
-            "\n[Se HOUVER erros graves, use esta tabela:]"
-            "\n"
-            "\n| TIPO | CAMPO | INCRA | MEMORIAL | PROJETO | AÇÃO NECESSÁRIA |"
-            "\n|:-----|:------|:------|:---------|:--------|:----------------|"
-            "\n| ❌ | [campo] | [valor] | [valor] | [valor] | [o que corrigir] |"
-            "\n| ❌ | [campo] | [valor] | [valor] | [valor] | [o que corrigir] |"
-            "\n"
-            "\n---"
-            "\n"
-            "\n## ⚠️ 6. PEQUENAS DIVERGÊNCIAS (Revisar)"
-            "\n"
-            "\n[Se NÃO houver diferenças pequenas, escreva:]"
-            "\n✅ **Nenhuma divergência menor identificada.**"
-            "\n"
-            "\n[Se HOUVER pequenas diferenças, use esta tabela:]"
-            "\n"
-            "\n| TIPO | CAMPO | INCRA | MEMORIAL | PROJETO | OBSERVAÇÃO |"
-            "\n|:-----|:------|:------|:---------|:--------|:-----------|"
-            "\n| ⚠️ | [campo] | [valor] | [valor] | [valor] | [explicação] |"
-            "\n| ⚠️ | [campo] | [valor] | [valor] | [valor] | [explicação] |"
-            "\n"
-            "\n---"
-            "\n"
-            "\n## ✅ 7. CONSISTÊNCIAS CONFIRMADAS"
-            "\n"
-            "\n| CAMPO | VALOR CONSISTENTE | OBSERVAÇÃO |"
-            "\n|:------|:------------------|:-----------|"
-            "\n| [campo] | [valor] | Todos os documentos conferem |"
-            "\n| [campo] | [valor] | Todos os documentos conferem |"
-            "\n| [campo] | [valor] | Todos os documentos conferem |"
-            "\n"
-            "\n---"
-            "\n"
-            "\n## 📝 8. QUALIDADE DOS DOCUMENTOS"
-            "\n"
-            "\n| DOCUMENTO | QUALIDADE | LEGIBILIDADE | OBSERVAÇÕES |"
-            "\n|:----------|:----------|:-------------|:------------|"
-            "\n| **INCRA** | [Excelente/Boa/Ruim] | [100%/80%/50%] | [comentário] |"
-            "\n| **MEMORIAL** | [Excelente/Boa/Ruim] | [100%/80%/50%] | [comentário] |"
-            "\n| **PROJETO** | [Excelente/Boa/Ruim/N/A] | [100%/80%/50%/N/A] | [comentário] |"
-            "\n"
-            "\n---"
-            "\n"
-            "\n## ⚖️ 9. PARECER FINAL"
-            "\n"
-            "\n[Escolha UMA opção e justifique:]"
-            "\n"
-            "\n### ✅ APROVADO PARA REGISTRO"
-            "\n**Justificativa:** Todos os dados principais estão consistentes entre os documentos."
-            "\n"
-            "\nOU"
-            "\n"
-            "\n### ⚠️ APROVADO COM RESSALVAS"
-            "\n**Justificativa:** Há pequenas divergências que não impedem o registro, mas recomenda-se correção."
-            "\n**Ressalvas:** [listar]"
-            "\n"
-            "\nOU"
-            "\n"
-            "\n### ❌ REPROVADO - CORREÇÕES OBRIGATÓRIAS"
-            "\n**Justificativa:** Discrepâncias críticas impedem o registro."
-            "\n**Correções necessárias:** [listar]"
-            "\n"
-            "\n---"
-            "\n"
-            "\n**LEGENDA DE STATUS:**"
-            "\n- ✅ = Dados idênticos e corretos"
-            "\n- ⚠️ = Pequena diferença (revisar, mas não bloqueia)"
-            "\n- ❌ = Erro grave (correção obrigatória)"
-            "\n- N/A = Não encontrado/não aplicável"
-            "\n"
-            "\n---"
-            "\n*Relatório gerado por IA - Verificação humana sempre recomendada*"
-        )
-        
-        prompt.append(instrucoes_saida)
-        return prompt
-
-    def _normalizar_coordenada(self, coord: str) -> str:
-        """
-        Normaliza coordenadas para comparação, ignorando diferenças de formato.
-        Remove "-" do INCRA e "W"/"S" do projeto para comparação equivalente.
-        Normaliza caracteres Unicode especiais (prime → aspas normais).
-
-        Exemplos:
-        - INCRA: "-48°34'14,782"" → "48°34'14,782""
-        - PROJETO: "48°34′14,782" W" → "48°34'14,782""
-        """
-        if not coord:
-            return ""
-
-        # Converter para string e remover espaços em branco
-        coord = str(coord).strip()
-
-        # Normalizar caracteres Unicode especiais
-        # ′ (U+2032 prime) → ' (aspas simples)
-        # ″ (U+2033 double prime) → " (aspas duplas)
-        coord = coord.replace("′", "'").replace("″", '"')
-
-        # Remover "-" do início (INCRA)
-        if coord.startswith("-"):
-            coord = coord[1:].strip()
-
-        # Remover " W" ou " S" do final (PROJETO)
-        coord = coord.replace(" W", "").replace(" S", "").strip()
-
-        # Remover aspas e espaços extras
-        coord = coord.strip().strip('"').strip("'").strip()
-
-        return coord
+            atraso_ms = int((self.INTERVALO_STATUS - decorrido) * 1000)
 
-    def _limpar_string(self, valor) -> str:
-        """
-        Limpa qualquer valor convertendo para string e removendo espaços em branco.
-        Remove também caracteres invisíveis que podem causar diferenças falsas.
-        Converte pontos decimais em vírgulas para padronização numérica brasileira.
-        """
-        if valor is None:
-            return ""
-
-        # Converter para string e aplicar strip múltiplas vezes
-        valor_limpo = str(valor).strip()
-
-        # Remover espaços duplos internos
-        while "  " in valor_limpo:
-            valor_limpo = valor_limpo.replace("  ", " ")
+        self._status_agendado = True
+        self.root.after(atraso_ms, self._aplicar_status)
 
-        # Converter ponto decimal para vírgula (padrão brasileiro)
-        valor_limpo = valor_limpo.replace(".", ",")
-
-        return valor_limpo
-
-    def _construir_relatorio_comparacao(self, incluir_projeto: bool, incluir_memorial: bool) -> str:
-        """
-        Constrói relatório HTML comparando dados estruturados (nova versão V3).
-        Compara dados extraídos dos Excel em vez de fazer OCR em tempo real.
+    def _aplicar_status(self):
+        """Exibe na barra de status a mensagem mais recente (thread do Tk)."""
+        self._status_agendado = False
+        self._ultimo_status = time.monotonic()
+        self.status_label.config(text=self._status_pendente)
+        
+    def _registrar_resultado(self, texto: str):
         """
-        html = []
+        Acrescenta um texto à área de resultados.
 
-        # Cabeçalho HTML
-        html.append("""<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Relatório de Conferência - Georreferenciamento</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #2c3e50;
-            text-align: center;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }
-        h2 {
-            color: #34495e;
-            background-color: #ecf0f1;
-            padding: 10px;
-            border-radius: 5px;
-            margin-top: 30px;
-        }
-        .info-box {
-            background-color: #e8f4f8;
-            border-left: 4px solid #3498db;
-            padding: 15px;
-            margin: 20px 0;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }
-        th {
-            background-color: #3498db;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: bold;
-        }
-        td {
-            padding: 10px;
-            border: 1px solid #ddd;
-        }
-        tr:nth-child(even) {
-            background-color: #f9f9f9;
-        }
-        .identico {
-            background-color: #d4edda !important;
-        }
-        .diferente {
-            background-color: #f8d7da !important;
-        }
-        .status-ok {
-            color: #28a745;
-            font-weight: bold;
-        }
-        .status-erro {
-            color: #dc3545;
-            font-weight: bold;
-        }
-        .resumo {
-            background-color: #fff3cd;
-            border: 2px solid #ffc107;
-            padding: 20px;
-            border-radius: 5px;
-            margin: 20px 0;
-        }
-        .resumo h3 {
-            color: #856404;
-            margin-top: 0;
-        }
-        .destaque {
-            font-size: 1.1em;
-            font-weight: bold;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>📋 RELATÓRIO DE CONFERÊNCIA DE GEORREFERENCIAMENTO</h1>
-        <p style="text-align: center; color: #7f8c8d;"><strong>Versão 3.0 - Comparação de Dados Estruturados (Excel)</strong></p>
-""")
+        Pode ser chamado das threads de trabalho: o texto entra numa fila e a
+        thread do Tk a esvazia a cada INTERVALO_RESULTADO_MS, inserindo todas
+        as mensagens acumuladas de uma vez.
+        """
+        self._fila_resultado.put(texto)
+        if not self._resultado_agendado:
+            self._resultado_agendado = True
+            self.root.after(self.INTERVALO_RESULTADO_MS, self._esvaziar_fila_resultado)
+
+    def _esvaziar_fila_resultado(self):
+        """Insere na área de resultados as mensagens acumuladas (thread do Tk)."""
+        self._resultado_agendado = False
+        mensagens = []
+        try:
+            while True:
+                mensagens.append(self._fila_resultado.get_nowait())
+        except queue.Empty:
+            pass
+        if mensagens:
+            self.resultado_text.insert(tk.END, "".join(mensagens))
+        
+    def _desabilitar_botoes(self):
+        """Desabilita os botões durante o processamento."""
+        self.btn_comparar.config(state='disabled')
 
-        # Seção INCRA vs Projeto
-        if incluir_projeto and self.projeto_data:
-            # Estatísticas
-            num_vertices_incra = len(self.incra_data['data'])
-            num_vertices_projeto = len(self.projeto_data['data'])
+    def _habilitar_botoes(self):
+        """Reabilita os botões após o processamento."""
+        self.btn_comparar.config(state='normal')
 
-            html.append(f"""
-        <div class="info-box">
-            <p><strong>📊 Estatísticas:</strong></p>
-            <ul>
-                <li>Total de vértices INCRA: <strong>{num_vertices_incra}</strong></li>
-                <li>Total de vértices PROJETO: <strong>{num_vertices_projeto}</strong></li>
-            </ul>
-        </div>
+    # ========== NOVAS FUNÇÕES V3: EXTRAÇÃO PARA EXCEL ==========
 
-        <h2>📐 COMPARAÇÃO: INCRA vs. PROJETO/PLANTA</h2>
+    def _extrair_pdf_para_excel(self, pdf_path: str, tipo: str = "normal") -> tuple[str, Dict]:
+        """
+        Extrai dados de um PDF memorial para Excel usando Gemini API.
 
-        <table>
-            <thead>
-                <tr>
-                    <th style="width: 80px;">Vértice</th>
-                    <th style="width: 120px;">Campo</th>
-                    <th>INCRA</th>
-                    <th>PROJETO</th>
-                    <th style="width: 100px;">Status</th>
-                </tr>
-            </thead>
-            <tbody>
-""")
+        Args:
+            pdf_path: Caminho do arquivo PDF
+            tipo: "incra" para usar extração especializada INCRA, "normal" para outros
 
-            # ===== SEÇÃO 1: COMPARAÇÃO DE VÉRTICE =====
-            max_rows = max(num_vertices_incra, num_vertices_projeto)
-            diferencas_vertice = 0
-            identicos_vertice = 0
-            diferencas_segmento = 0
-            identicos_segmento = 0
+        Se o mesmo PDF (pelo conteúdo) já foi extraído nesta sessão e o Excel
+        gerado continua intacto, o resultado anterior é reaproveitado. Entre
+        execuções, os dados extraídos ficam salvos em JSON no diretório
+        temporário e evitam uma nova chamada ao Gemini.
 
-            for i in range(max_rows):
-                incra_row = self.incra_data['data'][i] if i < num_vertices_incra else None
-                projeto_row = self.projeto_data['data'][i] if i < num_vertices_projeto else None
+        Returns:
+            Tupla (caminho_excel, dados_dict)
+        """
+        # Importar funções de extração do script existente (carrega o Gemini).
+        # Se faltar alguma dependência dele, o script chama sys.exit(1): aqui,
+        # numa thread de trabalho, isso viraria um SystemExit silencioso
+        try:
+            from process_memorial_descritivo_v2 import (
+                extract_table_from_pdf,
+                extrair_memorial_incra,
+                create_excel_file
+            )
+        except (ImportError, SystemExit) as e:
+            raise RuntimeError(
+                "Não foi possível carregar process_memorial_descritivo_v2 "
+                "(verifique as dependências: google-generativeai, openpyxl, "
+                "python-docx, pdf2image e Pillow)"
+            ) from e
 
-                if incra_row and projeto_row:
-                    # Extrair e limpar dados VÉRTICE (colunas 0-3)
-                    codigo_incra = self._limpar_string(incra_row[0] if len(incra_row) > 0 else "")
-                    codigo_projeto = self._limpar_string(projeto_row[0] if len(projeto_row) > 0 else "")
+        try:
+            # Reaproveitar extração anterior do mesmo conteúdo
+            chave = (_calcular_hash_arquivo(pdf_path), tipo)
+            with self._extracoes_lock:
+                anterior = self._extracoes_cache.get(chave)
+                if anterior is not None:
+                    self._extracoes_cache.move_to_end(chave)
+
+            if anterior is not None:
+                excel_anterior, dados_anteriores, mtime_anterior = anterior
+                try:
+                    if os.path.getmtime(excel_anterior) == mtime_anterior:
+                        return excel_anterior, dados_anteriores
+                except OSError:
+                    pass  # Excel removido: extrair novamente
+
+            # Diretório temporário para Excel
+            output_dir = self._tmp_dir
+            output_dir.mkdir(parents=True, exist_ok=True)
 
-                    long_incra = self._limpar_string(incra_row[1] if len(incra_row) > 1 else "")
-                    long_projeto = self._limpar_string(projeto_row[1] if len(projeto_row) > 1 else "")
+            # Definir nome do arquivo Excel
+            pdf_name = _nomes_arquivo(pdf_path)[1]
+            excel_path = output_dir / f"{pdf_name}_extraido.xlsx"
 
-                    lat_incra = self._limpar_string(incra_row[2] if len(incra_row) > 2 else "")
-                    lat_projeto = self._limpar_string(projeto_row[2] if len(projeto_row) > 2 else "")
+            # Extração do mesmo conteúdo salva em disco por uma execução anterior
+            json_path = output_dir / f"extracao_{tipo}_{chave[0]}_v{VERSAO_CACHE_EXTRACAO}.json"
+            try:
+                with open(json_path, encoding="utf-8") as f:
+                    dados = json.load(f)
+            except (OSError, ValueError):
+                dados = None
+
+            if dados is None:
+                api_key = self.api_key.get().strip()
+
+                # Extrair dados usando função apropriada
+                if tipo == "incra":
+                    dados = extrair_memorial_incra(Path(pdf_path), api_key)
+                else:
+                    dados = extract_table_from_pdf(pdf_path, api_key)
+
+                # Verificar se dados foram extraídos
+                if not dados or 'data' not in dados:
+                    raise ValueError("Nenhum dado foi extraído do PDF")
+
+                if not dados['data']:
+                    raise ValueError("PDF extraído, mas tabela de dados está vazia")
+
+                # Guardar a extração para as próximas execuções (o cache em
+                # disco é opcional: uma falha aqui não interrompe a análise)
+                try:
+                    tmp_path = json_path.with_suffix(".tmp")
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        json.dump(dados, f, ensure_ascii=False)
+                    os.replace(tmp_path, json_path)
+                except OSError:
+                    pass
 
-                    alt_incra = self._limpar_string(incra_row[3] if len(incra_row) > 3 else "")
-                    alt_projeto = self._limpar_string(projeto_row[3] if len(projeto_row) > 3 else "")
+            # Criar arquivo Excel
+            create_excel_file(dados, str(excel_path))
 
-                    # Normalizar coordenadas para comparação
-                    long_incra_norm = self._normalizar_coordenada(long_incra)
-                    long_projeto_norm = self._normalizar_coordenada(long_projeto)
+            # Verificar se o arquivo foi criado
+            if not excel_path.exists():
+                raise RuntimeError(f"Arquivo Excel não foi criado em: {excel_path}\n"
+                                 f"Verifique permissões no diretório: {output_dir}")
 
-                    lat_incra_norm = self._normalizar_coordenada(lat_incra)
-                    lat_projeto_norm = self._normalizar_coordenada(lat_projeto)
+            # Verificar se o arquivo tem conteúdo
+            excel_stat = excel_path.stat()
+            if excel_stat.st_size == 0:
+                raise RuntimeError(f"Arquivo Excel criado mas está vazio: {excel_path}")
 
-                    # Verificar se VÉRTICE é idêntico (comparando strings limpas)
-                    vertice_identico = (codigo_incra == codigo_projeto and
-                                       long_incra_norm == long_projeto_norm and
-                                       lat_incra_norm == lat_projeto_norm and
-                                       alt_incra == alt_projeto)
+            with self._extracoes_lock:
+                self._extracoes_cache[chave] = (str(excel_path), dados, excel_stat.st_mtime)
+                self._extracoes_cache.move_to_end(chave)
+                while len(self._extracoes_cache) > self.MAX_EXTRACOES_CACHE:
+                    self._extracoes_cache.popitem(last=False)
 
-                    if vertice_identico:
-                        status_class_vertice = "identico"
-                        status_texto_vertice = '<span class="status-ok">✅ IDÊNTICO</span>'
-                        identicos_vertice += 1
-                    else:
-                        status_class_vertice = "diferente"
-                        status_texto_vertice = '<span class="status-erro">❌ DIFERENTE</span>'
-                        diferencas_vertice += 1
+            return str(excel_path), dados
 
-                    # Adicionar linhas VÉRTICE na tabela
-                    html.append(f"""
-                <tr class="{status_class_vertice}">
-                    <td rowspan="4" style="text-align: center; vertical-align: middle; font-weight: bold;">#{i+1}</td>
-                    <td><strong>Código</strong></td>
-                    <td>{codigo_incra}</td>
-                    <td>{codigo_projeto}</td>
-                    <td rowspan="4" style="text-align: center; vertical-align: middle;">{status_texto_vertice}</td>
-                </tr>
-                <tr class="{status_class_vertice}">
-                    <td><strong>Longitude</strong></td>
-                    <td>{long_incra}</td>
-                    <td>{long_projeto}</td>
-                </tr>
-                <tr class="{status_class_vertice}">
-                    <td><strong>Latitude</strong></td>
-                    <td>{lat_incra}</td>
-                    <td>{lat_projeto}</td>
-                </tr>
-                <tr class="{status_class_vertice}">
-                    <td><strong>Altitude</strong></td>
-                    <td>{alt_incra}</td>
-                    <td>{alt_projeto}</td>
-                </tr>
-""")
+        except Exception as e:
+            error_msg = f"Erro ao extrair PDF para Excel: {str(e)}"
+            print(f"❌ {error_msg}")
+            raise RuntimeError(error_msg) from e
 
-                elif incra_row and not projeto_row:
-                    diferencas_vertice += 1
-                    html.append(f"""
-                <tr class="diferente">
-                    <td style="text-align: center; font-weight: bold;">#{i+1}</td>
-                    <td colspan="3"><strong>❌ AUSENTE NO PROJETO</strong> - Código INCRA: {incra_row[0]}</td>
-                    <td style="text-align: center;"><span class="status-erro">❌ ERRO</span></td>
-                </tr>
-""")
+    # ========== FIM NOVAS FUNÇÕES V3 ==========
 
-                elif not incra_row and projeto_row:
-                    diferencas_vertice += 1
-                    html.append(f"""
-                <tr class="diferente">
-                    <td style="text-align: center; font-weight: bold;">#{i+1}</td>
-                    <td colspan="3"><strong>❌ EXTRA NO PROJETO</strong> (não existe no INCRA) - Código: {projeto_row[0]}</td>
-                    <td style="text-align: center;"><span class="status-erro">❌ ERRO</span></td>
-                </tr>
-""")
+    def _construir_relatorio_comparacao(self, incluir_projeto: bool, incluir_memorial: bool, saida):
+        """
+        Constrói relatório HTML comparando dados estruturados (nova versão V3).
+        Compara dados extraídos dos Excel em vez de fazer OCR em tempo real.
 
-            html.append("""
-            </tbody>
-        </table>
-""")
+        O HTML é escrito direto na saída (normalmente o arquivo do relatório),
+        sem montar o documento inteiro na memória.
 
-            # ===== SEÇÃO 2: COMPARAÇÃO DE SEGMENTO VANTE =====
-            html.append("""
-        <h2>🔄 COMPARAÇÃO: SEGMENTO VANTE</h2>
+        Args:
+            incluir_projeto: Se a comparação com o projeto deve ser incluída
+            incluir_memorial: Se a comparação com o memorial deve ser incluída
+            saida: Arquivo de texto (ou buffer) onde o HTML é escrito
+        """
+        w = saida.write
 
-        <table>
-            <thead>
-                <tr>
-                    <th style="width: 80px;">Vértice</th>
-                    <th style="width: 120px;">Campo</th>
-                    <th>INCRA</th>
-                    <th>PROJETO</th>
-                    <th style="width: 100px;">Status</th>
-                </tr>
-            </thead>
-            <tbody>
-""")
+        # Cabeçalho HTML
+        w(HTML_CABECALHO)
+
+        # Seção INCRA vs Projeto
+        if incluir_projeto and self.projeto_data:
+            # Estatísticas
+            dados_incra = self.incra_data['data']
+            dados_projeto = self.projeto_data['data']
+            num_vertices_incra = len(dados_incra)
+            num_vertices_projeto = len(dados_projeto)
+
+            w(HTML_TABELA_VERTICE % (num_vertices_incra, num_vertices_projeto))
+
+            # ===== PREPARAÇÃO: LIMPAR CADA LINHA UMA ÚNICA VEZ =====
+            # Cada linha vira uma tupla com o código original (para as linhas
+            # ausentes/extras), as colunas 0-6 limpas e a chave de comparação
+            # do vértice (código, coordenadas normalizadas e altitude); as
+            # duas tabelas abaixo só leem essas tuplas. Os métodos de limpeza
+            # ficam em nomes locais (sem busca de atributo a cada célula)
+            limpar = _limpar_string
+            normalizar = _normalizar_coordenada
+
+            def preparar_linha(linha):
+                if not linha:
+                    return None
+                valores = list(map(limpar, linha[:7]))
+                valores += [""] * (7 - len(valores))
+                chave_vertice = (valores[0], normalizar(valores[1]), normalizar(valores[2]), valores[3])
+                return linha[0], valores, chave_vertice
+
+            pares = list(zip_longest(
+                list(map(preparar_linha, dados_incra)),
+                list(map(preparar_linha, dados_projeto))
+            ))
+
+            # ===== SEÇÕES 1 e 2: VÉRTICE E SEGMENTO VANTE =====
+            # Uma única passada pelas linhas: as linhas de vértice vão direto
+            # para a saída e as de segmento vante para um buffer, escrito
+            # depois da tabela de vértices
+            max_rows = len(pares)
+            diferencas_vertice = 0
+            identicos_vertice = 0
+            diferencas_segmento = 0
+            identicos_segmento = 0
 
-            for i in range(max_rows):
-                incra_row = self.incra_data['data'][i] if i < num_vertices_incra else None
-                projeto_row = self.projeto_data['data'][i] if i < num_vertices_projeto else None
+            segmentos = io.StringIO()
+            ws = segmentos.write
 
+            for i, (incra_row, projeto_row) in enumerate(pares, 1):
                 if incra_row and projeto_row:
-                    # Extrair e limpar dados SEGMENTO VANTE (colunas 4-6)
-                    cod_seg_incra = self._limpar_string(incra_row[4] if len(incra_row) > 4 else "")
-                    cod_seg_projeto = self._limpar_string(projeto_row[4] if len(projeto_row) > 4 else "")
-
-                    azim_incra = self._limpar_string(incra_row[5] if len(incra_row) > 5 else "")
-                    azim_projeto = self._limpar_string(projeto_row[5] if len(projeto_row) > 5 else "")
+                    # Dados VÉRTICE (colunas 0-3) e SEGMENTO VANTE (4-6) já limpos
+                    _, valores_incra, chave_incra = incra_row
+                    _, valores_projeto, chave_projeto = projeto_row
+                    (codigo_incra, long_incra, lat_incra, alt_incra,
+                     cod_seg_incra, azim_incra, dist_incra) = valores_incra
+                    (codigo_projeto, long_projeto, lat_projeto, alt_projeto,
+                     cod_seg_projeto, azim_projeto, dist_projeto) = valores_projeto
+
+                    # Verificar se VÉRTICE é idêntico (uma comparação de tuplas)
+                    vertice_identico = chave_incra == chave_projeto
+
+                    status_class_vertice = CLASSES_STATUS[vertice_identico]
+                    status_texto_vertice = TEXTOS_STATUS[vertice_identico]
+                    identicos_vertice += vertice_identico
+                    diferencas_vertice += not vertice_identico
 
-                    dist_incra = self._limpar_string(incra_row[6] if len(incra_row) > 6 else "")
-                    dist_projeto = self._limpar_string(projeto_row[6] if len(projeto_row) > 6 else "")
+                    # Adicionar linhas VÉRTICE na tabela
+                    w(HTML_LINHAS_VERTICE % (
+                        status_class_vertice, i, codigo_incra, codigo_projeto, status_texto_vertice,
+                        status_class_vertice, long_incra, long_projeto,
+                        status_class_vertice, lat_incra, lat_projeto,
+                        status_class_vertice, alt_incra, alt_projeto,
+                    ))
 
-                    # Verificar se SEGMENTO VANTE é idêntico (comparando strings limpas)
-                    segmento_identico = (cod_seg_incra == cod_seg_projeto and
-                                        azim_incra == azim_projeto and
-                                        dist_incra == dist_projeto)
+                    # Verificar se SEGMENTO VANTE (colunas 4-6) é idêntico
+                    segmento_identico = valores_incra[4:] == valores_projeto[4:]
 
-                    if segmento_identico:
-                        status_class_seg = "identico"
-                        status_texto_seg = '<span class="status-ok">✅ IDÊNTICO</span>'
-                        identicos_segmento += 1
-                    else:
-                        status_class_seg = "diferente"
-                        status_texto_seg = '<span class="status-erro">❌ DIFERENTE</span>'
-                        diferencas_segmento += 1
+                    status_class_seg = CLASSES_STATUS[segmento_identico]
+                    status_texto_seg = TEXTOS_STATUS[segmento_identico]
+                    identicos_segmento += segmento_identico
+                    diferencas_segmento += not segmento_identico
 
                     # Adicionar linhas SEGMENTO VANTE na tabela
-                    html.append(f"""
-                <tr class="{status_class_seg}">
-                    <td rowspan="3" style="text-align: center; vertical-align: middle; font-weight: bold;">#{i+1}</td>
-                    <td><strong>Código</strong></td>
-                    <td>{cod_seg_incra}</td>
-                    <td>{cod_seg_projeto}</td>
-                    <td rowspan="3" style="text-align: center; vertical-align: middle;">{status_texto_seg}</td>
-                </tr>
-                <tr class="{status_class_seg}">
-                    <td><strong>Azimute</strong></td>
-                    <td>{azim_incra}</td>
-                    <td>{azim_projeto}</td>
-                </tr>
-                <tr class="{status_class_seg}">
-                    <td><strong>Dist. (m)</strong></td>
-                    <td>{dist_incra}</td>
-                    <td>{dist_projeto}</td>
-                </tr>
-""")
+                    ws(HTML_LINHAS_SEGMENTO % (
+                        status_class_seg, i, cod_seg_incra, cod_seg_projeto, status_texto_seg,
+                        status_class_seg, azim_incra, azim_projeto,
+                        status_class_seg, dist_incra, dist_projeto,
+                    ))
 
                 elif incra_row and not projeto_row:
+                    diferencas_vertice += 1
                     diferencas_segmento += 1
-                    html.append(f"""
-                <tr class="diferente">
-                    <td style="text-align: center; font-weight: bold;">#{i+1}</td>
-                    <td colspan="3"><strong>❌ AUSENTE NO PROJETO</strong></td>
-                    <td style="text-align: center;"><span class="status-erro">❌ ERRO</span></td>
-                </tr>
-""")
+                    w(HTML_VERTICE_AUSENTE % (i, incra_row[0]))
+                    ws(HTML_SEGMENTO_AUSENTE % i)
 
                 elif not incra_row and projeto_row:
+                    diferencas_vertice += 1
                     diferencas_segmento += 1
-                    html.append(f"""
-                <tr class="diferente">
-                    <td style="text-align: center; font-weight: bold;">#{i+1}</td>
-                    <td colspan="3"><strong>❌ EXTRA NO PROJETO</strong></td>
-                    <td style="text-align: center;"><span class="status-erro">❌ ERRO</span></td>
-                </tr>
-""")
+                    w(HTML_VERTICE_EXTRA % (i, projeto_row[0]))
+                    ws(HTML_SEGMENTO_EXTRA % i)
 
-            html.append("""
-            </tbody>
-        </table>
-""")
+            w(HTML_FIM_TABELA)
+
+            w(HTML_TABELA_SEGMENTO)
+            w(segmentos.getvalue())
+            w(HTML_FIM_TABELA)
 
             # Resumo geral
             diferencas_total = diferencas_vertice + diferencas_segmento
             identicos_total = identicos_vertice + identicos_segmento
             resultado_final = "🎉 TODOS OS DADOS ESTÃO IDÊNTICOS!" if diferencas_total == 0 else "⚠️ EXISTEM DIFERENÇAS ENTRE OS DOCUMENTOS"
             resultado_cor = "#28a745" if diferencas_total == 0 else "#dc3545"
+            aviso_revisao = HTML_AVISO_REVISAO if diferencas_total > 0 else ''
 
-            html.append(f"""
-        <div class="resumo">
-            <h3>📊 RESUMO DA COMPARAÇÃO</h3>
-            <p class="destaque">Total de vértices analisados: {max_rows}</p>
-
-            <h4 style="margin-top: 20px; color: #2c3e50;">📍 VÉRTICE (Código, Longitude, Latitude, Altitude):</h4>
-            <p>✅ Idênticos: <strong style="color: #28a745;">{identicos_vertice}</strong></p>
-            <p>❌ Diferentes: <strong style="color: #dc3545;">{diferencas_vertice}</strong></p>
-
-            <h4 style="margin-top: 20px; color: #2c3e50;">🔄 SEGMENTO VANTE (Código, Azimute, Distância):</h4>
-            <p>✅ Idênticos: <strong style="color: #28a745;">{identicos_segmento}</strong></p>
-            <p>❌ Diferentes: <strong style="color: #dc3545;">{diferencas_segmento}</strong></p>
-
-            <hr style="margin: 20px 0;">
-
-            <h4 style="color: #2c3e50;">🎯 TOTAL GERAL:</h4>
-            <p>✅ Total idênticos: <strong style="color: #28a745;">{identicos_total}</strong></p>
-            <p>❌ Total diferentes: <strong style="color: #dc3545;">{diferencas_total}</strong></p>
-
-            <hr style="margin: 20px 0;">
-            <p class="destaque" style="color: {resultado_cor}; font-size: 1.2em;">{resultado_final}</p>
-            {f'<p style="color: #856404;">Por favor, revise os itens marcados como DIFERENTE nas tabelas acima.</p>' if diferencas_total > 0 else ''}
-        </div>
-""")
+            w(HTML_RESUMO % (
+                max_rows, identicos_vertice, diferencas_vertice,
+                identicos_segmento, diferencas_segmento,
+                identicos_total, diferencas_total,
+                resultado_cor, resultado_final, aviso_revisao,
+            ))
 
         # Informações do processo
-        html.append(f"""
-        <div class="info-box">
-            <h3>📁 INFORMAÇÕES DO PROCESSO</h3>
-            <p><strong>Arquivos Excel gerados para auditoria:</strong></p>
-            <ul>
-                <li>INCRA: <code>{self.incra_excel_path}</code></li>
-                <li>PROJETO: <code>{self.projeto_excel_path}</code></li>
-            </ul>
-        </div>
-
-        <p style="text-align: center; color: #7f8c8d; margin-top: 40px;">
-            <em>Relatório gerado automaticamente - Versão 3.0</em>
-        </p>
-    </div>
-</body>
-</html>
-""")
-
-        return "".join(html)
+        w(HTML_RODAPE % (self.incra_excel_path, self.projeto_excel_path))
 
     def _executar_analise_gemini(self, incluir_projeto: bool = False, incluir_memorial: bool = False):
         """
@@ -1875,92 +1098,79 @@ class VerificadorGeorreferenciamento:
         Deve ser executado em thread separada para não travar a GUI.
         """
         try:
-            # Limpar área de resultados
-            self.resultado_text.delete(1.0, tk.END)
-            self.resultado_text.insert(tk.END, "🔄 Processando documentos com NOVA ABORDAGEM V3...\n\n")
-            self.resultado_text.insert(tk.END, "📊 Fluxo: PDF → Extração para Excel → Comparação de dados estruturados\n\n")
-            self.resultado_text.insert(tk.END, "="*80 + "\n\n")
-
-            # ===== ETAPA 1: EXTRAIR INCRA PARA EXCEL =====
-            self._atualizar_status("Extraindo tabela do INCRA para Excel...")
-            self.resultado_text.insert(tk.END, "🔄 [1/2] Extraindo INCRA para Excel...\n")
-            self.resultado_text.insert(tk.END, f"    PDF: {self.incra_path.get()}\n")
-            self.root.update_idletasks()
-
-            try:
-                self.incra_excel_path, self.incra_data = self._extrair_pdf_para_excel(
-                    self.incra_path.get(),
-                    tipo="incra"
-                )
-                self.resultado_text.insert(
-                    tk.END,
-                    f"✅ INCRA extraído com sucesso!\n"
-                    f"    Vértices: {len(self.incra_data['data'])}\n"
-                    f"    Excel: {self.incra_excel_path}\n\n"
-                )
-                self.root.update_idletasks()
-            except Exception as e:
-                raise RuntimeError(f"Erro ao extrair INCRA: {str(e)}") from e
-
-            # ===== ETAPA 2: EXTRAIR PROJETO PARA EXCEL =====
-            self._atualizar_status("Extraindo tabela do Projeto para Excel...")
-            self.resultado_text.insert(tk.END, "🔄 [2/2] Extraindo Projeto para Excel...\n")
-            self.resultado_text.insert(tk.END, f"    PDF: {self.projeto_path.get()}\n")
-            self.root.update_idletasks()
+            # A área de resultados é limpa em _comparar_projeto (thread do Tk)
+            self._registrar_resultado("🔄 Processando documentos com NOVA ABORDAGEM V3...\n\n")
+            self._registrar_resultado("📊 Fluxo: PDF → Extração para Excel → Comparação de dados estruturados\n\n")
+            self._registrar_resultado("="*80 + "\n\n")
+
+            # ===== ETAPAS 1 e 2: EXTRAIR INCRA E PROJETO PARA EXCEL =====
+            # As duas extrações são independentes e passam a maior parte do
+            # tempo esperando a API do Gemini, então rodam em paralelo
+            incra_pdf = self.incra_path.get()
+            projeto_pdf = self.projeto_path.get()
+
+            self._atualizar_status("Extraindo tabelas do INCRA e do Projeto para Excel...")
+            self._registrar_resultado("🔄 [1/2] Extraindo INCRA para Excel...\n")
+            self._registrar_resultado(f"    PDF: {incra_pdf}\n")
+            self._registrar_resultado("🔄 [2/2] Extraindo Projeto para Excel...\n")
+            self._registrar_resultado(f"    PDF: {projeto_pdf}\n\n")
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                extracoes = {
+                    executor.submit(self._extrair_pdf_para_excel, incra_pdf, "incra"): "INCRA",
+                    executor.submit(self._extrair_pdf_para_excel, projeto_pdf, "normal"): "PROJETO",
+                }
+
+                for futuro in as_completed(extracoes):
+                    nome = extracoes[futuro]
+                    try:
+                        excel_path, dados = futuro.result()
+                    except Exception as e:
+                        raise RuntimeError(f"Erro ao extrair {nome}: {str(e)}") from e
+
+                    if nome == "INCRA":
+                        self.incra_excel_path, self.incra_data = excel_path, dados
+                    else:
+                        self.projeto_excel_path, self.projeto_data = excel_path, dados
 
-            try:
-                self.projeto_excel_path, self.projeto_data = self._extrair_pdf_para_excel(
-                    self.projeto_path.get(),
-                    tipo="normal"
-                )
-                self.resultado_text.insert(
-                    tk.END,
-                    f"✅ Projeto extraído com sucesso!\n"
-                    f"    Vértices: {len(self.projeto_data['data'])}\n"
-                    f"    Excel: {self.projeto_excel_path}\n\n"
-                )
-                self.root.update_idletasks()
-            except Exception as e:
-                raise RuntimeError(f"Erro ao extrair PROJETO: {str(e)}") from e
+                    self._registrar_resultado(
+                        f"✅ {nome.capitalize()} extraído com sucesso!\n"
+                        f"    Vértices: {len(dados['data'])}\n"
+                        f"    Excel: {excel_path}\n\n"
+                    )
 
-            self.resultado_text.insert(tk.END, "="*80 + "\n\n")
+            self._registrar_resultado("="*80 + "\n\n")
 
             # ===== ETAPA 3: COMPARAR DADOS ESTRUTURADOS =====
             self._atualizar_status("Comparando dados estruturados...")
-            self.resultado_text.insert(tk.END, "🔄 Comparando dados estruturados...\n\n")
-            self.root.update_idletasks()
-
-            # Construir relatório de comparação HTML
-            relatorio_html = self._construir_relatorio_comparacao(True, False)
-
-            # Salvar HTML automaticamente
-            output_dir = Path(tempfile.gettempdir()) / "conferencia_geo"
-            output_dir.mkdir(exist_ok=True)
-            html_path = output_dir / "relatorio_comparacao.html"
-
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(relatorio_html)
+            self._registrar_resultado("🔄 Comparando dados estruturados...\n\n")
 
-            # Salvar HTML para exportação futura
-            self.ultimo_relatorio_html = relatorio_html
+            # Construir relatório de comparação HTML direto no arquivo (o
+            # caminho fica guardado para exportação futura)
+            self._tmp_dir.mkdir(parents=True, exist_ok=True)
+            html_path = self._tmp_dir / "relatorio_comparacao.html"
+            self.ultimo_relatorio_html_path = None
+            with open(html_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                self._construir_relatorio_comparacao(True, False, f)
+            self.ultimo_relatorio_html_path = html_path
 
             # Exibir resumo no ScrolledText
-            self.resultado_text.insert(tk.END, "="*80 + "\n")
-            self.resultado_text.insert(tk.END, "✅ ANÁLISE CONCLUÍDA COM SUCESSO!\n")
-            self.resultado_text.insert(tk.END, "="*80 + "\n\n")
+            self._registrar_resultado("="*80 + "\n")
+            self._registrar_resultado("✅ ANÁLISE CONCLUÍDA COM SUCESSO!\n")
+            self._registrar_resultado("="*80 + "\n\n")
 
             # Contar diferenças para o resumo
             num_vertices = len(self.incra_data['data'])
-            self.resultado_text.insert(tk.END, f"📊 Total de vértices analisados: {num_vertices}\n\n")
+            self._registrar_resultado(f"📊 Total de vértices analisados: {num_vertices}\n\n")
 
-            self.resultado_text.insert(tk.END, "📁 ARQUIVOS GERADOS:\n")
-            self.resultado_text.insert(tk.END, f"   • INCRA (Excel): {self.incra_excel_path}\n")
-            self.resultado_text.insert(tk.END, f"   • PROJETO (Excel): {self.projeto_excel_path}\n")
-            self.resultado_text.insert(tk.END, f"   • RELATÓRIO (HTML): {html_path}\n\n")
+            self._registrar_resultado("📁 ARQUIVOS GERADOS:\n")
+            self._registrar_resultado(f"   • INCRA (Excel): {self.incra_excel_path}\n")
+            self._registrar_resultado(f"   • PROJETO (Excel): {self.projeto_excel_path}\n")
+            self._registrar_resultado(f"   • RELATÓRIO (HTML): {html_path}\n\n")
 
-            self.resultado_text.insert(tk.END, "="*80 + "\n")
-            self.resultado_text.insert(tk.END, "🌐 O relatório HTML foi aberto automaticamente no navegador!\n")
-            self.resultado_text.insert(tk.END, "="*80 + "\n")
+            self._registrar_resultado("="*80 + "\n")
+            self._registrar_resultado("🌐 O relatório HTML foi aberto automaticamente no navegador!\n")
+            self._registrar_resultado("="*80 + "\n")
 
             # Habilitar botão de salvar
             self.btn_salvar_html.config(state='normal')
@@ -1996,11 +1206,11 @@ class VerificadorGeorreferenciamento:
             erro_msg += "💡 Dicas para resolver:\n"
             erro_msg += "- Verifique se os arquivos PDF estão acessíveis\n"
             erro_msg += "- Verifique se você tem permissão para criar arquivos em:\n"
-            erro_msg += f"  {Path(tempfile.gettempdir()) / 'conferencia_geo'}\n"
+            erro_msg += f"  {self._tmp_dir}\n"
             erro_msg += "- Verifique sua conexão com a API do Gemini\n"
             erro_msg += "- Tente fechar outros programas que possam estar usando os arquivos\n"
 
-            self.resultado_text.insert(tk.END, erro_msg)
+            self._registrar_resultado(erro_msg)
             self._atualizar_status("❌ Erro na análise")
 
             # Mostrar erro em popup simplificado
@@ -2022,16 +1232,52 @@ class VerificadorGeorreferenciamento:
 
         self._desabilitar_botoes()
 
+        # Limpar área de resultados
+        self.resultado_text.delete(1.0, tk.END)
+
         # Executar em thread separada para não travar a GUI
         thread = threading.Thread(target=self._executar_analise_gemini, args=(True, False))
         thread.daemon = True
         thread.start()
 
 
+# Nomes dos atributos de estado de cada painel da comparação manual,
+# montados uma única vez (evita formatar f'{tipo}_...' a cada evento do mouse)
+CAMPOS_PAINEL = (
+    'path', 'num_paginas', 'pagina', 'zoom', 'rotacao', 'pos_x', 'pos_y', 'drag_start',
+    'photo', 'img_id', 'canvas', 'label_pagina', 'label_zoom', 'label_rotacao',
+)
+ATRIBUTOS_PAINEL = {
+    tipo: {campo: f'{tipo}_{campo}' for campo in CAMPOS_PAINEL}
+    for tipo in ('incra', 'memorial', 'projeto')
+}
+
+
 class JanelaComparacaoManual:
     """Janela para comparação visual manual dos documentos PDF."""
+
+    # Páginas já renderizadas (rotação + zoom) mantidas em memória: no máximo
+    # esta quantidade e este total de pixels (com zoom alto cada página é enorme)
+    MAX_RENDERS_CACHE = 6
+    MAX_PIXELS_RENDERS_CACHE = 40_000_000
+
+    # Rotação com que cada documento abre (e à qual "resetar rotação" volta):
+    # o INCRA vem em paisagem
+    ROTACAO_INICIAL = {'incra': 90, 'memorial': 0, 'projeto': 0}
+
+    # Documentos que a janela pode exibir, na ordem dos painéis; só os que
+    # têm arquivo informado ganham painel
+    DOCUMENTOS = (('incra', "INCRA"), ('memorial', "Memorial"), ('projeto', "Projeto"))
+
+    # Páginas rasterizadas mantidas em memória (originais, antes de zoom e
+    # rotação), por nível de DPI: afastar o zoom não descarta as de 150 DPI
+    MAX_PAGINAS_POR_DPI = 9
+
+    # Intervalo (ms) com que a thread do Tk verifica as rasterizações em
+    # andamento (as threads do Poppler nunca chamam o Tk)
+    INTERVALO_VERIFICACAO_MS = 50
     
-    def __init__(self, parent, incra_path, memorial_path, projeto_path=None):
+    def __init__(self, parent, incra_path, memorial_path=None, projeto_path=None):
         self.janela = tk.Toplevel(parent)
         self.janela.title("Comparação Visual Manual - Georreferenciamento")
         self.janela.geometry("1600x900")
@@ -2041,11 +1287,16 @@ class JanelaComparacaoManual:
         self.incra_path = incra_path
         self.memorial_path = memorial_path
         self.projeto_path = projeto_path
+        self._documentos = [
+            (tipo, nome) for tipo, nome in self.DOCUMENTOS
+            if getattr(self, ATRIBUTOS_PAINEL[tipo]['path'])
+        ]
         
-        # Listas de imagens carregadas
-        self.incra_images = []
-        self.memorial_images = []
-        self.projeto_images = []
+        # Quantidade de páginas de cada PDF. As páginas são rasterizadas sob
+        # demanda (ver _obter_pagina)
+        self.incra_num_paginas = 0
+        self.memorial_num_paginas = 0
+        self.projeto_num_paginas = 0
         
         # Índices de página atual
         self.incra_pagina = 0
@@ -2058,9 +1309,9 @@ class JanelaComparacaoManual:
         self.projeto_zoom = 1.0
         
         # Ângulo de rotação (0, 90, 180, 270)
-        self.incra_rotacao = 0
-        self.memorial_rotacao = 0
-        self.projeto_rotacao = 0
+        self.incra_rotacao = self.ROTACAO_INICIAL['incra']
+        self.memorial_rotacao = self.ROTACAO_INICIAL['memorial']
+        self.projeto_rotacao = self.ROTACAO_INICIAL['projeto']
         
         # Posição do canvas (para arrastar)
         self.incra_pos_x = 0
@@ -2079,6 +1330,32 @@ class JanelaComparacaoManual:
         self.incra_photo = None
         self.memorial_photo = None
         self.projeto_photo = None
+
+        # Item de imagem de cada canvas, criado uma vez e reaproveitado (ao
+        # arrastar, basta mover o item)
+        self.incra_img_id = None
+        self.memorial_img_id = None
+        self.projeto_img_id = None
+
+        # Páginas já renderizadas, por (tipo, página, zoom, rotação) → PhotoImage
+        self._renders_cache: OrderedDict = OrderedDict()
+        self._pixels_renders = 0
+
+        # Redesenhos agendados por painel (tipo → True se a página precisa ser
+        # exibida de novo, False se só a posição mudou); ver _agendar_exibicao
+        self._exibicao_pendente: Dict[str, bool] = {}
+
+        # Páginas rasterizadas, por (tipo, página, DPI) → Future da conversão.
+        # Exibição e pré-carga compartilham o mesmo Future, então uma página
+        # nunca é convertida duas vezes ao mesmo tempo
+        self._paginas: OrderedDict = OrderedDict()
+        self._executor_paginas = ThreadPoolExecutor(max_workers=2)
+
+        # Rasterizações aguardadas pela exibição, por (tipo, página, DPI) → Future;
+        # verificadas periodicamente por _verificar_paginas
+        self._paginas_aguardando: Dict[tuple, Future] = {}
+        self._verificacao_agendada = False
+        self.janela.protocol("WM_DELETE_WINDOW", self._fechar)
         
         self._criar_interface()
         self._carregar_documentos()
@@ -2104,19 +1381,10 @@ class JanelaComparacaoManual:
         main_frame = tk.Frame(self.janela, bg='#2c3e50')
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Determinar quantos painéis criar
-        num_paineis = 3 if self.projeto_path else 2
-        
-        # Criar painéis lado a lado
-        if num_paineis == 2:
-            # INCRA e Memorial
-            self._criar_painel(main_frame, "INCRA", 0, 'incra')
-            self._criar_painel(main_frame, "MEMORIAL", 1, 'memorial')
-        else:
-            # INCRA, Memorial e Projeto
-            self._criar_painel(main_frame, "INCRA", 0, 'incra', largura_col=3)
-            self._criar_painel(main_frame, "MEMORIAL", 1, 'memorial', largura_col=3)
-            self._criar_painel(main_frame, "PROJETO", 2, 'projeto', largura_col=3)
+        # Criar um painel para cada documento informado, lado a lado
+        largura_col = 3 if len(self._documentos) == 3 else 2
+        for coluna, (tipo, nome) in enumerate(self._documentos):
+            self._criar_painel(main_frame, nome.upper(), coluna, tipo, largura_col=largura_col)
         
         # Frame inferior com instruções
         footer_frame = tk.Frame(self.janela, bg='#34495e', height=50)
@@ -2134,6 +1402,7 @@ class JanelaComparacaoManual:
         
     def _criar_painel(self, parent, titulo, coluna, tipo, largura_col=2):
         """Cria um painel de visualização para um documento."""
+        nomes = ATRIBUTOS_PAINEL[tipo]
         
         # Frame do painel
         painel = tk.Frame(parent, bg='#ecf0f1', relief=tk.RAISED, borderwidth=2)
@@ -2164,7 +1433,7 @@ class JanelaComparacaoManual:
         canvas.pack(fill=tk.BOTH, expand=True)
         
         # Salvar referência ao canvas
-        setattr(self, f'{tipo}_canvas', canvas)
+        setattr(self, nomes['canvas'], canvas)
         
         # Configurar eventos do mouse para arrastar e zoom
         canvas.bind('<ButtonPress-1>', lambda e: self._iniciar_arrasto(tipo, e))
@@ -2205,7 +1474,7 @@ class JanelaComparacaoManual:
             bg='#ecf0f1'
         )
         label_pagina.pack(side=tk.LEFT, padx=10)
-        setattr(self, f'{tipo}_label_pagina', label_pagina)
+        setattr(self, nomes['label_pagina'], label_pagina)
         
         btn_proximo = tk.Button(
             nav_frame,
@@ -2271,7 +1540,7 @@ class JanelaComparacaoManual:
             bg='#ecf0f1'
         )
         label_zoom.pack(side=tk.LEFT, padx=10)
-        setattr(self, f'{tipo}_label_zoom', label_zoom)
+        setattr(self, nomes['label_zoom'], label_zoom)
         
         # Linha 3: Controles de rotação
         rotacao_frame = tk.Frame(controles, bg='#ecf0f1')
@@ -2311,159 +1580,353 @@ class JanelaComparacaoManual:
             bg='#ecf0f1'
         )
         label_rotacao.pack(side=tk.LEFT, padx=10)
-        setattr(self, f'{tipo}_label_rotacao', label_rotacao)
+        setattr(self, nomes['label_rotacao'], label_rotacao)
         
     def _carregar_documentos(self):
-        """Carrega os documentos PDF como imagens."""
+        """Carrega os documentos PDF em segundo plano, exibindo um diálogo de progresso."""
+        # Criar diálogo de progresso
+        progress = tk.Toplevel(self.janela)
+        progress.title("Carregando...")
+        progress.geometry("400x150")
+        progress.transient(self.janela)
+        progress.grab_set()
+        
+        tk.Label(
+            progress,
+            text="⏳ Carregando documentos...",
+            font=('Arial', 12, 'bold')
+        ).pack(pady=20)
+        
+        status_label = tk.Label(progress, text="", font=('Arial', 10))
+        status_label.pack(pady=10)
+        
+        documentos = self._documentos
+        status_label.config(text="Carregando " + ", ".join(nome for _, nome in documentos) + "...")
+        
+        # O Poppler roda fora da thread do Tk para a janela continuar respondendo
+        threading.Thread(
+            target=self._carregar_documentos_worker,
+            args=(documentos, progress, status_label),
+            daemon=True
+        ).start()
+        
+    def _carregar_documentos_worker(self, documentos, progress, status_label):
+        """
+        Lê a quantidade de páginas e rasteriza a primeira página de cada documento.
+
+        Executa em uma thread separada e não acessa os widgets diretamente:
+        as atualizações são enviadas para a thread do Tk com janela.after.
+        """
+        na_interface = self._na_interface
         try:
-            # Criar diálogo de progresso
-            progress = tk.Toplevel(self.janela)
-            progress.title("Carregando...")
-            progress.geometry("400x150")
-            progress.transient(self.janela)
-            progress.grab_set()
-            
-            tk.Label(
-                progress,
-                text="⏳ Carregando documentos...",
-                font=('Arial', 12, 'bold')
-            ).pack(pady=20)
-            
-            status_label = tk.Label(progress, text="", font=('Arial', 10))
-            status_label.pack(pady=10)
-            
-            progress.update()
-            
-            # Carregar INCRA (com rotação)
-            status_label.config(text="Carregando INCRA...")
-            progress.update()
-            self.incra_images = convert_from_path(self.incra_path, dpi=150)
-            # Rotacionar INCRA
-            self.incra_images = [img.rotate(-90, expand=True) for img in self.incra_images]
+            # Documentos preparados em paralelo (o Poppler roda em processos externos)
+            resultados = {}
+            with ThreadPoolExecutor(max_workers=len(documentos)) as executor:
+                futures = {
+                    executor.submit(
+                        self._preparar_documento,
+                        getattr(self, ATRIBUTOS_PAINEL[tipo]['path'])
+                    ): (tipo, nome)
+                    for tipo, nome in documentos
+                }
+                for future in as_completed(futures):
+                    tipo, nome = futures[future]
+                    resultados[tipo] = future.result()
+                    na_interface(lambda msg=f"✓ {nome} carregado": status_label.config(text=msg))
+        except Exception as e:
+            na_interface(self._falha_carregamento, progress, e)
+        else:
+            na_interface(self._concluir_carregamento, progress, resultados)
             
-            # Carregar Memorial
-            status_label.config(text="Carregando Memorial...")
-            progress.update()
-            self.memorial_images = convert_from_path(self.memorial_path, dpi=150)
+    def _na_interface(self, funcao, *args):
+        """Agenda uma chamada na thread do Tk (pode ser chamado de outras threads)."""
+        try:
+            self.janela.after(0, funcao, *args)
+        except (tk.TclError, RuntimeError):
+            pass  # Janela já fechada
             
-            # Carregar Projeto se houver
-            if self.projeto_path:
-                status_label.config(text="Carregando Projeto...")
-                progress.update()
-                self.projeto_images = convert_from_path(self.projeto_path, dpi=150)
+    def _concluir_carregamento(self, progress, resultados):
+        """Registra os documentos carregados e exibe a primeira página de cada um."""
+        progress.destroy()
+        for tipo, (num_paginas, primeira) in resultados.items():
+            setattr(self, ATRIBUTOS_PAINEL[tipo]['num_paginas'], num_paginas)
+            if primeira is not None:
+                futuro = Future()
+                futuro.set_result(primeira)
+                self._guardar_pagina((tipo, 0, DPI_VISUALIZACAO), futuro)
+            self._exibir_pagina(tipo)
             
-            progress.destroy()
+    def _falha_carregamento(self, progress, erro):
+        """Informa o erro de carregamento e fecha a janela."""
+        progress.destroy()
+        messagebox.showerror("Erro", f"Erro ao carregar documentos:\n{str(erro)}")
+        self._fechar()
             
-            # Exibir primeira página de cada documento
-            self._exibir_pagina('incra')
-            self._exibir_pagina('memorial')
-            if self.projeto_path:
-                self._exibir_pagina('projeto')
-                
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao carregar documentos:\n{str(e)}")
-            self.janela.destroy()
+    def _fechar(self):
+        """Fecha a janela, cancelando as rasterizações ainda não iniciadas."""
+        self._paginas_aguardando.clear()
+        self._executor_paginas.shutdown(wait=False, cancel_futures=True)
+        self.janela.destroy()
             
     def _exibir_pagina(self, tipo):
         """Exibe a página atual de um documento."""
-        # Obter lista de imagens e índice atual
-        images = getattr(self, f'{tipo}_images')
-        pagina = getattr(self, f'{tipo}_pagina')
-        zoom = getattr(self, f'{tipo}_zoom')
-        rotacao = getattr(self, f'{tipo}_rotacao')
-        pos_x = getattr(self, f'{tipo}_pos_x')
-        pos_y = getattr(self, f'{tipo}_pos_y')
-        canvas = getattr(self, f'{tipo}_canvas')
-        
-        if not images or pagina >= len(images):
+        nomes = ATRIBUTOS_PAINEL[tipo]
+        # Obter quantidade de páginas e índice atual
+        num_paginas = getattr(self, nomes['num_paginas'])
+        pagina = getattr(self, nomes['pagina'])
+        zoom = getattr(self, nomes['zoom'])
+        rotacao = getattr(self, nomes['rotacao'])
+        pos_x = getattr(self, nomes['pos_x'])
+        pos_y = getattr(self, nomes['pos_y'])
+        canvas = getattr(self, nomes['canvas'])
+        
+        if pagina >= num_paginas:
             return
+
+        # Reaproveitar a página já renderizada com a mesma rotação e zoom
+        chave = (tipo, pagina, zoom, rotacao)
+        photo = self._renders_cache.get(chave)
+        if photo is not None:
+            self._renders_cache.move_to_end(chave)
+        else:
+            # Obter imagem original na menor resolução que cobre o zoom (ou,
+            # enquanto ela é rasterizada, a mesma página em outra resolução)
+            dpi = _dpi_para_zoom(zoom)
+            img_original, dpi_usado = self._obter_pagina(tipo, pagina, dpi)
+            if img_original is None:
+                # Página ainda sendo rasterizada: manter a imagem anterior e
+                # avisar no rótulo; _verificar_paginas redesenha quando chegar
+                getattr(self, nomes['label_pagina']).config(
+                    text=f"⏳ Página {pagina + 1}/{num_paginas} (carregando...)"
+                )
+                return
             
-        # Obter imagem original
-        img_original = images[pagina].copy()
-        
-        # Aplicar rotação (se houver)
-        if rotacao != 0:
-            img_original = img_original.rotate(-rotacao, expand=True)
-        
-        # Aplicar zoom
-        largura = int(img_original.width * zoom)
-        altura = int(img_original.height * zoom)
-        img_zoom = img_original.resize((largura, altura), Image.Resampling.LANCZOS)
-        
-        # Converter para PhotoImage
-        photo = ImageTk.PhotoImage(img_zoom)
-        setattr(self, f'{tipo}_photo', photo)  # Manter referência
-        
-        # Limpar canvas e exibir imagem
-        canvas.delete("all")
-        canvas.create_image(pos_x, pos_y, anchor=tk.NW, image=photo, tags='imagem')
+            # Aplicar zoom (relativo a DPI_VISUALIZACAO); resize devolve uma
+            # nova imagem, sem alterar a página em cache
+            escala = zoom * DPI_VISUALIZACAO / dpi_usado
+            largura = int(img_original.width * escala)
+            altura = int(img_original.height * escala)
+            # LANCZOS só ao ampliar; para reduzir, BILINEAR é visualmente igual e mais rápido
+            filtro = Image.Resampling.LANCZOS if zoom > 1.0 else Image.Resampling.BILINEAR
+            img_zoom = img_original.resize((largura, altura), filtro)
+            
+            # Aplicar rotação (se houver) depois do zoom, por transposição
+            if rotacao != 0:
+                img_zoom = img_zoom.transpose(TRANSPOSICOES_ROTACAO[rotacao])
+            
+            # Converter para PhotoImage (a versão provisória, em outra
+            # resolução, não vai para o cache: é refeita quando a certa chegar)
+            photo = ImageTk.PhotoImage(img_zoom)
+            if dpi_usado == dpi:
+                self._renders_cache[chave] = photo
+                self._pixels_renders += largura * altura
+                while len(self._renders_cache) > 1 and (
+                        len(self._renders_cache) > self.MAX_RENDERS_CACHE
+                        or self._pixels_renders > self.MAX_PIXELS_RENDERS_CACHE):
+                    self._remover_render(next(iter(self._renders_cache)))
+        setattr(self, nomes['photo'], photo)  # Manter referência
+        
+        # Exibir imagem no item do canvas (criado na primeira exibição)
+        img_id = getattr(self, nomes['img_id'])
+        if img_id is None:
+            img_id = canvas.create_image(pos_x, pos_y, anchor=tk.NW, image=photo, tags='imagem')
+            setattr(self, nomes['img_id'], img_id)
+        else:
+            canvas.itemconfig(img_id, image=photo)
+            canvas.coords(img_id, pos_x, pos_y)
         canvas.config(scrollregion=canvas.bbox("all"))
         
         # Atualizar label de página
-        label_pagina = getattr(self, f'{tipo}_label_pagina')
-        label_pagina.config(text=f"Página {pagina + 1}/{len(images)}")
+        label_pagina = getattr(self, nomes['label_pagina'])
+        label_pagina.config(text=f"Página {pagina + 1}/{num_paginas}")
         
         # Atualizar label de zoom
-        label_zoom = getattr(self, f'{tipo}_label_zoom')
+        label_zoom = getattr(self, nomes['label_zoom'])
         label_zoom.config(text=f"{int(zoom * 100)}%")
         
         # Atualizar label de rotação
-        label_rotacao = getattr(self, f'{tipo}_label_rotacao')
+        label_rotacao = getattr(self, nomes['label_rotacao'])
         label_rotacao.config(text=f"{rotacao}°")
         
+    @staticmethod
+    def _preparar_documento(caminho):
+        """
+        Lê as informações de um PDF e rasteriza sua primeira página.
+
+        Executa em uma thread de _carregar_documentos, sem acessar o Tkinter.
+
+        Returns:
+            Tupla (quantidade de páginas, imagem da primeira página ou None)
+        """
+        num_paginas = pdfinfo_from_path(caminho)['Pages']
+        primeira = _converter_pagina_pdf(caminho, 0, DPI_VISUALIZACAO) if num_paginas else None
+        return num_paginas, primeira
+
+    def _obter_pagina(self, tipo, pagina, dpi=DPI_VISUALIZACAO):
+        """
+        Retorna a imagem de uma página, rasterizando-a se ainda não estiver em cache.
+
+        As vizinhas são enviadas para rasterização em segundo plano, para que
+        ◀️/▶️ respondam sem espera. Nunca espera pelo Poppler: se a página
+        pedida não está pronta, devolve a mesma página em outra resolução já
+        rasterizada (mudança de zoom) ou nada, e o painel é redesenhado quando
+        a conversão terminar (ver _verificar_paginas).
+
+        Returns:
+            Tupla (imagem, DPI da imagem devolvida), ou (None, None) se a
+            página ainda não está disponível em nenhuma resolução
+        """
+        futuro = self._pagina_futura(tipo, pagina, dpi)
+        num_paginas = getattr(self, ATRIBUTOS_PAINEL[tipo]['num_paginas'])
+        for vizinha in (pagina + 1, pagina - 1):
+            if 0 <= vizinha < num_paginas:
+                self._pagina_futura(tipo, vizinha, dpi)
+        self._guardar_pagina((tipo, pagina, dpi), futuro)  # Página atual por último na fila de descarte
+        
+        if futuro.done() and futuro.exception() is None:
+            return futuro.result(), dpi
+        
+        self._aguardar_pagina((tipo, pagina, dpi), futuro)
+        prontas = [
+            (outro_dpi, outro) for (t, p, outro_dpi), outro in self._paginas.items()
+            if t == tipo and p == pagina and outro.done() and outro.exception() is None
+        ]
+        if prontas:
+            outro_dpi, outro = max(prontas, key=lambda item: item[0])
+            return outro.result(), outro_dpi
+        return None, None
+
+    def _aguardar_pagina(self, chave, futuro):
+        """Acompanha uma rasterização para redesenhar o painel quando ela terminar."""
+        self._paginas_aguardando[chave] = futuro
+        if not self._verificacao_agendada:
+            self._verificacao_agendada = True
+            self.janela.after(self.INTERVALO_VERIFICACAO_MS, self._verificar_paginas)
+
+    def _verificar_paginas(self):
+        """
+        Redesenha os painéis cujas páginas aguardadas ficaram prontas.
+
+        Executa na thread do Tk; continua agendada enquanto houver
+        rasterizações em andamento. Uma conversão que falhou é informada ao
+        usuário (e tentada de novo no próximo pedido da página).
+        """
+        self._verificacao_agendada = False
+        for chave, futuro in list(self._paginas_aguardando.items()):
+            # O messagebox abaixo processa eventos: a entrada pode já ter sido
+            # tratada (ou substituída) por uma verificação aninhada
+            if not futuro.done() or self._paginas_aguardando.get(chave) is not futuro:
+                continue
+            del self._paginas_aguardando[chave]
+            if futuro.cancelled():
+                continue
+            tipo, pagina, _ = chave
+            nomes = ATRIBUTOS_PAINEL[tipo]
+            atual = getattr(self, nomes['pagina']) == pagina
+            erro = futuro.exception()
+            if erro is not None:
+                if atual:
+                    getattr(self, nomes['label_pagina']).config(
+                        text=f"❌ Página {pagina + 1}/{getattr(self, nomes['num_paginas'])}"
+                    )
+                messagebox.showerror(
+                    "Erro", f"Erro ao carregar a página {pagina + 1}:\n{str(erro)}",
+                    parent=self.janela
+                )
+            elif atual:
+                self._agendar_exibicao(tipo)
+        if self._paginas_aguardando:
+            self._verificacao_agendada = True
+            self.janela.after(self.INTERVALO_VERIFICACAO_MS, self._verificar_paginas)
+
+    def _pagina_futura(self, tipo, pagina, dpi):
+        """
+        Retorna o Future da rasterização de uma página, submetendo-a se preciso.
+
+        Uma conversão que falhou é submetida de novo no próximo pedido.
+        """
+        chave = (tipo, pagina, dpi)
+        futuro = self._paginas.get(chave)
+        if futuro is not None and not (futuro.done() and futuro.exception() is not None):
+            self._paginas.move_to_end(chave)
+            return futuro
+        caminho = getattr(self, ATRIBUTOS_PAINEL[tipo]['path'])
+        futuro = self._executor_paginas.submit(_converter_pagina_pdf, caminho, pagina, dpi)
+        self._guardar_pagina(chave, futuro)
+        return futuro
+
+    def _guardar_pagina(self, chave, futuro):
+        """Guarda o Future de uma página, descartando as menos usadas além do limite."""
+        self._paginas[chave] = futuro
+        self._paginas.move_to_end(chave)
+        mesmo_dpi = [c for c in self._paginas if c[2] == chave[2]]
+        for antiga in mesmo_dpi[:-self.MAX_PAGINAS_POR_DPI]:
+            del self._paginas[antiga]
+            
     def _mudar_pagina(self, tipo, direcao):
         """Muda para página anterior ou próxima."""
-        images = getattr(self, f'{tipo}_images')
-        pagina_atual = getattr(self, f'{tipo}_pagina')
+        nomes = ATRIBUTOS_PAINEL[tipo]
+        num_paginas = getattr(self, nomes['num_paginas'])
+        pagina_atual = getattr(self, nomes['pagina'])
         
         nova_pagina = pagina_atual + direcao
         
         # Verificar limites
-        if 0 <= nova_pagina < len(images):
-            setattr(self, f'{tipo}_pagina', nova_pagina)
+        if 0 <= nova_pagina < num_paginas:
+            setattr(self, nomes['pagina'], nova_pagina)
             self._exibir_pagina(tipo)
             
     def _ajustar_zoom(self, tipo, delta):
         """Ajusta o nível de zoom."""
-        zoom_atual = getattr(self, f'{tipo}_zoom')
+        nomes = ATRIBUTOS_PAINEL[tipo]
+        zoom_atual = getattr(self, nomes['zoom'])
         novo_zoom = max(0.2, min(3.0, zoom_atual + delta))  # Limitar entre 20% e 300%
         
-        setattr(self, f'{tipo}_zoom', novo_zoom)
+        setattr(self, nomes['zoom'], novo_zoom)
+        self._descartar_renders(tipo)
         self._exibir_pagina(tipo)
         
     def _resetar_zoom(self, tipo):
         """Reseta o zoom para 100%."""
-        setattr(self, f'{tipo}_zoom', 1.0)
+        nomes = ATRIBUTOS_PAINEL[tipo]
+        setattr(self, nomes['zoom'], 1.0)
+        self._descartar_renders(tipo)
         self._exibir_pagina(tipo)
     
     def _girar_imagem(self, tipo):
         """Gira a imagem em 90 graus no sentido horário."""
-        rotacao_atual = getattr(self, f'{tipo}_rotacao')
+        nomes = ATRIBUTOS_PAINEL[tipo]
+        rotacao_atual = getattr(self, nomes['rotacao'])
         nova_rotacao = (rotacao_atual + 90) % 360
-        setattr(self, f'{tipo}_rotacao', nova_rotacao)
+        setattr(self, nomes['rotacao'], nova_rotacao)
         
         # Resetar posição ao girar
-        setattr(self, f'{tipo}_pos_x', 0)
-        setattr(self, f'{tipo}_pos_y', 0)
+        setattr(self, nomes['pos_x'], 0)
+        setattr(self, nomes['pos_y'], 0)
         
+        self._descartar_renders(tipo)
         self._exibir_pagina(tipo)
     
     def _resetar_rotacao(self, tipo):
-        """Reseta a rotação para 0 graus."""
-        setattr(self, f'{tipo}_rotacao', 0)
-        setattr(self, f'{tipo}_pos_x', 0)
-        setattr(self, f'{tipo}_pos_y', 0)
+        """Reseta a rotação para a orientação inicial do documento."""
+        nomes = ATRIBUTOS_PAINEL[tipo]
+        setattr(self, nomes['rotacao'], self.ROTACAO_INICIAL[tipo])
+        setattr(self, nomes['pos_x'], 0)
+        setattr(self, nomes['pos_y'], 0)
+        self._descartar_renders(tipo)
         self._exibir_pagina(tipo)
     
     def _iniciar_arrasto(self, tipo, event):
         """Inicia o arrasto da imagem."""
-        canvas = getattr(self, f'{tipo}_canvas')
+        nomes = ATRIBUTOS_PAINEL[tipo]
+        canvas = getattr(self, nomes['canvas'])
         canvas.config(cursor="fleur")  # Cursor de mover
-        setattr(self, f'{tipo}_drag_start', (event.x, event.y))
+        setattr(self, nomes['drag_start'], (event.x, event.y))
     
     def _arrastar(self, tipo, event):
         """Arrasta a imagem."""
-        drag_start = getattr(self, f'{tipo}_drag_start')
+        nomes = ATRIBUTOS_PAINEL[tipo]
+        drag_start = getattr(self, nomes['drag_start'])
         if drag_start is None:
             return
         
@@ -2472,26 +1935,29 @@ class JanelaComparacaoManual:
         dy = event.y - drag_start[1]
         
         # Atualizar posição
-        pos_x = getattr(self, f'{tipo}_pos_x')
-        pos_y = getattr(self, f'{tipo}_pos_y')
+        pos_x = getattr(self, nomes['pos_x']) + dx
+        pos_y = getattr(self, nomes['pos_y']) + dy
         
-        setattr(self, f'{tipo}_pos_x', pos_x + dx)
-        setattr(self, f'{tipo}_pos_y', pos_y + dy)
+        setattr(self, nomes['pos_x'], pos_x)
+        setattr(self, nomes['pos_y'], pos_y)
         
         # Atualizar ponto de início
-        setattr(self, f'{tipo}_drag_start', (event.x, event.y))
+        setattr(self, nomes['drag_start'], (event.x, event.y))
         
-        # Redesenhar
-        self._exibir_pagina(tipo)
+        # Só a posição mudou: mover o item (sem renderizar a página de novo)
+        # uma vez por ciclo ocioso, por mais eventos de movimento que cheguem
+        self._agendar_exibicao(tipo, completa=False)
     
     def _finalizar_arrasto(self, tipo):
         """Finaliza o arrasto da imagem."""
-        canvas = getattr(self, f'{tipo}_canvas')
+        nomes = ATRIBUTOS_PAINEL[tipo]
+        canvas = getattr(self, nomes['canvas'])
         canvas.config(cursor="")  # Cursor normal
-        setattr(self, f'{tipo}_drag_start', None)
+        setattr(self, nomes['drag_start'], None)
     
     def _zoom_scroll(self, tipo, event):
         """Ajusta o zoom com o scroll do mouse."""
+        nomes = ATRIBUTOS_PAINEL[tipo]
         # Determinar direção do scroll
         if event.num == 4 or event.delta > 0:
             # Scroll para cima = zoom in
@@ -2503,11 +1969,60 @@ class JanelaComparacaoManual:
             return
         
         # Ajustar zoom
-        zoom_atual = getattr(self, f'{tipo}_zoom')
+        zoom_atual = getattr(self, nomes['zoom'])
         novo_zoom = max(0.2, min(5.0, zoom_atual + delta))  # Limitar entre 20% e 500%
         
-        setattr(self, f'{tipo}_zoom', novo_zoom)
-        self._exibir_pagina(tipo)
+        setattr(self, nomes['zoom'], novo_zoom)
+        self._descartar_renders(tipo)
+        # Vários eventos da roda em sequência geram um único redesenho
+        self._agendar_exibicao(tipo)
+
+    def _agendar_exibicao(self, tipo, completa=True):
+        """
+        Agenda o redesenho de um painel para o próximo ciclo ocioso do Tk.
+
+        Eventos em sequência (movimento do mouse, roda) apenas atualizam o
+        estado; o redesenho acontece uma vez, com o estado mais recente.
+
+        Args:
+            tipo: Painel ('incra', 'memorial' ou 'projeto')
+            completa: True para exibir a página de novo, False se apenas a
+                posição da imagem mudou
+        """
+        pendente = self._exibicao_pendente.get(tipo)
+        if pendente is None:
+            self._exibicao_pendente[tipo] = completa
+            self.janela.after_idle(self._concluir_exibicao, tipo)
+        elif completa:
+            self._exibicao_pendente[tipo] = True
+
+    def _concluir_exibicao(self, tipo):
+        """Executa o redesenho agendado por _agendar_exibicao."""
+        completa = self._exibicao_pendente.pop(tipo, None)
+        if completa:
+            self._exibir_pagina(tipo)
+        elif completa is not None:
+            nomes = ATRIBUTOS_PAINEL[tipo]
+            img_id = getattr(self, nomes['img_id'])
+            if img_id is not None:
+                getattr(self, nomes['canvas']).coords(
+                    img_id, getattr(self, nomes['pos_x']), getattr(self, nomes['pos_y'])
+                )
+
+    def _descartar_renders(self, tipo):
+        """
+        Remove do cache as páginas renderizadas de um documento.
+
+        Chamado quando o zoom ou a rotação do documento mudam: as
+        renderizações anteriores não voltam a ser usadas e são grandes.
+        """
+        for chave in [chave for chave in self._renders_cache if chave[0] == tipo]:
+            self._remover_render(chave)
+
+    def _remover_render(self, chave):
+        """Remove uma página renderizada do cache, descontando seus pixels."""
+        photo = self._renders_cache.pop(chave)
+        self._pixels_renders -= photo.width() * photo.height()
 
 
 def main():